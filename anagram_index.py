@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Anagram signature index for misordered acrostic letters
+
+Maps the sorted-letter signature of every dictionary word (and of every
+word with one letter removed) to the words themselves. A letter bag from
+an acrostic then resolves to real words in a handful of dict lookups:
+exact anagrams, words with one letter more than the bag, and words with
+one letter fewer. This is the local "minimal correction" step that runs
+before any LLM call.
+"""
+
+import logging
+import sys
+import threading
+from collections import defaultdict
+
+from wordlist import load_words
+
+logger = logging.getLogger(__name__)
+
+
+def signature(word):
+    return "".join(sorted(word))
+
+
+class AnagramIndex:
+    def __init__(self, words):
+        self.rank = {}  # word -> position in the list (earlier = more common)
+        self.exact = defaultdict(list)  # signature -> words
+        self.minus_one = defaultdict(list)  # signature with one letter removed -> words
+        for word in words:
+            word = word.upper()
+            if word in self.rank:
+                continue
+            self.rank[word] = len(self.rank)
+            sig = signature(word)
+            self.exact[sig].append(word)
+            for i in range(len(sig)):
+                if i and sig[i] == sig[i - 1]:
+                    continue  # removing either copy of a repeated letter gives the same key
+                self.minus_one[sig[:i] + sig[i + 1:]].append(word)
+        self.max_len = max((len(w) for w in self.rank), default=0)
+
+    def lookup(self, letters, max_distance=1):
+        """Dictionary words for a letter bag as (word, distance), best first
+
+        Distance 0 is an exact anagram; distance 1 means one letter was
+        missing from or extra in the bag. Within a distance, words that keep
+        more letters in their original position rank first.
+        """
+        letters = "".join(c for c in letters.upper() if "A" <= c <= "Z")
+        if not letters or len(letters) > self.max_len + 1:
+            return []
+        sig = signature(letters)
+        found = {word: 0 for word in self.exact.get(sig, ())}
+
+        if max_distance >= 1:
+            # One letter missing from the bag: the word minus a letter matches it
+            for word in self.minus_one.get(sig, ()):
+                found.setdefault(word, 1)
+            # One letter too many in the bag: drop each distinct letter once
+            for i in range(len(sig)):
+                if i and sig[i] == sig[i - 1]:
+                    continue
+                for word in self.exact.get(sig[:i] + sig[i + 1:], ()):
+                    found.setdefault(word, 1)
+
+        def in_place(word):
+            return sum(1 for a, b in zip(word, letters) if a == b)
+
+        ranked = sorted(found.items(), key=lambda item: (item[1], -in_place(item[0]), self.rank[item[0]]))
+        return ranked
+
+
+# ─────────────────────────────
+# Lazily built shared index
+# ─────────────────────────────
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """Shared index over the configured word list, built on first use; None when unavailable"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                try:
+                    _index = AnagramIndex(load_words())
+                except Exception as e:
+                    logger.error(f"Failed to build anagram index: {e}")
+                    _index = AnagramIndex([])
+    return _index if _index.rank else None
+
+
+def main():
+    """Resolve letter bags given as arguments"""
+    index = get_index()
+    for letters in sys.argv[1:]:
+        matches = index.lookup(letters) if index else []
+        shown = ", ".join(f"{word}" + ("" if distance == 0 else f" (±{distance})") for word, distance in matches[:10])
+        print(f"{letters.upper():16} → {shown or 'no match'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Fleet-shared store of verified passwords
+
+Every password the game accepts is recorded per level and game version
+(a fingerprint of the deployed front-end bundle), with a confidence and
+the time it was last verified. Sessions submit a known answer before
+asking Merlin anything, so while the game's answers are stable a level
+costs one Submit. A known answer the game rejects is marked stale and
+the session falls back to the full pipeline, whose accepted password
+replaces it.
+
+The table lives in the shared data directory like the LLM cache and
+attempt history; point ANSWER_STORE_PATH at a shared volume to share it
+across machines.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+
+from storage import connect, data_path
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("level", "fingerprint", "password", "confidence", "verified_count",
+           "rejected_count", "first_verified", "last_verified", "stale")
+UNKNOWN_FINGERPRINT = "unknown"
+
+
+def fingerprint(assets):
+    """Short stable hash of the game's asset URLs (bundles are content-hashed per deploy)"""
+    assets = sorted(set(a for a in assets or () if a))
+    if not assets:
+        return UNKNOWN_FINGERPRINT
+    return hashlib.sha1("\n".join(assets).encode("utf-8")).hexdigest()[:12]
+
+
+def confidence(verified, rejected):
+    """Laplace-smoothed share of submissions the game accepted"""
+    return (verified + 1.0) / (verified + rejected + 2.0)
+
+
+class AnswerStore:
+    def __init__(self, path=None, min_confidence=0.5, max_age=None):
+        self.path = path or data_path("verified_answers.sqlite")
+        self.min_confidence = min_confidence
+        self.max_age = max_age  # seconds since last verification; None never expires
+        self._lock = threading.Lock()
+
+        self._conn = connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verified_answers ("
+            " level INTEGER NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " password TEXT NOT NULL,"
+            " confidence REAL NOT NULL,"
+            " verified_count INTEGER NOT NULL,"
+            " rejected_count INTEGER NOT NULL,"
+            " first_verified REAL NOT NULL,"
+            " last_verified REAL NOT NULL,"
+            " stale INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (level, fingerprint))"
+        )
+
+    @classmethod
+    def from_env(cls):
+        """Store configured by ANSWER_STORE_* settings, or None when ANSWER_STORE_DISABLE is set"""
+        if os.getenv("ANSWER_STORE_DISABLE", "").lower() in ("1", "true", "yes"):
+            return None
+        try:
+            max_age = float(os.getenv("ANSWER_STORE_MAX_AGE", 0))
+            return cls(
+                path=os.getenv("ANSWER_STORE_PATH") or None,
+                min_confidence=float(os.getenv("ANSWER_STORE_MIN_CONFIDENCE", 0.5)),
+                max_age=max_age or None,
+            )
+        except Exception as e:
+            logger.error(f"Failed to open answer store: {e}")
+            return None
+
+    # ─────────────────────────────
+    # Reads
+    # ─────────────────────────────
+    def get(self, level, fingerprint):
+        """The level's entry for this game version (stale or not), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM verified_answers WHERE level = ? AND fingerprint = ?",
+                (level, fingerprint),
+            ).fetchone()
+        return dict(zip(COLUMNS, row)) if row else None
+
+    def lookup(self, level, fingerprint):
+        """A known answer worth submitting first, or None"""
+        entry = self.get(level, fingerprint)
+        if entry is None or entry["stale"]:
+            return None
+        if entry["confidence"] < self.min_confidence:
+            return None
+        if self.max_age and time.time() - entry["last_verified"] > self.max_age:
+            return None
+        return entry
+
+    def entries(self, fingerprint=None):
+        sql = f"SELECT {', '.join(COLUMNS)} FROM verified_answers"
+        params = ()
+        if fingerprint:
+            sql += " WHERE fingerprint = ?"
+            params = (fingerprint,)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY fingerprint, level", params).fetchall()
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    # ─────────────────────────────
+    # Writes
+    # ─────────────────────────────
+    def record_verified(self, level, fingerprint, password):
+        """Record a password the game just accepted; a different password replaces the old entry"""
+        now = time.time()
+        with self._lock:
+            try:
+                # IMMEDIATE: read-modify-write against other fleet processes
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    "SELECT password, verified_count, rejected_count FROM verified_answers"
+                    " WHERE level = ? AND fingerprint = ?",
+                    (level, fingerprint),
+                ).fetchone()
+                if row and row[0] == password:
+                    verified, rejected = row[1] + 1, row[2]
+                    self._conn.execute(
+                        "UPDATE verified_answers SET verified_count = ?, confidence = ?, last_verified = ?, stale = 0"
+                        " WHERE level = ? AND fingerprint = ?",
+                        (verified, confidence(verified, rejected), now, level, fingerprint),
+                    )
+                else:
+                    self._conn.execute(
+                        f"INSERT OR REPLACE INTO verified_answers ({', '.join(COLUMNS)})"
+                        f" VALUES ({', '.join('?' * len(COLUMNS))})",
+                        (level, fingerprint, password, confidence(1, 0), 1, 0, now, now, 0),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception as e:
+                logger.error(f"Failed to record verified answer for Level {level}: {e}")
+                try:
+                    self._conn.execute("ROLLBACK")
+                except Exception:
+                    pass
+
+    def mark_stale(self, level, fingerprint, password):
+        """The game rejected the known answer: stop serving it until it is verified again"""
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "UPDATE verified_answers SET rejected_count = rejected_count + 1, stale = 1,"
+                    " confidence = (verified_count + 1.0) / (verified_count + rejected_count + 3.0)"
+                    " WHERE level = ? AND fingerprint = ? AND password = ?",
+                    (level, fingerprint, password),
+                )
+            except Exception as e:
+                logger.error(f"Failed to mark answer for Level {level} stale: {e}")
+
+    def forget(self, level=None, fingerprint=None):
+        """Delete entries (all of them when no filter is given)"""
+        clauses, params = [], ()
+        if level is not None:
+            clauses.append("level = ?")
+            params += (level,)
+        if fingerprint:
+            clauses.append("fingerprint = ?")
+            params += (fingerprint,)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        with self._lock:
+            return self._conn.execute(f"DELETE FROM verified_answers{where}", params).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    """List the verified answers, or `forget [level]` to drop them"""
+    store = AnswerStore(path=os.getenv("ANSWER_STORE_PATH") or None)
+    args = sys.argv[1:]
+    if args and args[0] == "forget":
+        level = int(args[1]) if len(args) > 1 else None
+        print(f"🗑️ Forgot {store.forget(level=level)} answer(s)")
+        store.close()
+        return
+    print("🔑 Verified answers")
+    print("=" * 60)
+    for entry in store.entries():
+        age = time.time() - entry["last_verified"]
+        state = "stale" if entry["stale"] else "live"
+        print(f"Level {entry['level']} [{entry['fingerprint']}] {entry['password']:12} "
+              f"conf={entry['confidence']:.2f} ({entry['verified_count']}✓/{entry['rejected_count']}✗) "
+              f"{state}, verified {age / 3600:.1f}h ago")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
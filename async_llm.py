@@ -0,0 +1,105 @@
+"""
+Async LLM clients for the asyncio extraction path
+
+One httpx connection pool is shared by the async OpenAI and Groq clients,
+and a semaphore per provider caps the number of requests in flight so a
+single process can overlap many extractions without opening a socket (or
+a thread) per call.
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+import metrics
+from rate_limiter import NORMAL, backoff_delay, is_rate_limited, retry_after
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLLMPool:
+    def __init__(self, max_connections=100, max_keepalive=20, concurrency=None):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.concurrency = concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", 32))
+        self._http = None
+        self._clients = {}
+        self._semaphores = {}
+        self.rate_limiter = None  # Optional shared RateLimiter; waits are asyncio sleeps
+        self.rate_limit_retries = int(os.getenv("RATE_LIMIT_RETRIES", "2"))
+
+    def _http_client(self):
+        if self._http is None:
+            import httpx
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                ),
+                timeout=httpx.Timeout(10.0, connect=5.0),
+            )
+        return self._http
+
+    def client(self, provider):
+        """Async client for a provider, created on first use"""
+        if provider not in self._clients:
+            api_key = os.getenv(f"{provider.upper()}_API_KEY")
+            base_url = os.getenv(f"{provider.upper()}_BASE_URL") or None
+            if provider == "openai":
+                import openai
+                self._clients[provider] = openai.AsyncOpenAI(
+                    api_key=api_key, base_url=base_url, http_client=self._http_client()
+                )
+            elif provider == "groq":
+                import groq
+                self._clients[provider] = groq.AsyncGroq(
+                    api_key=api_key, base_url=base_url, http_client=self._http_client()
+                )
+            else:
+                raise ValueError(f"Unknown LLM provider: {provider}")
+            logger.info(f"Initialized async {provider} client")
+        return self._clients[provider]
+
+    def semaphore(self, provider):
+        if provider not in self._semaphores:
+            limit = int(os.getenv(f"LLM_MAX_CONCURRENCY_{provider.upper()}", self.concurrency))
+            self._semaphores[provider] = asyncio.Semaphore(limit)
+        return self._semaphores[provider]
+
+    async def create(self, provider, priority=NORMAL, **kwargs):
+        """chat.completions.create on the provider, bounded by its semaphore and rate-limit bucket"""
+        attempt = 0
+        while True:
+            # A throttled provider waits on the loop, leaving the executor free for cache lookups
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire(provider, priority)
+            start = time.perf_counter()
+            try:
+                async with self.semaphore(provider):
+                    completion = await self.client(provider).chat.completions.create(**kwargs)
+            except Exception as e:
+                limited = is_rate_limited(e)
+                self._record(provider, "rate_limited" if limited else "error", start)
+                if not limited or attempt >= self.rate_limit_retries:
+                    raise
+                delay = backoff_delay(attempt, retry_after(e))
+                if self.rate_limiter:
+                    self.rate_limiter.penalize(provider, delay)
+                logger.warning(f"🚦 {provider} rate limited (429), retrying in {delay:.1f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            self._record(provider, "ok", start)
+            return completion
+
+    @staticmethod
+    def _record(provider, outcome, start):
+        metrics.LLM_CALLS.inc(provider, outcome)
+        metrics.LLM_SECONDS.observe(time.perf_counter() - start, provider)
+
+    async def aclose(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._clients.clear()
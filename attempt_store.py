@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Indexed history of every solve_level attempt
+
+Each Ask → extract → submit cycle is stored as one row: prompt, raw
+response, extraction strategy, candidates tried, outcome and per-phase
+timings. Writes go through a queue to a background thread that inserts in
+batches, so the agent's hot loop never waits on disk.
+"""
+
+import json
+import logging
+import math
+import os
+import queue
+import sys
+import threading
+import time
+
+from storage import connect, data_path
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+COLUMNS = ("run_id", "level", "attempt", "prompt", "response", "strategy",
+           "candidates", "outcome", "timings", "total_seconds", "created_at")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class AttemptStore:
+    def __init__(self, path=None, batch_size=50, flush_interval=1.0, max_queue=10000):
+        self.path = path or data_path("attempts.sqlite")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        self._conn = connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS attempts ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " run_id TEXT,"
+            " level INTEGER NOT NULL,"
+            " attempt INTEGER,"
+            " prompt TEXT,"
+            " response TEXT,"
+            " strategy TEXT,"
+            " candidates TEXT,"
+            " outcome TEXT,"
+            " timings TEXT,"
+            " total_seconds REAL,"
+            " created_at REAL NOT NULL)"
+        )
+        for column in ("level", "prompt", "created_at", "outcome"):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_attempts_{column} ON attempts ({column})")
+        self._lock = threading.Lock()
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._writer = threading.Thread(target=self._write_loop, name="attempt-store", daemon=True)
+        self._writer.start()
+
+    @classmethod
+    def from_env(cls):
+        """Store configured by ATTEMPT_STORE_PATH, or None when ATTEMPT_STORE_DISABLE is set"""
+        if os.getenv("ATTEMPT_STORE_DISABLE", "").lower() in ("1", "true", "yes"):
+            return None
+        try:
+            return cls(path=os.getenv("ATTEMPT_STORE_PATH") or None)
+        except Exception as e:
+            logger.error(f"Failed to open attempt store: {e}")
+            return None
+
+    # ─────────────────────────────
+    # Writes (non-blocking)
+    # ─────────────────────────────
+    def record(self, level, prompt=None, response=None, strategy=None, candidates=None,
+               outcome=None, timings=None, run_id=None, attempt=None, total_seconds=None):
+        """Queue one attempt for the background writer; never blocks"""
+        row = (
+            run_id, level, attempt, prompt, response, strategy,
+            json.dumps(candidates or []), outcome, json.dumps(timings or {}),
+            total_seconds, time.time(),
+        )
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+            logger.debug("Attempt store queue full, dropping record")
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            batch = [] if item is _STOP else [item]
+            stop = item is _STOP
+            deadline = time.time() + self.flush_interval
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.time()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._write_batch(batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    f"INSERT INTO attempts ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    batch,
+                )
+                self._conn.execute("COMMIT")
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} attempt records: {e}")
+                try:
+                    self._conn.execute("ROLLBACK")
+                except Exception:
+                    pass
+
+    def flush(self):
+        """Block until every queued record is on disk"""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    # ─────────────────────────────
+    # Queries
+    # ─────────────────────────────
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def hit_rates(self, by="prompt", level=None, since=None):
+        """Solve rate grouped by prompt, strategy or level"""
+        if by not in ("prompt", "strategy", "level"):
+            raise ValueError(f"Cannot group attempts by {by}")
+        where, params = self._filters(level, since)
+        rows = self._query(
+            f"SELECT {by}, COUNT(*), SUM(outcome = 'solved') FROM attempts{where} GROUP BY {by}"
+            " ORDER BY SUM(outcome = 'solved') * 1.0 / COUNT(*) DESC",
+            params,
+        )
+        return [{by: key, "attempts": n, "solved": solved, "hit_rate": solved / n} for key, n, solved in rows]
+
+    def latency_percentiles(self, phase="total", level=None, since=None, percentiles=(50, 90, 99)):
+        """Latency percentiles in seconds for one phase (or the whole attempt)"""
+        where, params = self._filters(level, since)
+        if phase == "total":
+            values = [r[0] for r in self._query(f"SELECT total_seconds FROM attempts{where}", params) if r[0] is not None]
+        else:
+            values = []
+            for (timings,) in self._query(f"SELECT timings FROM attempts{where}", params):
+                seconds = json.loads(timings or "{}").get(phase)
+                if seconds is not None:
+                    values.append(seconds)
+        stats = {f"p{p}": percentile(values, p) for p in percentiles}
+        stats["count"] = len(values)
+        return stats
+
+    def recent(self, level=None, limit=20):
+        where, params = self._filters(level, None)
+        rows = self._query(
+            f"SELECT {', '.join(COLUMNS)} FROM attempts{where} ORDER BY created_at DESC LIMIT ?",
+            params + (limit,),
+        )
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    @staticmethod
+    def _filters(level, since):
+        clauses, params = [], ()
+        if level is not None:
+            clauses.append("level = ?")
+            params += (level,)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params += (since,)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def main():
+    """Print hit rates and latency percentiles from the attempt history"""
+    level = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    store = AttemptStore(path=os.getenv("ATTEMPT_STORE_PATH") or None)
+    print("📊 Hit rate by prompt")
+    print("=" * 50)
+    for row in store.hit_rates("prompt", level=level):
+        print(f"{row['hit_rate']:6.1%} ({row['solved']}/{row['attempts']}) — {row['prompt']}")
+    print("\n⏱️ Latency percentiles (seconds)")
+    print("=" * 50)
+    for phase in ("total", "ask", "read", "extract", "llm", "submit"):
+        stats = store.latency_percentiles(phase, level=level)
+        if stats["count"]:
+            print(f"{phase:8} p50={stats['p50']:.2f} p90={stats['p90']:.2f} p99={stats['p99']:.2f} (n={stats['count']})")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Extraction accuracy and throughput benchmark
+
+Runs every registered extraction engine over the labeled Merlin responses
+in benchmarks/corpus.jsonl and reports top-1 accuracy, top-K recall, false
+positives on replies that hide nothing, extractions per second and peak
+memory. As in solve_level, replies the response classifier rejects are
+never extracted from. The word models behind ngram_ranked and
+local_corrections are trained on the word list minus every corpus answer,
+so their gains come from generalizing, not from having seen the answers.
+Results are compared against benchmarks/baseline.json; the script exits
+non-zero when an engine loses accuracy, gains false positives or
+throughput drops beyond the tolerance, so extractor changes can be
+checked before a live run.
+
+Usage:
+    python benchmarks/bench_extraction.py [--engine NAME] [--update-baseline]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from candidates import normalize
+from response_classifier import classify
+from response_region import locate
+
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus.jsonl")
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+
+# ─────────────────────────────
+# Engines: name -> factory returning extract(level, response) -> ranked candidates
+# ─────────────────────────────
+def _rule_based():
+    from llm_extractor import PasswordExtractor
+
+    extractor = PasswordExtractor(llm_client=None, cache=None)
+
+    def extract(level, response):
+        word = extractor.rule_based(level, response)
+        return [word] if word else []
+
+    return extract
+
+
+def _tagged():
+    from llm_extractor import tagged_candidates
+
+    def extract(level, response):
+        return [c["word"] for c in tagged_candidates(level, response)]
+
+    return extract
+
+
+def _ngram_ranked():
+    from candidates import CandidateManager
+    from llm_extractor import tagged_candidates
+    from ngram_model import get_model
+
+    model = get_model()
+
+    def extract(level, response):
+        manager = CandidateManager(level, scorer=model)
+        for candidate in tagged_candidates(level, response):
+            manager.add(candidate["word"], candidate["strategy"], candidate["confidence"])
+        return manager.pending()
+
+    return extract
+
+
+def _local_corrections():
+    from llm_extractor import PasswordExtractor
+
+    extractor = PasswordExtractor(llm_client=None, cache=None)
+
+    def extract(level, response):
+        # Submission order in solve_level: rule-based answer, then anagram corrections
+        word = extractor.rule_based(level, response)
+        first = [word] if word else []
+        return first + [w for w, _ in extractor.local_corrections(level, response) if w != word]
+
+    return extract
+
+
+ENGINES = {
+    "rule_based": _rule_based,
+    "tagged": _tagged,
+    "ngram_ranked": _ngram_ranked,
+    "local_corrections": _local_corrections,
+}
+
+
+# ─────────────────────────────
+# Corpus and scoring
+# ─────────────────────────────
+def load_corpus(path=CORPUS_PATH):
+    """Labeled entries; page dumps are cut to the reply region as get_merlin_response does"""
+    with open(path, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    for entry in corpus:
+        if entry["category"] == "page_fallback":
+            entry["response"] = locate(entry["response"]).text or entry["response"]
+    return corpus
+
+
+def hold_out_answers(corpus):
+    """Install word models trained without the corpus answers; returns (answers, words) counts"""
+    import anagram_index
+    import ngram_model
+    from wordlist import load_words
+
+    answers = {normalize(entry["password"]) for entry in corpus if entry["password"]}
+    words = [word for word in load_words() if word not in answers]
+    ngram_model._model = ngram_model.CharNgramModel.train(words)
+    anagram_index._index = anagram_index.AnagramIndex(words)
+    return len(answers), len(words)
+
+
+def score(extract, corpus, top_k=3, repeat=20):
+    """Accuracy and memory from one pass, throughput from the best of three rounds of `repeat` passes"""
+    results = {"correct": 0, "recall": 0, "labeled": 0, "false_positives": 0, "unlabeled": 0, "misses": []}
+    by_category = defaultdict(lambda: [0, 0])
+
+    for entry in corpus:
+        # solve_level re-asks replies the classifier says can't hold a password, without extracting
+        ranked = []
+        if classify(entry["response"]).has_answer:
+            ranked = [normalize(c) for c in extract(entry["level"], entry["response"])]
+            ranked = [c for c in ranked if c]
+        expected = normalize(entry["password"])
+        if expected is None:
+            # Replies that hide nothing: any candidate is a wasted submission
+            results["unlabeled"] += 1
+            results["false_positives"] += bool(ranked)
+            continue
+        results["labeled"] += 1
+        hit = bool(ranked) and ranked[0] == expected
+        results["correct"] += hit
+        results["recall"] += expected in ranked[:top_k]
+        by_category[entry["category"]][0] += hit
+        by_category[entry["category"]][1] += 1
+        if not hit:
+            results["misses"].append((entry["id"], expected, ranked[:top_k]))
+
+    # Best of a few timing rounds keeps the throughput gate stable on noisy machines
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for entry in corpus:
+                extract(entry["level"], entry["response"])
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    tracemalloc.start()
+    for entry in corpus:
+        extract(entry["level"], entry["response"])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    labeled = max(results["labeled"], 1)
+    return {
+        "accuracy": results["correct"] / labeled,
+        "top_k_recall": results["recall"] / labeled,
+        "false_positive_rate": results["false_positives"] / max(results["unlabeled"], 1),
+        "extractions_per_sec": repeat * len(corpus) / elapsed if elapsed else float("inf"),
+        "peak_kib": peak / 1024,
+        "by_category": {name: hits / total for name, (hits, total) in sorted(by_category.items())},
+        "misses": results["misses"],
+    }
+
+
+# ─────────────────────────────
+# Baseline comparison
+# ─────────────────────────────
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def regressions(name, report, baseline, throughput_tolerance):
+    """Reasons an engine fails against its baseline, empty when it passes"""
+    expected = baseline.get(name)
+    if not expected:
+        return []
+    problems = []
+    for metric in ("accuracy", "top_k_recall"):
+        if report[metric] + 1e-9 < expected[metric]:
+            problems.append(f"{metric} {report[metric]:.1%} < baseline {expected[metric]:.1%}")
+    if report["false_positive_rate"] > expected["false_positive_rate"] + 1e-9:
+        problems.append(f"false positives {report['false_positive_rate']:.1%} > "
+                        f"baseline {expected['false_positive_rate']:.1%}")
+    floor = expected["extractions_per_sec"] * (1 - throughput_tolerance)
+    if report["extractions_per_sec"] < floor:
+        problems.append(f"throughput {report['extractions_per_sec']:.0f}/s < {floor:.0f}/s")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark password extraction over a labeled corpus")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="Engine(s) to run (default: all)")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="Labeled JSONL corpus")
+    parser.add_argument("--top-k", type=int, default=3, help="K for top-K recall")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the corpus for throughput")
+    parser.add_argument("--throughput-tolerance", type=float, default=0.5,
+                        help="Allowed fractional throughput drop before failing")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--verbose", action="store_true", help="Show extractor logs and every miss")
+    args = parser.parse_args()
+
+    # Extractor logging would dominate the timings
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    corpus = load_corpus(args.corpus)
+    baseline = load_baseline()
+    failed = False
+
+    answers, words = hold_out_answers(corpus)
+    print(f"🎯 Extraction benchmark: {len(corpus)} responses")
+    print(f"   word models trained on {words} words, {answers} corpus answers held out")
+    print("=" * 60)
+    for name in args.engine or list(ENGINES):
+        report = score(ENGINES[name](), corpus, top_k=args.top_k, repeat=args.repeat)
+        print(f"\n🔧 {name}")
+        print(f"   accuracy        {report['accuracy']:.1%}")
+        print(f"   top-{args.top_k} recall    {report['top_k_recall']:.1%}")
+        print(f"   false positives {report['false_positive_rate']:.1%}")
+        print(f"   throughput      {report['extractions_per_sec']:.0f} extractions/s")
+        print(f"   peak memory     {report['peak_kib']:.1f} KiB")
+        for category, accuracy in report["by_category"].items():
+            print(f"   {category:16} {accuracy:.0%}")
+        if args.verbose:
+            for entry_id, expected, got in report["misses"]:
+                print(f"   ❌ {entry_id}: expected {expected}, got {got}")
+
+        problems = regressions(name, report, baseline, args.throughput_tolerance)
+        for problem in problems:
+            print(f"   ❌ Regression: {problem}")
+        failed |= bool(problems)
+
+        if args.update_baseline:
+            baseline[name] = {k: report[k] for k in ("accuracy", "top_k_recall", "false_positive_rate")}
+            baseline[name]["extractions_per_sec"] = round(report["extractions_per_sec"])
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n💾 Baseline written to {BASELINE_PATH}")
+
+    print("\n" + "=" * 60)
+    print("❌ Regressions found" if failed else "✅ No regressions")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Import-time and import-weight benchmark
+
+Imports each module in a fresh interpreter and reports wall time, the
+number of modules pulled in and peak RSS. The extraction core must not
+load Selenium, webdriver_manager, the LLM SDKs, HTTP clients, dotenv,
+NumPy or asyncio at import; any such module is a failure. Import time is
+compared against benchmarks/import_baseline.json with a generous
+tolerance, since it is noisy on shared machines.
+
+Usage:
+    python benchmarks/bench_imports.py [--module NAME] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "import_baseline.json")
+
+HEAVY = ("selenium", "webdriver_manager", "openai", "groq", "httpx", "dotenv", "numpy", "asyncio")
+
+# module -> heavy modules it may load at import
+TARGETS = {
+    "strategies": (),
+    "llm_extractor": (),
+    "candidates": (),
+    "anagram_index": (),
+    "response_classifier": (),
+    "llm_cache": (),
+    "llm_router": (),
+    "transcript": (),
+    "answer_store": (),
+    # The entry point loads .env at import; the browser stack waits for setup_driver
+    "working_agent": ("dotenv",),
+}
+
+PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "modules": len(sys.modules),
+    "heavy": sorted(name for name in {heavy!r} if name in sys.modules),
+    "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def measure(module, rounds=5):
+    """Best-of-N import of module in fresh interpreters"""
+    best = None
+    for _ in range(rounds):
+        code = PROBE.format(root=ROOT, module=module, heavy=HEAVY)
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env=dict(os.environ, HACKMERLIN_DATA_DIR=os.environ.get("HACKMERLIN_DATA_DIR", "/tmp/hackmerlin-bench")),
+        ).stdout
+        report = json.loads(output.strip().splitlines()[-1])
+        if best is None or report["seconds"] < best["seconds"]:
+            best = report
+    return best
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def regressions(module, report, baseline, tolerance, slack_ms):
+    """Reasons a module fails, empty when it passes"""
+    problems = []
+    unexpected = [name for name in report["heavy"] if name not in TARGETS[module]]
+    if unexpected:
+        problems.append(f"loads {', '.join(unexpected)} at import")
+    expected = baseline.get(module)
+    if expected:
+        ceiling = max(expected["seconds"] * (1 + tolerance), expected["seconds"] + slack_ms / 1000)
+        if report["seconds"] > ceiling:
+            problems.append(f"import {report['seconds'] * 1000:.0f} ms > {ceiling * 1000:.0f} ms")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark module import time and weight")
+    parser.add_argument("--module", action="append", choices=sorted(TARGETS), help="Module(s) to import (default: all)")
+    parser.add_argument("--rounds", type=int, default=5, help="Fresh interpreters per module (best is kept)")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="Allowed fractional import-time increase")
+    parser.add_argument("--slack-ms", type=float, default=25.0, help="Absolute increase always allowed")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    failed = False
+    print(f"📦 Import benchmark ({args.rounds} rounds, best kept)")
+    print("=" * 60)
+    for module in args.module or list(TARGETS):
+        report = measure(module, args.rounds)
+        heavy = f"  heavy: {', '.join(report['heavy'])}" if report["heavy"] else ""
+        print(f"{module:20} {report['seconds'] * 1000:7.1f} ms  {report['modules']:4} modules  "
+              f"{report['max_rss_kib'] / 1024:6.1f} MiB{heavy}")
+        problems = regressions(module, report, baseline, args.tolerance, args.slack_ms)
+        for problem in problems:
+            print(f"   ❌ Regression: {problem}")
+        failed |= bool(problems)
+        if args.update_baseline:
+            baseline[module] = {"seconds": round(report["seconds"], 4), "modules": report["modules"]}
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n💾 Baseline written to {BASELINE_PATH}")
+
+    print("\n" + "=" * 60)
+    print("❌ Regressions found" if failed else "✅ No regressions")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
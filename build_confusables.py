@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Generate confusables_table.py, the look-alike → ASCII translate table
+
+Sources, in increasing priority:
+  1. Unicode compatibility decompositions (fullwidth, mathematical and
+     circled letters via NFKC; accented letters via NFKD)
+  2. Hand-checked Cyrillic/Greek/other look-alikes Merlin mixes into answers
+  3. Unicode confusables.txt, when a path is given
+     (https://www.unicode.org/Public/security/latest/confusables.txt)
+
+Only mappings onto a single ASCII letter or digit are kept.
+
+Usage:
+    python build_confusables.py [confusables.txt]
+"""
+
+import os
+import sys
+import unicodedata
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "confusables_table.py")
+
+# Look-alikes with no compatibility decomposition
+SEED = {
+    # Cyrillic capitals
+    "А": "A", "В": "B", "Е": "E", "Ё": "E", "З": "3", "К": "K", "М": "M", "Н": "H", "О": "O",
+    "Р": "P", "С": "C", "Т": "T", "У": "Y", "Х": "X", "І": "I", "Ј": "J", "Ѕ": "S", "Ԛ": "Q",
+    "Ԝ": "W", "Ү": "Y", "Һ": "H", "Ӏ": "I",
+    # Cyrillic small
+    "а": "a", "в": "b", "е": "e", "ё": "e", "к": "k", "м": "m", "н": "h", "о": "o", "р": "p",
+    "с": "c", "т": "t", "у": "y", "х": "x", "і": "i", "ј": "j", "ѕ": "s", "ԛ": "q", "ԝ": "w",
+    "ү": "y", "һ": "h", "ӏ": "l", "ԁ": "d", "ɡ": "g",
+    # Greek capitals
+    "Α": "A", "Β": "B", "Ε": "E", "Ζ": "Z", "Η": "H", "Ι": "I", "Κ": "K", "Μ": "M", "Ν": "N",
+    "Ο": "O", "Ρ": "P", "Τ": "T", "Υ": "Y", "Χ": "X",
+    # Greek small
+    "α": "a", "ο": "o", "ρ": "p", "τ": "t", "υ": "u", "ν": "v", "ι": "i", "κ": "k", "χ": "x",
+    # Other scripts and symbols
+    "ı": "i", "ȷ": "j", "ℓ": "l", "Ɩ": "l", "ǀ": "l", "ø": "o", "Ø": "O",
+}
+
+
+def _ascii_alnum(text):
+    return len(text) == 1 and text.isascii() and text.isalnum()
+
+
+def _base_letter(char):
+    """ASCII base of an accented letter; ligatures like "ﬁ" or "Ǆ" decompose to several and have none"""
+    base = "".join(c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c))
+    return base if _ascii_alnum(base) else None
+
+
+def from_decompositions():
+    table = {}
+    for codepoint in range(0x80, 0x30000):
+        char = chr(codepoint)
+        if unicodedata.category(char)[0] not in ("L", "N", "S"):
+            continue
+        target = unicodedata.normalize("NFKC", char)
+        if not _ascii_alnum(target):
+            # Accented letters: keep the base letter
+            target = _base_letter(char)
+            if target is None or unicodedata.category(char)[0] != "L":
+                continue
+        table[char] = target
+    return table
+
+
+def from_confusables_file(path):
+    table = {}
+    with open(path, encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            source, target = line.split(";")[:2]
+            source = "".join(chr(int(cp, 16)) for cp in source.split())
+            target = "".join(chr(int(cp, 16)) for cp in target.split())
+            if len(source) == 1 and not source.isascii() and _ascii_alnum(target):
+                table[source] = target
+    return table
+
+
+def build(confusables_path=None):
+    table = from_decompositions()
+    table.update(SEED)
+    if confusables_path:
+        table.update(from_confusables_file(confusables_path))
+    return table
+
+
+def write(table, path=OUTPUT, source_note="compatibility decompositions and SEED"):
+    lines = [
+        '"""',
+        "Look-alike character → ASCII translate table",
+        "",
+        f"Generated by build_confusables.py from {source_note}; do not edit.",
+        '"""',
+        "",
+        "CONFUSABLES = {",
+    ]
+    for char in sorted(table):
+        name = unicodedata.name(char, "")
+        lines.append(f"    0x{ord(char):04X}: {table[char]!r},  # {name}")
+    lines.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main():
+    confusables_path = sys.argv[1] if len(sys.argv) > 1 else None
+    table = build(confusables_path)
+    note = "compatibility decompositions, SEED" + (" and confusables.txt" if confusables_path else "")
+    write(table, source_note=note)
+    print(f"🔡 Wrote {len(table)} mappings to {OUTPUT} (Unicode {unicodedata.unidata_version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Per-level password candidate management
+
+Candidates from every source (rule-based, local correction, LLM) are
+normalized and merged into one ranked set. Anything already rejected by
+the game in this session is dropped, and a candidate proposed by several
+sources ranks above one proposed by a single source. Every skipped
+duplicate or known-bad candidate is one Submit round trip saved.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Base confidence per source; agreement between sources adds up
+SOURCE_WEIGHTS = {
+    "known_answer": 2.0,
+    "rule_based": 1.0,
+    "llm_candidates": 0.9,
+    "llm_fallback": 0.8,
+    "local_correction": 0.6,
+}
+DEFAULT_WEIGHT = 0.5
+# Bonus for word-likeness (0..1 plausibility from the character n-gram model)
+PLAUSIBILITY_WEIGHT = 0.2
+
+
+def normalize(word):
+    """Canonical form used for comparing and submitting candidates"""
+    if not word:
+        return None
+    cleaned = re.sub(r"[^A-Z0-9]", "", str(word).upper())
+    return cleaned or None
+
+
+class CandidateManager:
+    def __init__(self, level, scorer=None):
+        self.level = level
+        self.scorer = scorer  # optional model with plausibility(words), e.g. CharNgramModel
+        self._candidates = {}  # word -> {"score", "sources", "order"}
+        self.rejected = set()
+        self.accepted = None
+        self.submitted = []
+        self.stats = {"added": 0, "duplicates": 0, "skipped_rejected": 0}
+        self._added = 0  # insertion counter: ties break by arrival, even after candidates are popped
+
+    def add(self, word, source, score=None):
+        """Add one candidate; returns False when it was a duplicate or already rejected"""
+        word = normalize(word)
+        if not word:
+            return False
+        if score is None:
+            score = SOURCE_WEIGHTS.get(source, DEFAULT_WEIGHT)
+
+        if word in self.rejected or word in self.submitted:
+            self.stats["skipped_rejected"] += 1
+            logger.info(f"🚫 Skipping '{word}' from {source}: already submitted this session")
+            return False
+
+        entry = self._candidates.get(word)
+        if entry:
+            self.stats["duplicates"] += 1
+            entry["score"] += score
+            if source not in entry["sources"]:
+                entry["sources"].append(source)
+            return False
+
+        self._candidates[word] = {"score": score, "sources": [source], "order": self._added}
+        self._added += 1
+        self.stats["added"] += 1
+        return True
+
+    def extend(self, words, source, score=None):
+        """Add a ranked list; earlier entries keep a slightly higher score"""
+        base = SOURCE_WEIGHTS.get(source, DEFAULT_WEIGHT) if score is None else score
+        added = 0
+        for rank, word in enumerate(words or []):
+            if self.add(word, source, base * (1.0 - 0.1 * rank)):
+                added += 1
+        return added
+
+    def pending(self):
+        """Candidates not yet submitted, best first"""
+        words = list(self._candidates)
+        bonus = self._plausibility(words)
+        ranked = sorted(zip(words, bonus), key=lambda item: (
+            -(self._candidates[item[0]]["score"] + PLAUSIBILITY_WEIGHT * item[1]),
+            self._candidates[item[0]]["order"],
+        ))
+        return [word for word, _ in ranked]
+
+    def _plausibility(self, words):
+        if not self.scorer or len(words) < 2:
+            return [0.0] * len(words)
+        try:
+            return [float(p) for p in self.scorer.plausibility(words)]
+        except Exception as e:
+            logger.debug(f"Plausibility scoring failed: {e}")
+            return [0.0] * len(words)
+
+    def next(self):
+        """Pop the best remaining candidate as (word, source), or None"""
+        pending = self.pending()
+        if not pending:
+            return None
+        word = pending[0]
+        entry = self._candidates.pop(word)
+        self.submitted.append(word)
+        return word, "+".join(entry["sources"])
+
+    def mark_rejected(self, word):
+        self.rejected.add(normalize(word))
+
+    def mark_accepted(self, word):
+        self.accepted = normalize(word)
+
+    @property
+    def submissions_saved(self):
+        """Submit round trips avoided by de-duplication and the negative cache"""
+        return self.stats["duplicates"] + self.stats["skipped_rejected"]
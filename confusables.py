@@ -0,0 +1,48 @@
+"""
+Look-alike normalization for Merlin's replies
+
+Maps Cyrillic/Greek homoglyphs, fullwidth and mathematical letters and
+accented letters to ASCII with one str.translate over the generated
+table (see build_confusables.py), then undoes "w0rd"-style digit
+substitutions inside words. Runs once per response before any regex or
+dictionary lookup and reports which characters it changed.
+"""
+
+import re
+
+from confusables_table import CONFUSABLES
+
+# Digit → letter substitutions used in obfuscated words
+LEET = {"0": "O", "1": "I", "3": "E", "4": "A", "5": "S", "7": "T", "8": "B"}
+_LEET_TABLE = str.maketrans(LEET)
+
+# A word with digits among its letters ("w0rd", "p4ssw0rd"); "4th", "10" and
+# tokens ending in digits ("MERLIN2024", "Level5") are left alone
+_MIXED_TOKEN_RE = re.compile(r"\b(?=\w*\d)(?=(?:\w*[A-Za-z]){3})[A-Za-z0-9]*[A-Za-z]\b")
+
+
+def _deleet(match):
+    token = match.group(0)
+    # Keep the case of the surrounding letters
+    replaced = token.translate(_LEET_TABLE)
+    return replaced if token.isupper() or not any(c.islower() for c in token) else replaced.lower()
+
+
+def normalize(text):
+    """Return (ascii_text, mapped) where mapped is {original: replacement} for every changed character"""
+    if not text:
+        return text, {}
+    mapped = {}
+    if not text.isascii():
+        clean = text.translate(CONFUSABLES)
+        if clean != text:
+            mapped = {c: CONFUSABLES[ord(c)] for c in set(text) if ord(c) in CONFUSABLES}
+        text = clean
+    if any(c.isdigit() for c in text):
+        deleeted = _MIXED_TOKEN_RE.sub(_deleet, text)
+        if deleeted != text:
+            for token in _MIXED_TOKEN_RE.findall(text):
+                for digit in set(token) & set(LEET):
+                    mapped[digit] = LEET[digit]
+            text = deleeted
+    return text, mapped
@@ -0,0 +1,1570 @@
+"""
+Look-alike character → ASCII translate table
+
+Generated by build_confusables.py from compatibility decompositions, SEED; do not edit.
+"""
+
+CONFUSABLES = {
+    0x00AA: 'a',  # FEMININE ORDINAL INDICATOR
+    0x00B2: '2',  # SUPERSCRIPT TWO
+    0x00B3: '3',  # SUPERSCRIPT THREE
+    0x00B9: '1',  # SUPERSCRIPT ONE
+    0x00BA: 'o',  # MASCULINE ORDINAL INDICATOR
+    0x00C0: 'A',  # LATIN CAPITAL LETTER A WITH GRAVE
+    0x00C1: 'A',  # LATIN CAPITAL LETTER A WITH ACUTE
+    0x00C2: 'A',  # LATIN CAPITAL LETTER A WITH CIRCUMFLEX
+    0x00C3: 'A',  # LATIN CAPITAL LETTER A WITH TILDE
+    0x00C4: 'A',  # LATIN CAPITAL LETTER A WITH DIAERESIS
+    0x00C5: 'A',  # LATIN CAPITAL LETTER A WITH RING ABOVE
+    0x00C7: 'C',  # LATIN CAPITAL LETTER C WITH CEDILLA
+    0x00C8: 'E',  # LATIN CAPITAL LETTER E WITH GRAVE
+    0x00C9: 'E',  # LATIN CAPITAL LETTER E WITH ACUTE
+    0x00CA: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX
+    0x00CB: 'E',  # LATIN CAPITAL LETTER E WITH DIAERESIS
+    0x00CC: 'I',  # LATIN CAPITAL LETTER I WITH GRAVE
+    0x00CD: 'I',  # LATIN CAPITAL LETTER I WITH ACUTE
+    0x00CE: 'I',  # LATIN CAPITAL LETTER I WITH CIRCUMFLEX
+    0x00CF: 'I',  # LATIN CAPITAL LETTER I WITH DIAERESIS
+    0x00D1: 'N',  # LATIN CAPITAL LETTER N WITH TILDE
+    0x00D2: 'O',  # LATIN CAPITAL LETTER O WITH GRAVE
+    0x00D3: 'O',  # LATIN CAPITAL LETTER O WITH ACUTE
+    0x00D4: 'O',  # LATIN CAPITAL LETTER O WITH CIRCUMFLEX
+    0x00D5: 'O',  # LATIN CAPITAL LETTER O WITH TILDE
+    0x00D6: 'O',  # LATIN CAPITAL LETTER O WITH DIAERESIS
+    0x00D8: 'O',  # LATIN CAPITAL LETTER O WITH STROKE
+    0x00D9: 'U',  # LATIN CAPITAL LETTER U WITH GRAVE
+    0x00DA: 'U',  # LATIN CAPITAL LETTER U WITH ACUTE
+    0x00DB: 'U',  # LATIN CAPITAL LETTER U WITH CIRCUMFLEX
+    0x00DC: 'U',  # LATIN CAPITAL LETTER U WITH DIAERESIS
+    0x00DD: 'Y',  # LATIN CAPITAL LETTER Y WITH ACUTE
+    0x00E0: 'a',  # LATIN SMALL LETTER A WITH GRAVE
+    0x00E1: 'a',  # LATIN SMALL LETTER A WITH ACUTE
+    0x00E2: 'a',  # LATIN SMALL LETTER A WITH CIRCUMFLEX
+    0x00E3: 'a',  # LATIN SMALL LETTER A WITH TILDE
+    0x00E4: 'a',  # LATIN SMALL LETTER A WITH DIAERESIS
+    0x00E5: 'a',  # LATIN SMALL LETTER A WITH RING ABOVE
+    0x00E7: 'c',  # LATIN SMALL LETTER C WITH CEDILLA
+    0x00E8: 'e',  # LATIN SMALL LETTER E WITH GRAVE
+    0x00E9: 'e',  # LATIN SMALL LETTER E WITH ACUTE
+    0x00EA: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX
+    0x00EB: 'e',  # LATIN SMALL LETTER E WITH DIAERESIS
+    0x00EC: 'i',  # LATIN SMALL LETTER I WITH GRAVE
+    0x00ED: 'i',  # LATIN SMALL LETTER I WITH ACUTE
+    0x00EE: 'i',  # LATIN SMALL LETTER I WITH CIRCUMFLEX
+    0x00EF: 'i',  # LATIN SMALL LETTER I WITH DIAERESIS
+    0x00F1: 'n',  # LATIN SMALL LETTER N WITH TILDE
+    0x00F2: 'o',  # LATIN SMALL LETTER O WITH GRAVE
+    0x00F3: 'o',  # LATIN SMALL LETTER O WITH ACUTE
+    0x00F4: 'o',  # LATIN SMALL LETTER O WITH CIRCUMFLEX
+    0x00F5: 'o',  # LATIN SMALL LETTER O WITH TILDE
+    0x00F6: 'o',  # LATIN SMALL LETTER O WITH DIAERESIS
+    0x00F8: 'o',  # LATIN SMALL LETTER O WITH STROKE
+    0x00F9: 'u',  # LATIN SMALL LETTER U WITH GRAVE
+    0x00FA: 'u',  # LATIN SMALL LETTER U WITH ACUTE
+    0x00FB: 'u',  # LATIN SMALL LETTER U WITH CIRCUMFLEX
+    0x00FC: 'u',  # LATIN SMALL LETTER U WITH DIAERESIS
+    0x00FD: 'y',  # LATIN SMALL LETTER Y WITH ACUTE
+    0x00FF: 'y',  # LATIN SMALL LETTER Y WITH DIAERESIS
+    0x0100: 'A',  # LATIN CAPITAL LETTER A WITH MACRON
+    0x0101: 'a',  # LATIN SMALL LETTER A WITH MACRON
+    0x0102: 'A',  # LATIN CAPITAL LETTER A WITH BREVE
+    0x0103: 'a',  # LATIN SMALL LETTER A WITH BREVE
+    0x0104: 'A',  # LATIN CAPITAL LETTER A WITH OGONEK
+    0x0105: 'a',  # LATIN SMALL LETTER A WITH OGONEK
+    0x0106: 'C',  # LATIN CAPITAL LETTER C WITH ACUTE
+    0x0107: 'c',  # LATIN SMALL LETTER C WITH ACUTE
+    0x0108: 'C',  # LATIN CAPITAL LETTER C WITH CIRCUMFLEX
+    0x0109: 'c',  # LATIN SMALL LETTER C WITH CIRCUMFLEX
+    0x010A: 'C',  # LATIN CAPITAL LETTER C WITH DOT ABOVE
+    0x010B: 'c',  # LATIN SMALL LETTER C WITH DOT ABOVE
+    0x010C: 'C',  # LATIN CAPITAL LETTER C WITH CARON
+    0x010D: 'c',  # LATIN SMALL LETTER C WITH CARON
+    0x010E: 'D',  # LATIN CAPITAL LETTER D WITH CARON
+    0x010F: 'd',  # LATIN SMALL LETTER D WITH CARON
+    0x0112: 'E',  # LATIN CAPITAL LETTER E WITH MACRON
+    0x0113: 'e',  # LATIN SMALL LETTER E WITH MACRON
+    0x0114: 'E',  # LATIN CAPITAL LETTER E WITH BREVE
+    0x0115: 'e',  # LATIN SMALL LETTER E WITH BREVE
+    0x0116: 'E',  # LATIN CAPITAL LETTER E WITH DOT ABOVE
+    0x0117: 'e',  # LATIN SMALL LETTER E WITH DOT ABOVE
+    0x0118: 'E',  # LATIN CAPITAL LETTER E WITH OGONEK
+    0x0119: 'e',  # LATIN SMALL LETTER E WITH OGONEK
+    0x011A: 'E',  # LATIN CAPITAL LETTER E WITH CARON
+    0x011B: 'e',  # LATIN SMALL LETTER E WITH CARON
+    0x011C: 'G',  # LATIN CAPITAL LETTER G WITH CIRCUMFLEX
+    0x011D: 'g',  # LATIN SMALL LETTER G WITH CIRCUMFLEX
+    0x011E: 'G',  # LATIN CAPITAL LETTER G WITH BREVE
+    0x011F: 'g',  # LATIN SMALL LETTER G WITH BREVE
+    0x0120: 'G',  # LATIN CAPITAL LETTER G WITH DOT ABOVE
+    0x0121: 'g',  # LATIN SMALL LETTER G WITH DOT ABOVE
+    0x0122: 'G',  # LATIN CAPITAL LETTER G WITH CEDILLA
+    0x0123: 'g',  # LATIN SMALL LETTER G WITH CEDILLA
+    0x0124: 'H',  # LATIN CAPITAL LETTER H WITH CIRCUMFLEX
+    0x0125: 'h',  # LATIN SMALL LETTER H WITH CIRCUMFLEX
+    0x0128: 'I',  # LATIN CAPITAL LETTER I WITH TILDE
+    0x0129: 'i',  # LATIN SMALL LETTER I WITH TILDE
+    0x012A: 'I',  # LATIN CAPITAL LETTER I WITH MACRON
+    0x012B: 'i',  # LATIN SMALL LETTER I WITH MACRON
+    0x012C: 'I',  # LATIN CAPITAL LETTER I WITH BREVE
+    0x012D: 'i',  # LATIN SMALL LETTER I WITH BREVE
+    0x012E: 'I',  # LATIN CAPITAL LETTER I WITH OGONEK
+    0x012F: 'i',  # LATIN SMALL LETTER I WITH OGONEK
+    0x0130: 'I',  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    0x0131: 'i',  # LATIN SMALL LETTER DOTLESS I
+    0x0134: 'J',  # LATIN CAPITAL LETTER J WITH CIRCUMFLEX
+    0x0135: 'j',  # LATIN SMALL LETTER J WITH CIRCUMFLEX
+    0x0136: 'K',  # LATIN CAPITAL LETTER K WITH CEDILLA
+    0x0137: 'k',  # LATIN SMALL LETTER K WITH CEDILLA
+    0x0139: 'L',  # LATIN CAPITAL LETTER L WITH ACUTE
+    0x013A: 'l',  # LATIN SMALL LETTER L WITH ACUTE
+    0x013B: 'L',  # LATIN CAPITAL LETTER L WITH CEDILLA
+    0x013C: 'l',  # LATIN SMALL LETTER L WITH CEDILLA
+    0x013D: 'L',  # LATIN CAPITAL LETTER L WITH CARON
+    0x013E: 'l',  # LATIN SMALL LETTER L WITH CARON
+    0x0143: 'N',  # LATIN CAPITAL LETTER N WITH ACUTE
+    0x0144: 'n',  # LATIN SMALL LETTER N WITH ACUTE
+    0x0145: 'N',  # LATIN CAPITAL LETTER N WITH CEDILLA
+    0x0146: 'n',  # LATIN SMALL LETTER N WITH CEDILLA
+    0x0147: 'N',  # LATIN CAPITAL LETTER N WITH CARON
+    0x0148: 'n',  # LATIN SMALL LETTER N WITH CARON
+    0x014C: 'O',  # LATIN CAPITAL LETTER O WITH MACRON
+    0x014D: 'o',  # LATIN SMALL LETTER O WITH MACRON
+    0x014E: 'O',  # LATIN CAPITAL LETTER O WITH BREVE
+    0x014F: 'o',  # LATIN SMALL LETTER O WITH BREVE
+    0x0150: 'O',  # LATIN CAPITAL LETTER O WITH DOUBLE ACUTE
+    0x0151: 'o',  # LATIN SMALL LETTER O WITH DOUBLE ACUTE
+    0x0154: 'R',  # LATIN CAPITAL LETTER R WITH ACUTE
+    0x0155: 'r',  # LATIN SMALL LETTER R WITH ACUTE
+    0x0156: 'R',  # LATIN CAPITAL LETTER R WITH CEDILLA
+    0x0157: 'r',  # LATIN SMALL LETTER R WITH CEDILLA
+    0x0158: 'R',  # LATIN CAPITAL LETTER R WITH CARON
+    0x0159: 'r',  # LATIN SMALL LETTER R WITH CARON
+    0x015A: 'S',  # LATIN CAPITAL LETTER S WITH ACUTE
+    0x015B: 's',  # LATIN SMALL LETTER S WITH ACUTE
+    0x015C: 'S',  # LATIN CAPITAL LETTER S WITH CIRCUMFLEX
+    0x015D: 's',  # LATIN SMALL LETTER S WITH CIRCUMFLEX
+    0x015E: 'S',  # LATIN CAPITAL LETTER S WITH CEDILLA
+    0x015F: 's',  # LATIN SMALL LETTER S WITH CEDILLA
+    0x0160: 'S',  # LATIN CAPITAL LETTER S WITH CARON
+    0x0161: 's',  # LATIN SMALL LETTER S WITH CARON
+    0x0162: 'T',  # LATIN CAPITAL LETTER T WITH CEDILLA
+    0x0163: 't',  # LATIN SMALL LETTER T WITH CEDILLA
+    0x0164: 'T',  # LATIN CAPITAL LETTER T WITH CARON
+    0x0165: 't',  # LATIN SMALL LETTER T WITH CARON
+    0x0168: 'U',  # LATIN CAPITAL LETTER U WITH TILDE
+    0x0169: 'u',  # LATIN SMALL LETTER U WITH TILDE
+    0x016A: 'U',  # LATIN CAPITAL LETTER U WITH MACRON
+    0x016B: 'u',  # LATIN SMALL LETTER U WITH MACRON
+    0x016C: 'U',  # LATIN CAPITAL LETTER U WITH BREVE
+    0x016D: 'u',  # LATIN SMALL LETTER U WITH BREVE
+    0x016E: 'U',  # LATIN CAPITAL LETTER U WITH RING ABOVE
+    0x016F: 'u',  # LATIN SMALL LETTER U WITH RING ABOVE
+    0x0170: 'U',  # LATIN CAPITAL LETTER U WITH DOUBLE ACUTE
+    0x0171: 'u',  # LATIN SMALL LETTER U WITH DOUBLE ACUTE
+    0x0172: 'U',  # LATIN CAPITAL LETTER U WITH OGONEK
+    0x0173: 'u',  # LATIN SMALL LETTER U WITH OGONEK
+    0x0174: 'W',  # LATIN CAPITAL LETTER W WITH CIRCUMFLEX
+    0x0175: 'w',  # LATIN SMALL LETTER W WITH CIRCUMFLEX
+    0x0176: 'Y',  # LATIN CAPITAL LETTER Y WITH CIRCUMFLEX
+    0x0177: 'y',  # LATIN SMALL LETTER Y WITH CIRCUMFLEX
+    0x0178: 'Y',  # LATIN CAPITAL LETTER Y WITH DIAERESIS
+    0x0179: 'Z',  # LATIN CAPITAL LETTER Z WITH ACUTE
+    0x017A: 'z',  # LATIN SMALL LETTER Z WITH ACUTE
+    0x017B: 'Z',  # LATIN CAPITAL LETTER Z WITH DOT ABOVE
+    0x017C: 'z',  # LATIN SMALL LETTER Z WITH DOT ABOVE
+    0x017D: 'Z',  # LATIN CAPITAL LETTER Z WITH CARON
+    0x017E: 'z',  # LATIN SMALL LETTER Z WITH CARON
+    0x017F: 's',  # LATIN SMALL LETTER LONG S
+    0x0196: 'l',  # LATIN CAPITAL LETTER IOTA
+    0x01A0: 'O',  # LATIN CAPITAL LETTER O WITH HORN
+    0x01A1: 'o',  # LATIN SMALL LETTER O WITH HORN
+    0x01AF: 'U',  # LATIN CAPITAL LETTER U WITH HORN
+    0x01B0: 'u',  # LATIN SMALL LETTER U WITH HORN
+    0x01C0: 'l',  # LATIN LETTER DENTAL CLICK
+    0x01CD: 'A',  # LATIN CAPITAL LETTER A WITH CARON
+    0x01CE: 'a',  # LATIN SMALL LETTER A WITH CARON
+    0x01CF: 'I',  # LATIN CAPITAL LETTER I WITH CARON
+    0x01D0: 'i',  # LATIN SMALL LETTER I WITH CARON
+    0x01D1: 'O',  # LATIN CAPITAL LETTER O WITH CARON
+    0x01D2: 'o',  # LATIN SMALL LETTER O WITH CARON
+    0x01D3: 'U',  # LATIN CAPITAL LETTER U WITH CARON
+    0x01D4: 'u',  # LATIN SMALL LETTER U WITH CARON
+    0x01D5: 'U',  # LATIN CAPITAL LETTER U WITH DIAERESIS AND MACRON
+    0x01D6: 'u',  # LATIN SMALL LETTER U WITH DIAERESIS AND MACRON
+    0x01D7: 'U',  # LATIN CAPITAL LETTER U WITH DIAERESIS AND ACUTE
+    0x01D8: 'u',  # LATIN SMALL LETTER U WITH DIAERESIS AND ACUTE
+    0x01D9: 'U',  # LATIN CAPITAL LETTER U WITH DIAERESIS AND CARON
+    0x01DA: 'u',  # LATIN SMALL LETTER U WITH DIAERESIS AND CARON
+    0x01DB: 'U',  # LATIN CAPITAL LETTER U WITH DIAERESIS AND GRAVE
+    0x01DC: 'u',  # LATIN SMALL LETTER U WITH DIAERESIS AND GRAVE
+    0x01DE: 'A',  # LATIN CAPITAL LETTER A WITH DIAERESIS AND MACRON
+    0x01DF: 'a',  # LATIN SMALL LETTER A WITH DIAERESIS AND MACRON
+    0x01E0: 'A',  # LATIN CAPITAL LETTER A WITH DOT ABOVE AND MACRON
+    0x01E1: 'a',  # LATIN SMALL LETTER A WITH DOT ABOVE AND MACRON
+    0x01E6: 'G',  # LATIN CAPITAL LETTER G WITH CARON
+    0x01E7: 'g',  # LATIN SMALL LETTER G WITH CARON
+    0x01E8: 'K',  # LATIN CAPITAL LETTER K WITH CARON
+    0x01E9: 'k',  # LATIN SMALL LETTER K WITH CARON
+    0x01EA: 'O',  # LATIN CAPITAL LETTER O WITH OGONEK
+    0x01EB: 'o',  # LATIN SMALL LETTER O WITH OGONEK
+    0x01EC: 'O',  # LATIN CAPITAL LETTER O WITH OGONEK AND MACRON
+    0x01ED: 'o',  # LATIN SMALL LETTER O WITH OGONEK AND MACRON
+    0x01F0: 'j',  # LATIN SMALL LETTER J WITH CARON
+    0x01F4: 'G',  # LATIN CAPITAL LETTER G WITH ACUTE
+    0x01F5: 'g',  # LATIN SMALL LETTER G WITH ACUTE
+    0x01F8: 'N',  # LATIN CAPITAL LETTER N WITH GRAVE
+    0x01F9: 'n',  # LATIN SMALL LETTER N WITH GRAVE
+    0x01FA: 'A',  # LATIN CAPITAL LETTER A WITH RING ABOVE AND ACUTE
+    0x01FB: 'a',  # LATIN SMALL LETTER A WITH RING ABOVE AND ACUTE
+    0x0200: 'A',  # LATIN CAPITAL LETTER A WITH DOUBLE GRAVE
+    0x0201: 'a',  # LATIN SMALL LETTER A WITH DOUBLE GRAVE
+    0x0202: 'A',  # LATIN CAPITAL LETTER A WITH INVERTED BREVE
+    0x0203: 'a',  # LATIN SMALL LETTER A WITH INVERTED BREVE
+    0x0204: 'E',  # LATIN CAPITAL LETTER E WITH DOUBLE GRAVE
+    0x0205: 'e',  # LATIN SMALL LETTER E WITH DOUBLE GRAVE
+    0x0206: 'E',  # LATIN CAPITAL LETTER E WITH INVERTED BREVE
+    0x0207: 'e',  # LATIN SMALL LETTER E WITH INVERTED BREVE
+    0x0208: 'I',  # LATIN CAPITAL LETTER I WITH DOUBLE GRAVE
+    0x0209: 'i',  # LATIN SMALL LETTER I WITH DOUBLE GRAVE
+    0x020A: 'I',  # LATIN CAPITAL LETTER I WITH INVERTED BREVE
+    0x020B: 'i',  # LATIN SMALL LETTER I WITH INVERTED BREVE
+    0x020C: 'O',  # LATIN CAPITAL LETTER O WITH DOUBLE GRAVE
+    0x020D: 'o',  # LATIN SMALL LETTER O WITH DOUBLE GRAVE
+    0x020E: 'O',  # LATIN CAPITAL LETTER O WITH INVERTED BREVE
+    0x020F: 'o',  # LATIN SMALL LETTER O WITH INVERTED BREVE
+    0x0210: 'R',  # LATIN CAPITAL LETTER R WITH DOUBLE GRAVE
+    0x0211: 'r',  # LATIN SMALL LETTER R WITH DOUBLE GRAVE
+    0x0212: 'R',  # LATIN CAPITAL LETTER R WITH INVERTED BREVE
+    0x0213: 'r',  # LATIN SMALL LETTER R WITH INVERTED BREVE
+    0x0214: 'U',  # LATIN CAPITAL LETTER U WITH DOUBLE GRAVE
+    0x0215: 'u',  # LATIN SMALL LETTER U WITH DOUBLE GRAVE
+    0x0216: 'U',  # LATIN CAPITAL LETTER U WITH INVERTED BREVE
+    0x0217: 'u',  # LATIN SMALL LETTER U WITH INVERTED BREVE
+    0x0218: 'S',  # LATIN CAPITAL LETTER S WITH COMMA BELOW
+    0x0219: 's',  # LATIN SMALL LETTER S WITH COMMA BELOW
+    0x021A: 'T',  # LATIN CAPITAL LETTER T WITH COMMA BELOW
+    0x021B: 't',  # LATIN SMALL LETTER T WITH COMMA BELOW
+    0x021E: 'H',  # LATIN CAPITAL LETTER H WITH CARON
+    0x021F: 'h',  # LATIN SMALL LETTER H WITH CARON
+    0x0226: 'A',  # LATIN CAPITAL LETTER A WITH DOT ABOVE
+    0x0227: 'a',  # LATIN SMALL LETTER A WITH DOT ABOVE
+    0x0228: 'E',  # LATIN CAPITAL LETTER E WITH CEDILLA
+    0x0229: 'e',  # LATIN SMALL LETTER E WITH CEDILLA
+    0x022A: 'O',  # LATIN CAPITAL LETTER O WITH DIAERESIS AND MACRON
+    0x022B: 'o',  # LATIN SMALL LETTER O WITH DIAERESIS AND MACRON
+    0x022C: 'O',  # LATIN CAPITAL LETTER O WITH TILDE AND MACRON
+    0x022D: 'o',  # LATIN SMALL LETTER O WITH TILDE AND MACRON
+    0x022E: 'O',  # LATIN CAPITAL LETTER O WITH DOT ABOVE
+    0x022F: 'o',  # LATIN SMALL LETTER O WITH DOT ABOVE
+    0x0230: 'O',  # LATIN CAPITAL LETTER O WITH DOT ABOVE AND MACRON
+    0x0231: 'o',  # LATIN SMALL LETTER O WITH DOT ABOVE AND MACRON
+    0x0232: 'Y',  # LATIN CAPITAL LETTER Y WITH MACRON
+    0x0233: 'y',  # LATIN SMALL LETTER Y WITH MACRON
+    0x0237: 'j',  # LATIN SMALL LETTER DOTLESS J
+    0x0261: 'g',  # LATIN SMALL LETTER SCRIPT G
+    0x02B0: 'h',  # MODIFIER LETTER SMALL H
+    0x02B2: 'j',  # MODIFIER LETTER SMALL J
+    0x02B3: 'r',  # MODIFIER LETTER SMALL R
+    0x02B7: 'w',  # MODIFIER LETTER SMALL W
+    0x02B8: 'y',  # MODIFIER LETTER SMALL Y
+    0x02E1: 'l',  # MODIFIER LETTER SMALL L
+    0x02E2: 's',  # MODIFIER LETTER SMALL S
+    0x02E3: 'x',  # MODIFIER LETTER SMALL X
+    0x0391: 'A',  # GREEK CAPITAL LETTER ALPHA
+    0x0392: 'B',  # GREEK CAPITAL LETTER BETA
+    0x0395: 'E',  # GREEK CAPITAL LETTER EPSILON
+    0x0396: 'Z',  # GREEK CAPITAL LETTER ZETA
+    0x0397: 'H',  # GREEK CAPITAL LETTER ETA
+    0x0399: 'I',  # GREEK CAPITAL LETTER IOTA
+    0x039A: 'K',  # GREEK CAPITAL LETTER KAPPA
+    0x039C: 'M',  # GREEK CAPITAL LETTER MU
+    0x039D: 'N',  # GREEK CAPITAL LETTER NU
+    0x039F: 'O',  # GREEK CAPITAL LETTER OMICRON
+    0x03A1: 'P',  # GREEK CAPITAL LETTER RHO
+    0x03A4: 'T',  # GREEK CAPITAL LETTER TAU
+    0x03A5: 'Y',  # GREEK CAPITAL LETTER UPSILON
+    0x03A7: 'X',  # GREEK CAPITAL LETTER CHI
+    0x03B1: 'a',  # GREEK SMALL LETTER ALPHA
+    0x03B9: 'i',  # GREEK SMALL LETTER IOTA
+    0x03BA: 'k',  # GREEK SMALL LETTER KAPPA
+    0x03BD: 'v',  # GREEK SMALL LETTER NU
+    0x03BF: 'o',  # GREEK SMALL LETTER OMICRON
+    0x03C1: 'p',  # GREEK SMALL LETTER RHO
+    0x03C4: 't',  # GREEK SMALL LETTER TAU
+    0x03C5: 'u',  # GREEK SMALL LETTER UPSILON
+    0x03C7: 'x',  # GREEK SMALL LETTER CHI
+    0x0401: 'E',  # CYRILLIC CAPITAL LETTER IO
+    0x0405: 'S',  # CYRILLIC CAPITAL LETTER DZE
+    0x0406: 'I',  # CYRILLIC CAPITAL LETTER BYELORUSSIAN-UKRAINIAN I
+    0x0408: 'J',  # CYRILLIC CAPITAL LETTER JE
+    0x0410: 'A',  # CYRILLIC CAPITAL LETTER A
+    0x0412: 'B',  # CYRILLIC CAPITAL LETTER VE
+    0x0415: 'E',  # CYRILLIC CAPITAL LETTER IE
+    0x0417: '3',  # CYRILLIC CAPITAL LETTER ZE
+    0x041A: 'K',  # CYRILLIC CAPITAL LETTER KA
+    0x041C: 'M',  # CYRILLIC CAPITAL LETTER EM
+    0x041D: 'H',  # CYRILLIC CAPITAL LETTER EN
+    0x041E: 'O',  # CYRILLIC CAPITAL LETTER O
+    0x0420: 'P',  # CYRILLIC CAPITAL LETTER ER
+    0x0421: 'C',  # CYRILLIC CAPITAL LETTER ES
+    0x0422: 'T',  # CYRILLIC CAPITAL LETTER TE
+    0x0423: 'Y',  # CYRILLIC CAPITAL LETTER U
+    0x0425: 'X',  # CYRILLIC CAPITAL LETTER HA
+    0x0430: 'a',  # CYRILLIC SMALL LETTER A
+    0x0432: 'b',  # CYRILLIC SMALL LETTER VE
+    0x0435: 'e',  # CYRILLIC SMALL LETTER IE
+    0x043A: 'k',  # CYRILLIC SMALL LETTER KA
+    0x043C: 'm',  # CYRILLIC SMALL LETTER EM
+    0x043D: 'h',  # CYRILLIC SMALL LETTER EN
+    0x043E: 'o',  # CYRILLIC SMALL LETTER O
+    0x0440: 'p',  # CYRILLIC SMALL LETTER ER
+    0x0441: 'c',  # CYRILLIC SMALL LETTER ES
+    0x0442: 't',  # CYRILLIC SMALL LETTER TE
+    0x0443: 'y',  # CYRILLIC SMALL LETTER U
+    0x0445: 'x',  # CYRILLIC SMALL LETTER HA
+    0x0451: 'e',  # CYRILLIC SMALL LETTER IO
+    0x0455: 's',  # CYRILLIC SMALL LETTER DZE
+    0x0456: 'i',  # CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I
+    0x0458: 'j',  # CYRILLIC SMALL LETTER JE
+    0x04AE: 'Y',  # CYRILLIC CAPITAL LETTER STRAIGHT U
+    0x04AF: 'y',  # CYRILLIC SMALL LETTER STRAIGHT U
+    0x04BA: 'H',  # CYRILLIC CAPITAL LETTER SHHA
+    0x04BB: 'h',  # CYRILLIC SMALL LETTER SHHA
+    0x04C0: 'I',  # CYRILLIC LETTER PALOCHKA
+    0x04CF: 'l',  # CYRILLIC SMALL LETTER PALOCHKA
+    0x0501: 'd',  # CYRILLIC SMALL LETTER KOMI DE
+    0x051A: 'Q',  # CYRILLIC CAPITAL LETTER QA
+    0x051B: 'q',  # CYRILLIC SMALL LETTER QA
+    0x051C: 'W',  # CYRILLIC CAPITAL LETTER WE
+    0x051D: 'w',  # CYRILLIC SMALL LETTER WE
+    0x1D2C: 'A',  # MODIFIER LETTER CAPITAL A
+    0x1D2E: 'B',  # MODIFIER LETTER CAPITAL B
+    0x1D30: 'D',  # MODIFIER LETTER CAPITAL D
+    0x1D31: 'E',  # MODIFIER LETTER CAPITAL E
+    0x1D33: 'G',  # MODIFIER LETTER CAPITAL G
+    0x1D34: 'H',  # MODIFIER LETTER CAPITAL H
+    0x1D35: 'I',  # MODIFIER LETTER CAPITAL I
+    0x1D36: 'J',  # MODIFIER LETTER CAPITAL J
+    0x1D37: 'K',  # MODIFIER LETTER CAPITAL K
+    0x1D38: 'L',  # MODIFIER LETTER CAPITAL L
+    0x1D39: 'M',  # MODIFIER LETTER CAPITAL M
+    0x1D3A: 'N',  # MODIFIER LETTER CAPITAL N
+    0x1D3C: 'O',  # MODIFIER LETTER CAPITAL O
+    0x1D3E: 'P',  # MODIFIER LETTER CAPITAL P
+    0x1D3F: 'R',  # MODIFIER LETTER CAPITAL R
+    0x1D40: 'T',  # MODIFIER LETTER CAPITAL T
+    0x1D41: 'U',  # MODIFIER LETTER CAPITAL U
+    0x1D42: 'W',  # MODIFIER LETTER CAPITAL W
+    0x1D43: 'a',  # MODIFIER LETTER SMALL A
+    0x1D47: 'b',  # MODIFIER LETTER SMALL B
+    0x1D48: 'd',  # MODIFIER LETTER SMALL D
+    0x1D49: 'e',  # MODIFIER LETTER SMALL E
+    0x1D4D: 'g',  # MODIFIER LETTER SMALL G
+    0x1D4F: 'k',  # MODIFIER LETTER SMALL K
+    0x1D50: 'm',  # MODIFIER LETTER SMALL M
+    0x1D52: 'o',  # MODIFIER LETTER SMALL O
+    0x1D56: 'p',  # MODIFIER LETTER SMALL P
+    0x1D57: 't',  # MODIFIER LETTER SMALL T
+    0x1D58: 'u',  # MODIFIER LETTER SMALL U
+    0x1D5B: 'v',  # MODIFIER LETTER SMALL V
+    0x1D62: 'i',  # LATIN SUBSCRIPT SMALL LETTER I
+    0x1D63: 'r',  # LATIN SUBSCRIPT SMALL LETTER R
+    0x1D64: 'u',  # LATIN SUBSCRIPT SMALL LETTER U
+    0x1D65: 'v',  # LATIN SUBSCRIPT SMALL LETTER V
+    0x1D9C: 'c',  # MODIFIER LETTER SMALL C
+    0x1DA0: 'f',  # MODIFIER LETTER SMALL F
+    0x1DBB: 'z',  # MODIFIER LETTER SMALL Z
+    0x1E00: 'A',  # LATIN CAPITAL LETTER A WITH RING BELOW
+    0x1E01: 'a',  # LATIN SMALL LETTER A WITH RING BELOW
+    0x1E02: 'B',  # LATIN CAPITAL LETTER B WITH DOT ABOVE
+    0x1E03: 'b',  # LATIN SMALL LETTER B WITH DOT ABOVE
+    0x1E04: 'B',  # LATIN CAPITAL LETTER B WITH DOT BELOW
+    0x1E05: 'b',  # LATIN SMALL LETTER B WITH DOT BELOW
+    0x1E06: 'B',  # LATIN CAPITAL LETTER B WITH LINE BELOW
+    0x1E07: 'b',  # LATIN SMALL LETTER B WITH LINE BELOW
+    0x1E08: 'C',  # LATIN CAPITAL LETTER C WITH CEDILLA AND ACUTE
+    0x1E09: 'c',  # LATIN SMALL LETTER C WITH CEDILLA AND ACUTE
+    0x1E0A: 'D',  # LATIN CAPITAL LETTER D WITH DOT ABOVE
+    0x1E0B: 'd',  # LATIN SMALL LETTER D WITH DOT ABOVE
+    0x1E0C: 'D',  # LATIN CAPITAL LETTER D WITH DOT BELOW
+    0x1E0D: 'd',  # LATIN SMALL LETTER D WITH DOT BELOW
+    0x1E0E: 'D',  # LATIN CAPITAL LETTER D WITH LINE BELOW
+    0x1E0F: 'd',  # LATIN SMALL LETTER D WITH LINE BELOW
+    0x1E10: 'D',  # LATIN CAPITAL LETTER D WITH CEDILLA
+    0x1E11: 'd',  # LATIN SMALL LETTER D WITH CEDILLA
+    0x1E12: 'D',  # LATIN CAPITAL LETTER D WITH CIRCUMFLEX BELOW
+    0x1E13: 'd',  # LATIN SMALL LETTER D WITH CIRCUMFLEX BELOW
+    0x1E14: 'E',  # LATIN CAPITAL LETTER E WITH MACRON AND GRAVE
+    0x1E15: 'e',  # LATIN SMALL LETTER E WITH MACRON AND GRAVE
+    0x1E16: 'E',  # LATIN CAPITAL LETTER E WITH MACRON AND ACUTE
+    0x1E17: 'e',  # LATIN SMALL LETTER E WITH MACRON AND ACUTE
+    0x1E18: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX BELOW
+    0x1E19: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX BELOW
+    0x1E1A: 'E',  # LATIN CAPITAL LETTER E WITH TILDE BELOW
+    0x1E1B: 'e',  # LATIN SMALL LETTER E WITH TILDE BELOW
+    0x1E1C: 'E',  # LATIN CAPITAL LETTER E WITH CEDILLA AND BREVE
+    0x1E1D: 'e',  # LATIN SMALL LETTER E WITH CEDILLA AND BREVE
+    0x1E1E: 'F',  # LATIN CAPITAL LETTER F WITH DOT ABOVE
+    0x1E1F: 'f',  # LATIN SMALL LETTER F WITH DOT ABOVE
+    0x1E20: 'G',  # LATIN CAPITAL LETTER G WITH MACRON
+    0x1E21: 'g',  # LATIN SMALL LETTER G WITH MACRON
+    0x1E22: 'H',  # LATIN CAPITAL LETTER H WITH DOT ABOVE
+    0x1E23: 'h',  # LATIN SMALL LETTER H WITH DOT ABOVE
+    0x1E24: 'H',  # LATIN CAPITAL LETTER H WITH DOT BELOW
+    0x1E25: 'h',  # LATIN SMALL LETTER H WITH DOT BELOW
+    0x1E26: 'H',  # LATIN CAPITAL LETTER H WITH DIAERESIS
+    0x1E27: 'h',  # LATIN SMALL LETTER H WITH DIAERESIS
+    0x1E28: 'H',  # LATIN CAPITAL LETTER H WITH CEDILLA
+    0x1E29: 'h',  # LATIN SMALL LETTER H WITH CEDILLA
+    0x1E2A: 'H',  # LATIN CAPITAL LETTER H WITH BREVE BELOW
+    0x1E2B: 'h',  # LATIN SMALL LETTER H WITH BREVE BELOW
+    0x1E2C: 'I',  # LATIN CAPITAL LETTER I WITH TILDE BELOW
+    0x1E2D: 'i',  # LATIN SMALL LETTER I WITH TILDE BELOW
+    0x1E2E: 'I',  # LATIN CAPITAL LETTER I WITH DIAERESIS AND ACUTE
+    0x1E2F: 'i',  # LATIN SMALL LETTER I WITH DIAERESIS AND ACUTE
+    0x1E30: 'K',  # LATIN CAPITAL LETTER K WITH ACUTE
+    0x1E31: 'k',  # LATIN SMALL LETTER K WITH ACUTE
+    0x1E32: 'K',  # LATIN CAPITAL LETTER K WITH DOT BELOW
+    0x1E33: 'k',  # LATIN SMALL LETTER K WITH DOT BELOW
+    0x1E34: 'K',  # LATIN CAPITAL LETTER K WITH LINE BELOW
+    0x1E35: 'k',  # LATIN SMALL LETTER K WITH LINE BELOW
+    0x1E36: 'L',  # LATIN CAPITAL LETTER L WITH DOT BELOW
+    0x1E37: 'l',  # LATIN SMALL LETTER L WITH DOT BELOW
+    0x1E38: 'L',  # LATIN CAPITAL LETTER L WITH DOT BELOW AND MACRON
+    0x1E39: 'l',  # LATIN SMALL LETTER L WITH DOT BELOW AND MACRON
+    0x1E3A: 'L',  # LATIN CAPITAL LETTER L WITH LINE BELOW
+    0x1E3B: 'l',  # LATIN SMALL LETTER L WITH LINE BELOW
+    0x1E3C: 'L',  # LATIN CAPITAL LETTER L WITH CIRCUMFLEX BELOW
+    0x1E3D: 'l',  # LATIN SMALL LETTER L WITH CIRCUMFLEX BELOW
+    0x1E3E: 'M',  # LATIN CAPITAL LETTER M WITH ACUTE
+    0x1E3F: 'm',  # LATIN SMALL LETTER M WITH ACUTE
+    0x1E40: 'M',  # LATIN CAPITAL LETTER M WITH DOT ABOVE
+    0x1E41: 'm',  # LATIN SMALL LETTER M WITH DOT ABOVE
+    0x1E42: 'M',  # LATIN CAPITAL LETTER M WITH DOT BELOW
+    0x1E43: 'm',  # LATIN SMALL LETTER M WITH DOT BELOW
+    0x1E44: 'N',  # LATIN CAPITAL LETTER N WITH DOT ABOVE
+    0x1E45: 'n',  # LATIN SMALL LETTER N WITH DOT ABOVE
+    0x1E46: 'N',  # LATIN CAPITAL LETTER N WITH DOT BELOW
+    0x1E47: 'n',  # LATIN SMALL LETTER N WITH DOT BELOW
+    0x1E48: 'N',  # LATIN CAPITAL LETTER N WITH LINE BELOW
+    0x1E49: 'n',  # LATIN SMALL LETTER N WITH LINE BELOW
+    0x1E4A: 'N',  # LATIN CAPITAL LETTER N WITH CIRCUMFLEX BELOW
+    0x1E4B: 'n',  # LATIN SMALL LETTER N WITH CIRCUMFLEX BELOW
+    0x1E4C: 'O',  # LATIN CAPITAL LETTER O WITH TILDE AND ACUTE
+    0x1E4D: 'o',  # LATIN SMALL LETTER O WITH TILDE AND ACUTE
+    0x1E4E: 'O',  # LATIN CAPITAL LETTER O WITH TILDE AND DIAERESIS
+    0x1E4F: 'o',  # LATIN SMALL LETTER O WITH TILDE AND DIAERESIS
+    0x1E50: 'O',  # LATIN CAPITAL LETTER O WITH MACRON AND GRAVE
+    0x1E51: 'o',  # LATIN SMALL LETTER O WITH MACRON AND GRAVE
+    0x1E52: 'O',  # LATIN CAPITAL LETTER O WITH MACRON AND ACUTE
+    0x1E53: 'o',  # LATIN SMALL LETTER O WITH MACRON AND ACUTE
+    0x1E54: 'P',  # LATIN CAPITAL LETTER P WITH ACUTE
+    0x1E55: 'p',  # LATIN SMALL LETTER P WITH ACUTE
+    0x1E56: 'P',  # LATIN CAPITAL LETTER P WITH DOT ABOVE
+    0x1E57: 'p',  # LATIN SMALL LETTER P WITH DOT ABOVE
+    0x1E58: 'R',  # LATIN CAPITAL LETTER R WITH DOT ABOVE
+    0x1E59: 'r',  # LATIN SMALL LETTER R WITH DOT ABOVE
+    0x1E5A: 'R',  # LATIN CAPITAL LETTER R WITH DOT BELOW
+    0x1E5B: 'r',  # LATIN SMALL LETTER R WITH DOT BELOW
+    0x1E5C: 'R',  # LATIN CAPITAL LETTER R WITH DOT BELOW AND MACRON
+    0x1E5D: 'r',  # LATIN SMALL LETTER R WITH DOT BELOW AND MACRON
+    0x1E5E: 'R',  # LATIN CAPITAL LETTER R WITH LINE BELOW
+    0x1E5F: 'r',  # LATIN SMALL LETTER R WITH LINE BELOW
+    0x1E60: 'S',  # LATIN CAPITAL LETTER S WITH DOT ABOVE
+    0x1E61: 's',  # LATIN SMALL LETTER S WITH DOT ABOVE
+    0x1E62: 'S',  # LATIN CAPITAL LETTER S WITH DOT BELOW
+    0x1E63: 's',  # LATIN SMALL LETTER S WITH DOT BELOW
+    0x1E64: 'S',  # LATIN CAPITAL LETTER S WITH ACUTE AND DOT ABOVE
+    0x1E65: 's',  # LATIN SMALL LETTER S WITH ACUTE AND DOT ABOVE
+    0x1E66: 'S',  # LATIN CAPITAL LETTER S WITH CARON AND DOT ABOVE
+    0x1E67: 's',  # LATIN SMALL LETTER S WITH CARON AND DOT ABOVE
+    0x1E68: 'S',  # LATIN CAPITAL LETTER S WITH DOT BELOW AND DOT ABOVE
+    0x1E69: 's',  # LATIN SMALL LETTER S WITH DOT BELOW AND DOT ABOVE
+    0x1E6A: 'T',  # LATIN CAPITAL LETTER T WITH DOT ABOVE
+    0x1E6B: 't',  # LATIN SMALL LETTER T WITH DOT ABOVE
+    0x1E6C: 'T',  # LATIN CAPITAL LETTER T WITH DOT BELOW
+    0x1E6D: 't',  # LATIN SMALL LETTER T WITH DOT BELOW
+    0x1E6E: 'T',  # LATIN CAPITAL LETTER T WITH LINE BELOW
+    0x1E6F: 't',  # LATIN SMALL LETTER T WITH LINE BELOW
+    0x1E70: 'T',  # LATIN CAPITAL LETTER T WITH CIRCUMFLEX BELOW
+    0x1E71: 't',  # LATIN SMALL LETTER T WITH CIRCUMFLEX BELOW
+    0x1E72: 'U',  # LATIN CAPITAL LETTER U WITH DIAERESIS BELOW
+    0x1E73: 'u',  # LATIN SMALL LETTER U WITH DIAERESIS BELOW
+    0x1E74: 'U',  # LATIN CAPITAL LETTER U WITH TILDE BELOW
+    0x1E75: 'u',  # LATIN SMALL LETTER U WITH TILDE BELOW
+    0x1E76: 'U',  # LATIN CAPITAL LETTER U WITH CIRCUMFLEX BELOW
+    0x1E77: 'u',  # LATIN SMALL LETTER U WITH CIRCUMFLEX BELOW
+    0x1E78: 'U',  # LATIN CAPITAL LETTER U WITH TILDE AND ACUTE
+    0x1E79: 'u',  # LATIN SMALL LETTER U WITH TILDE AND ACUTE
+    0x1E7A: 'U',  # LATIN CAPITAL LETTER U WITH MACRON AND DIAERESIS
+    0x1E7B: 'u',  # LATIN SMALL LETTER U WITH MACRON AND DIAERESIS
+    0x1E7C: 'V',  # LATIN CAPITAL LETTER V WITH TILDE
+    0x1E7D: 'v',  # LATIN SMALL LETTER V WITH TILDE
+    0x1E7E: 'V',  # LATIN CAPITAL LETTER V WITH DOT BELOW
+    0x1E7F: 'v',  # LATIN SMALL LETTER V WITH DOT BELOW
+    0x1E80: 'W',  # LATIN CAPITAL LETTER W WITH GRAVE
+    0x1E81: 'w',  # LATIN SMALL LETTER W WITH GRAVE
+    0x1E82: 'W',  # LATIN CAPITAL LETTER W WITH ACUTE
+    0x1E83: 'w',  # LATIN SMALL LETTER W WITH ACUTE
+    0x1E84: 'W',  # LATIN CAPITAL LETTER W WITH DIAERESIS
+    0x1E85: 'w',  # LATIN SMALL LETTER W WITH DIAERESIS
+    0x1E86: 'W',  # LATIN CAPITAL LETTER W WITH DOT ABOVE
+    0x1E87: 'w',  # LATIN SMALL LETTER W WITH DOT ABOVE
+    0x1E88: 'W',  # LATIN CAPITAL LETTER W WITH DOT BELOW
+    0x1E89: 'w',  # LATIN SMALL LETTER W WITH DOT BELOW
+    0x1E8A: 'X',  # LATIN CAPITAL LETTER X WITH DOT ABOVE
+    0x1E8B: 'x',  # LATIN SMALL LETTER X WITH DOT ABOVE
+    0x1E8C: 'X',  # LATIN CAPITAL LETTER X WITH DIAERESIS
+    0x1E8D: 'x',  # LATIN SMALL LETTER X WITH DIAERESIS
+    0x1E8E: 'Y',  # LATIN CAPITAL LETTER Y WITH DOT ABOVE
+    0x1E8F: 'y',  # LATIN SMALL LETTER Y WITH DOT ABOVE
+    0x1E90: 'Z',  # LATIN CAPITAL LETTER Z WITH CIRCUMFLEX
+    0x1E91: 'z',  # LATIN SMALL LETTER Z WITH CIRCUMFLEX
+    0x1E92: 'Z',  # LATIN CAPITAL LETTER Z WITH DOT BELOW
+    0x1E93: 'z',  # LATIN SMALL LETTER Z WITH DOT BELOW
+    0x1E94: 'Z',  # LATIN CAPITAL LETTER Z WITH LINE BELOW
+    0x1E95: 'z',  # LATIN SMALL LETTER Z WITH LINE BELOW
+    0x1E96: 'h',  # LATIN SMALL LETTER H WITH LINE BELOW
+    0x1E97: 't',  # LATIN SMALL LETTER T WITH DIAERESIS
+    0x1E98: 'w',  # LATIN SMALL LETTER W WITH RING ABOVE
+    0x1E99: 'y',  # LATIN SMALL LETTER Y WITH RING ABOVE
+    0x1E9B: 's',  # LATIN SMALL LETTER LONG S WITH DOT ABOVE
+    0x1EA0: 'A',  # LATIN CAPITAL LETTER A WITH DOT BELOW
+    0x1EA1: 'a',  # LATIN SMALL LETTER A WITH DOT BELOW
+    0x1EA2: 'A',  # LATIN CAPITAL LETTER A WITH HOOK ABOVE
+    0x1EA3: 'a',  # LATIN SMALL LETTER A WITH HOOK ABOVE
+    0x1EA4: 'A',  # LATIN CAPITAL LETTER A WITH CIRCUMFLEX AND ACUTE
+    0x1EA5: 'a',  # LATIN SMALL LETTER A WITH CIRCUMFLEX AND ACUTE
+    0x1EA6: 'A',  # LATIN CAPITAL LETTER A WITH CIRCUMFLEX AND GRAVE
+    0x1EA7: 'a',  # LATIN SMALL LETTER A WITH CIRCUMFLEX AND GRAVE
+    0x1EA8: 'A',  # LATIN CAPITAL LETTER A WITH CIRCUMFLEX AND HOOK ABOVE
+    0x1EA9: 'a',  # LATIN SMALL LETTER A WITH CIRCUMFLEX AND HOOK ABOVE
+    0x1EAA: 'A',  # LATIN CAPITAL LETTER A WITH CIRCUMFLEX AND TILDE
+    0x1EAB: 'a',  # LATIN SMALL LETTER A WITH CIRCUMFLEX AND TILDE
+    0x1EAC: 'A',  # LATIN CAPITAL LETTER A WITH CIRCUMFLEX AND DOT BELOW
+    0x1EAD: 'a',  # LATIN SMALL LETTER A WITH CIRCUMFLEX AND DOT BELOW
+    0x1EAE: 'A',  # LATIN CAPITAL LETTER A WITH BREVE AND ACUTE
+    0x1EAF: 'a',  # LATIN SMALL LETTER A WITH BREVE AND ACUTE
+    0x1EB0: 'A',  # LATIN CAPITAL LETTER A WITH BREVE AND GRAVE
+    0x1EB1: 'a',  # LATIN SMALL LETTER A WITH BREVE AND GRAVE
+    0x1EB2: 'A',  # LATIN CAPITAL LETTER A WITH BREVE AND HOOK ABOVE
+    0x1EB3: 'a',  # LATIN SMALL LETTER A WITH BREVE AND HOOK ABOVE
+    0x1EB4: 'A',  # LATIN CAPITAL LETTER A WITH BREVE AND TILDE
+    0x1EB5: 'a',  # LATIN SMALL LETTER A WITH BREVE AND TILDE
+    0x1EB6: 'A',  # LATIN CAPITAL LETTER A WITH BREVE AND DOT BELOW
+    0x1EB7: 'a',  # LATIN SMALL LETTER A WITH BREVE AND DOT BELOW
+    0x1EB8: 'E',  # LATIN CAPITAL LETTER E WITH DOT BELOW
+    0x1EB9: 'e',  # LATIN SMALL LETTER E WITH DOT BELOW
+    0x1EBA: 'E',  # LATIN CAPITAL LETTER E WITH HOOK ABOVE
+    0x1EBB: 'e',  # LATIN SMALL LETTER E WITH HOOK ABOVE
+    0x1EBC: 'E',  # LATIN CAPITAL LETTER E WITH TILDE
+    0x1EBD: 'e',  # LATIN SMALL LETTER E WITH TILDE
+    0x1EBE: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX AND ACUTE
+    0x1EBF: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX AND ACUTE
+    0x1EC0: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX AND GRAVE
+    0x1EC1: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX AND GRAVE
+    0x1EC2: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX AND HOOK ABOVE
+    0x1EC3: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX AND HOOK ABOVE
+    0x1EC4: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX AND TILDE
+    0x1EC5: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX AND TILDE
+    0x1EC6: 'E',  # LATIN CAPITAL LETTER E WITH CIRCUMFLEX AND DOT BELOW
+    0x1EC7: 'e',  # LATIN SMALL LETTER E WITH CIRCUMFLEX AND DOT BELOW
+    0x1EC8: 'I',  # LATIN CAPITAL LETTER I WITH HOOK ABOVE
+    0x1EC9: 'i',  # LATIN SMALL LETTER I WITH HOOK ABOVE
+    0x1ECA: 'I',  # LATIN CAPITAL LETTER I WITH DOT BELOW
+    0x1ECB: 'i',  # LATIN SMALL LETTER I WITH DOT BELOW
+    0x1ECC: 'O',  # LATIN CAPITAL LETTER O WITH DOT BELOW
+    0x1ECD: 'o',  # LATIN SMALL LETTER O WITH DOT BELOW
+    0x1ECE: 'O',  # LATIN CAPITAL LETTER O WITH HOOK ABOVE
+    0x1ECF: 'o',  # LATIN SMALL LETTER O WITH HOOK ABOVE
+    0x1ED0: 'O',  # LATIN CAPITAL LETTER O WITH CIRCUMFLEX AND ACUTE
+    0x1ED1: 'o',  # LATIN SMALL LETTER O WITH CIRCUMFLEX AND ACUTE
+    0x1ED2: 'O',  # LATIN CAPITAL LETTER O WITH CIRCUMFLEX AND GRAVE
+    0x1ED3: 'o',  # LATIN SMALL LETTER O WITH CIRCUMFLEX AND GRAVE
+    0x1ED4: 'O',  # LATIN CAPITAL LETTER O WITH CIRCUMFLEX AND HOOK ABOVE
+    0x1ED5: 'o',  # LATIN SMALL LETTER O WITH CIRCUMFLEX AND HOOK ABOVE
+    0x1ED6: 'O',  # LATIN CAPITAL LETTER O WITH CIRCUMFLEX AND TILDE
+    0x1ED7: 'o',  # LATIN SMALL LETTER O WITH CIRCUMFLEX AND TILDE
+    0x1ED8: 'O',  # LATIN CAPITAL LETTER O WITH CIRCUMFLEX AND DOT BELOW
+    0x1ED9: 'o',  # LATIN SMALL LETTER O WITH CIRCUMFLEX AND DOT BELOW
+    0x1EDA: 'O',  # LATIN CAPITAL LETTER O WITH HORN AND ACUTE
+    0x1EDB: 'o',  # LATIN SMALL LETTER O WITH HORN AND ACUTE
+    0x1EDC: 'O',  # LATIN CAPITAL LETTER O WITH HORN AND GRAVE
+    0x1EDD: 'o',  # LATIN SMALL LETTER O WITH HORN AND GRAVE
+    0x1EDE: 'O',  # LATIN CAPITAL LETTER O WITH HORN AND HOOK ABOVE
+    0x1EDF: 'o',  # LATIN SMALL LETTER O WITH HORN AND HOOK ABOVE
+    0x1EE0: 'O',  # LATIN CAPITAL LETTER O WITH HORN AND TILDE
+    0x1EE1: 'o',  # LATIN SMALL LETTER O WITH HORN AND TILDE
+    0x1EE2: 'O',  # LATIN CAPITAL LETTER O WITH HORN AND DOT BELOW
+    0x1EE3: 'o',  # LATIN SMALL LETTER O WITH HORN AND DOT BELOW
+    0x1EE4: 'U',  # LATIN CAPITAL LETTER U WITH DOT BELOW
+    0x1EE5: 'u',  # LATIN SMALL LETTER U WITH DOT BELOW
+    0x1EE6: 'U',  # LATIN CAPITAL LETTER U WITH HOOK ABOVE
+    0x1EE7: 'u',  # LATIN SMALL LETTER U WITH HOOK ABOVE
+    0x1EE8: 'U',  # LATIN CAPITAL LETTER U WITH HORN AND ACUTE
+    0x1EE9: 'u',  # LATIN SMALL LETTER U WITH HORN AND ACUTE
+    0x1EEA: 'U',  # LATIN CAPITAL LETTER U WITH HORN AND GRAVE
+    0x1EEB: 'u',  # LATIN SMALL LETTER U WITH HORN AND GRAVE
+    0x1EEC: 'U',  # LATIN CAPITAL LETTER U WITH HORN AND HOOK ABOVE
+    0x1EED: 'u',  # LATIN SMALL LETTER U WITH HORN AND HOOK ABOVE
+    0x1EEE: 'U',  # LATIN CAPITAL LETTER U WITH HORN AND TILDE
+    0x1EEF: 'u',  # LATIN SMALL LETTER U WITH HORN AND TILDE
+    0x1EF0: 'U',  # LATIN CAPITAL LETTER U WITH HORN AND DOT BELOW
+    0x1EF1: 'u',  # LATIN SMALL LETTER U WITH HORN AND DOT BELOW
+    0x1EF2: 'Y',  # LATIN CAPITAL LETTER Y WITH GRAVE
+    0x1EF3: 'y',  # LATIN SMALL LETTER Y WITH GRAVE
+    0x1EF4: 'Y',  # LATIN CAPITAL LETTER Y WITH DOT BELOW
+    0x1EF5: 'y',  # LATIN SMALL LETTER Y WITH DOT BELOW
+    0x1EF6: 'Y',  # LATIN CAPITAL LETTER Y WITH HOOK ABOVE
+    0x1EF7: 'y',  # LATIN SMALL LETTER Y WITH HOOK ABOVE
+    0x1EF8: 'Y',  # LATIN CAPITAL LETTER Y WITH TILDE
+    0x1EF9: 'y',  # LATIN SMALL LETTER Y WITH TILDE
+    0x2070: '0',  # SUPERSCRIPT ZERO
+    0x2071: 'i',  # SUPERSCRIPT LATIN SMALL LETTER I
+    0x2074: '4',  # SUPERSCRIPT FOUR
+    0x2075: '5',  # SUPERSCRIPT FIVE
+    0x2076: '6',  # SUPERSCRIPT SIX
+    0x2077: '7',  # SUPERSCRIPT SEVEN
+    0x2078: '8',  # SUPERSCRIPT EIGHT
+    0x2079: '9',  # SUPERSCRIPT NINE
+    0x207F: 'n',  # SUPERSCRIPT LATIN SMALL LETTER N
+    0x2080: '0',  # SUBSCRIPT ZERO
+    0x2081: '1',  # SUBSCRIPT ONE
+    0x2082: '2',  # SUBSCRIPT TWO
+    0x2083: '3',  # SUBSCRIPT THREE
+    0x2084: '4',  # SUBSCRIPT FOUR
+    0x2085: '5',  # SUBSCRIPT FIVE
+    0x2086: '6',  # SUBSCRIPT SIX
+    0x2087: '7',  # SUBSCRIPT SEVEN
+    0x2088: '8',  # SUBSCRIPT EIGHT
+    0x2089: '9',  # SUBSCRIPT NINE
+    0x2090: 'a',  # LATIN SUBSCRIPT SMALL LETTER A
+    0x2091: 'e',  # LATIN SUBSCRIPT SMALL LETTER E
+    0x2092: 'o',  # LATIN SUBSCRIPT SMALL LETTER O
+    0x2093: 'x',  # LATIN SUBSCRIPT SMALL LETTER X
+    0x2095: 'h',  # LATIN SUBSCRIPT SMALL LETTER H
+    0x2096: 'k',  # LATIN SUBSCRIPT SMALL LETTER K
+    0x2097: 'l',  # LATIN SUBSCRIPT SMALL LETTER L
+    0x2098: 'm',  # LATIN SUBSCRIPT SMALL LETTER M
+    0x2099: 'n',  # LATIN SUBSCRIPT SMALL LETTER N
+    0x209A: 'p',  # LATIN SUBSCRIPT SMALL LETTER P
+    0x209B: 's',  # LATIN SUBSCRIPT SMALL LETTER S
+    0x209C: 't',  # LATIN SUBSCRIPT SMALL LETTER T
+    0x2102: 'C',  # DOUBLE-STRUCK CAPITAL C
+    0x210A: 'g',  # SCRIPT SMALL G
+    0x210B: 'H',  # SCRIPT CAPITAL H
+    0x210C: 'H',  # BLACK-LETTER CAPITAL H
+    0x210D: 'H',  # DOUBLE-STRUCK CAPITAL H
+    0x210E: 'h',  # PLANCK CONSTANT
+    0x2110: 'I',  # SCRIPT CAPITAL I
+    0x2111: 'I',  # BLACK-LETTER CAPITAL I
+    0x2112: 'L',  # SCRIPT CAPITAL L
+    0x2113: 'l',  # SCRIPT SMALL L
+    0x2115: 'N',  # DOUBLE-STRUCK CAPITAL N
+    0x2119: 'P',  # DOUBLE-STRUCK CAPITAL P
+    0x211A: 'Q',  # DOUBLE-STRUCK CAPITAL Q
+    0x211B: 'R',  # SCRIPT CAPITAL R
+    0x211C: 'R',  # BLACK-LETTER CAPITAL R
+    0x211D: 'R',  # DOUBLE-STRUCK CAPITAL R
+    0x2124: 'Z',  # DOUBLE-STRUCK CAPITAL Z
+    0x2128: 'Z',  # BLACK-LETTER CAPITAL Z
+    0x212A: 'K',  # KELVIN SIGN
+    0x212B: 'A',  # ANGSTROM SIGN
+    0x212C: 'B',  # SCRIPT CAPITAL B
+    0x212D: 'C',  # BLACK-LETTER CAPITAL C
+    0x212F: 'e',  # SCRIPT SMALL E
+    0x2130: 'E',  # SCRIPT CAPITAL E
+    0x2131: 'F',  # SCRIPT CAPITAL F
+    0x2133: 'M',  # SCRIPT CAPITAL M
+    0x2134: 'o',  # SCRIPT SMALL O
+    0x2139: 'i',  # INFORMATION SOURCE
+    0x2145: 'D',  # DOUBLE-STRUCK ITALIC CAPITAL D
+    0x2146: 'd',  # DOUBLE-STRUCK ITALIC SMALL D
+    0x2147: 'e',  # DOUBLE-STRUCK ITALIC SMALL E
+    0x2148: 'i',  # DOUBLE-STRUCK ITALIC SMALL I
+    0x2149: 'j',  # DOUBLE-STRUCK ITALIC SMALL J
+    0x2160: 'I',  # ROMAN NUMERAL ONE
+    0x2164: 'V',  # ROMAN NUMERAL FIVE
+    0x2169: 'X',  # ROMAN NUMERAL TEN
+    0x216C: 'L',  # ROMAN NUMERAL FIFTY
+    0x216D: 'C',  # ROMAN NUMERAL ONE HUNDRED
+    0x216E: 'D',  # ROMAN NUMERAL FIVE HUNDRED
+    0x216F: 'M',  # ROMAN NUMERAL ONE THOUSAND
+    0x2170: 'i',  # SMALL ROMAN NUMERAL ONE
+    0x2174: 'v',  # SMALL ROMAN NUMERAL FIVE
+    0x2179: 'x',  # SMALL ROMAN NUMERAL TEN
+    0x217C: 'l',  # SMALL ROMAN NUMERAL FIFTY
+    0x217D: 'c',  # SMALL ROMAN NUMERAL ONE HUNDRED
+    0x217E: 'd',  # SMALL ROMAN NUMERAL FIVE HUNDRED
+    0x217F: 'm',  # SMALL ROMAN NUMERAL ONE THOUSAND
+    0x2460: '1',  # CIRCLED DIGIT ONE
+    0x2461: '2',  # CIRCLED DIGIT TWO
+    0x2462: '3',  # CIRCLED DIGIT THREE
+    0x2463: '4',  # CIRCLED DIGIT FOUR
+    0x2464: '5',  # CIRCLED DIGIT FIVE
+    0x2465: '6',  # CIRCLED DIGIT SIX
+    0x2466: '7',  # CIRCLED DIGIT SEVEN
+    0x2467: '8',  # CIRCLED DIGIT EIGHT
+    0x2468: '9',  # CIRCLED DIGIT NINE
+    0x24B6: 'A',  # CIRCLED LATIN CAPITAL LETTER A
+    0x24B7: 'B',  # CIRCLED LATIN CAPITAL LETTER B
+    0x24B8: 'C',  # CIRCLED LATIN CAPITAL LETTER C
+    0x24B9: 'D',  # CIRCLED LATIN CAPITAL LETTER D
+    0x24BA: 'E',  # CIRCLED LATIN CAPITAL LETTER E
+    0x24BB: 'F',  # CIRCLED LATIN CAPITAL LETTER F
+    0x24BC: 'G',  # CIRCLED LATIN CAPITAL LETTER G
+    0x24BD: 'H',  # CIRCLED LATIN CAPITAL LETTER H
+    0x24BE: 'I',  # CIRCLED LATIN CAPITAL LETTER I
+    0x24BF: 'J',  # CIRCLED LATIN CAPITAL LETTER J
+    0x24C0: 'K',  # CIRCLED LATIN CAPITAL LETTER K
+    0x24C1: 'L',  # CIRCLED LATIN CAPITAL LETTER L
+    0x24C2: 'M',  # CIRCLED LATIN CAPITAL LETTER M
+    0x24C3: 'N',  # CIRCLED LATIN CAPITAL LETTER N
+    0x24C4: 'O',  # CIRCLED LATIN CAPITAL LETTER O
+    0x24C5: 'P',  # CIRCLED LATIN CAPITAL LETTER P
+    0x24C6: 'Q',  # CIRCLED LATIN CAPITAL LETTER Q
+    0x24C7: 'R',  # CIRCLED LATIN CAPITAL LETTER R
+    0x24C8: 'S',  # CIRCLED LATIN CAPITAL LETTER S
+    0x24C9: 'T',  # CIRCLED LATIN CAPITAL LETTER T
+    0x24CA: 'U',  # CIRCLED LATIN CAPITAL LETTER U
+    0x24CB: 'V',  # CIRCLED LATIN CAPITAL LETTER V
+    0x24CC: 'W',  # CIRCLED LATIN CAPITAL LETTER W
+    0x24CD: 'X',  # CIRCLED LATIN CAPITAL LETTER X
+    0x24CE: 'Y',  # CIRCLED LATIN CAPITAL LETTER Y
+    0x24CF: 'Z',  # CIRCLED LATIN CAPITAL LETTER Z
+    0x24D0: 'a',  # CIRCLED LATIN SMALL LETTER A
+    0x24D1: 'b',  # CIRCLED LATIN SMALL LETTER B
+    0x24D2: 'c',  # CIRCLED LATIN SMALL LETTER C
+    0x24D3: 'd',  # CIRCLED LATIN SMALL LETTER D
+    0x24D4: 'e',  # CIRCLED LATIN SMALL LETTER E
+    0x24D5: 'f',  # CIRCLED LATIN SMALL LETTER F
+    0x24D6: 'g',  # CIRCLED LATIN SMALL LETTER G
+    0x24D7: 'h',  # CIRCLED LATIN SMALL LETTER H
+    0x24D8: 'i',  # CIRCLED LATIN SMALL LETTER I
+    0x24D9: 'j',  # CIRCLED LATIN SMALL LETTER J
+    0x24DA: 'k',  # CIRCLED LATIN SMALL LETTER K
+    0x24DB: 'l',  # CIRCLED LATIN SMALL LETTER L
+    0x24DC: 'm',  # CIRCLED LATIN SMALL LETTER M
+    0x24DD: 'n',  # CIRCLED LATIN SMALL LETTER N
+    0x24DE: 'o',  # CIRCLED LATIN SMALL LETTER O
+    0x24DF: 'p',  # CIRCLED LATIN SMALL LETTER P
+    0x24E0: 'q',  # CIRCLED LATIN SMALL LETTER Q
+    0x24E1: 'r',  # CIRCLED LATIN SMALL LETTER R
+    0x24E2: 's',  # CIRCLED LATIN SMALL LETTER S
+    0x24E3: 't',  # CIRCLED LATIN SMALL LETTER T
+    0x24E4: 'u',  # CIRCLED LATIN SMALL LETTER U
+    0x24E5: 'v',  # CIRCLED LATIN SMALL LETTER V
+    0x24E6: 'w',  # CIRCLED LATIN SMALL LETTER W
+    0x24E7: 'x',  # CIRCLED LATIN SMALL LETTER X
+    0x24E8: 'y',  # CIRCLED LATIN SMALL LETTER Y
+    0x24E9: 'z',  # CIRCLED LATIN SMALL LETTER Z
+    0x24EA: '0',  # CIRCLED DIGIT ZERO
+    0x2C7C: 'j',  # LATIN SUBSCRIPT SMALL LETTER J
+    0x2C7D: 'V',  # MODIFIER LETTER CAPITAL V
+    0xA7F2: 'C',  # MODIFIER LETTER CAPITAL C
+    0xA7F3: 'F',  # MODIFIER LETTER CAPITAL F
+    0xA7F4: 'Q',  # MODIFIER LETTER CAPITAL Q
+    0xFF10: '0',  # FULLWIDTH DIGIT ZERO
+    0xFF11: '1',  # FULLWIDTH DIGIT ONE
+    0xFF12: '2',  # FULLWIDTH DIGIT TWO
+    0xFF13: '3',  # FULLWIDTH DIGIT THREE
+    0xFF14: '4',  # FULLWIDTH DIGIT FOUR
+    0xFF15: '5',  # FULLWIDTH DIGIT FIVE
+    0xFF16: '6',  # FULLWIDTH DIGIT SIX
+    0xFF17: '7',  # FULLWIDTH DIGIT SEVEN
+    0xFF18: '8',  # FULLWIDTH DIGIT EIGHT
+    0xFF19: '9',  # FULLWIDTH DIGIT NINE
+    0xFF21: 'A',  # FULLWIDTH LATIN CAPITAL LETTER A
+    0xFF22: 'B',  # FULLWIDTH LATIN CAPITAL LETTER B
+    0xFF23: 'C',  # FULLWIDTH LATIN CAPITAL LETTER C
+    0xFF24: 'D',  # FULLWIDTH LATIN CAPITAL LETTER D
+    0xFF25: 'E',  # FULLWIDTH LATIN CAPITAL LETTER E
+    0xFF26: 'F',  # FULLWIDTH LATIN CAPITAL LETTER F
+    0xFF27: 'G',  # FULLWIDTH LATIN CAPITAL LETTER G
+    0xFF28: 'H',  # FULLWIDTH LATIN CAPITAL LETTER H
+    0xFF29: 'I',  # FULLWIDTH LATIN CAPITAL LETTER I
+    0xFF2A: 'J',  # FULLWIDTH LATIN CAPITAL LETTER J
+    0xFF2B: 'K',  # FULLWIDTH LATIN CAPITAL LETTER K
+    0xFF2C: 'L',  # FULLWIDTH LATIN CAPITAL LETTER L
+    0xFF2D: 'M',  # FULLWIDTH LATIN CAPITAL LETTER M
+    0xFF2E: 'N',  # FULLWIDTH LATIN CAPITAL LETTER N
+    0xFF2F: 'O',  # FULLWIDTH LATIN CAPITAL LETTER O
+    0xFF30: 'P',  # FULLWIDTH LATIN CAPITAL LETTER P
+    0xFF31: 'Q',  # FULLWIDTH LATIN CAPITAL LETTER Q
+    0xFF32: 'R',  # FULLWIDTH LATIN CAPITAL LETTER R
+    0xFF33: 'S',  # FULLWIDTH LATIN CAPITAL LETTER S
+    0xFF34: 'T',  # FULLWIDTH LATIN CAPITAL LETTER T
+    0xFF35: 'U',  # FULLWIDTH LATIN CAPITAL LETTER U
+    0xFF36: 'V',  # FULLWIDTH LATIN CAPITAL LETTER V
+    0xFF37: 'W',  # FULLWIDTH LATIN CAPITAL LETTER W
+    0xFF38: 'X',  # FULLWIDTH LATIN CAPITAL LETTER X
+    0xFF39: 'Y',  # FULLWIDTH LATIN CAPITAL LETTER Y
+    0xFF3A: 'Z',  # FULLWIDTH LATIN CAPITAL LETTER Z
+    0xFF41: 'a',  # FULLWIDTH LATIN SMALL LETTER A
+    0xFF42: 'b',  # FULLWIDTH LATIN SMALL LETTER B
+    0xFF43: 'c',  # FULLWIDTH LATIN SMALL LETTER C
+    0xFF44: 'd',  # FULLWIDTH LATIN SMALL LETTER D
+    0xFF45: 'e',  # FULLWIDTH LATIN SMALL LETTER E
+    0xFF46: 'f',  # FULLWIDTH LATIN SMALL LETTER F
+    0xFF47: 'g',  # FULLWIDTH LATIN SMALL LETTER G
+    0xFF48: 'h',  # FULLWIDTH LATIN SMALL LETTER H
+    0xFF49: 'i',  # FULLWIDTH LATIN SMALL LETTER I
+    0xFF4A: 'j',  # FULLWIDTH LATIN SMALL LETTER J
+    0xFF4B: 'k',  # FULLWIDTH LATIN SMALL LETTER K
+    0xFF4C: 'l',  # FULLWIDTH LATIN SMALL LETTER L
+    0xFF4D: 'm',  # FULLWIDTH LATIN SMALL LETTER M
+    0xFF4E: 'n',  # FULLWIDTH LATIN SMALL LETTER N
+    0xFF4F: 'o',  # FULLWIDTH LATIN SMALL LETTER O
+    0xFF50: 'p',  # FULLWIDTH LATIN SMALL LETTER P
+    0xFF51: 'q',  # FULLWIDTH LATIN SMALL LETTER Q
+    0xFF52: 'r',  # FULLWIDTH LATIN SMALL LETTER R
+    0xFF53: 's',  # FULLWIDTH LATIN SMALL LETTER S
+    0xFF54: 't',  # FULLWIDTH LATIN SMALL LETTER T
+    0xFF55: 'u',  # FULLWIDTH LATIN SMALL LETTER U
+    0xFF56: 'v',  # FULLWIDTH LATIN SMALL LETTER V
+    0xFF57: 'w',  # FULLWIDTH LATIN SMALL LETTER W
+    0xFF58: 'x',  # FULLWIDTH LATIN SMALL LETTER X
+    0xFF59: 'y',  # FULLWIDTH LATIN SMALL LETTER Y
+    0xFF5A: 'z',  # FULLWIDTH LATIN SMALL LETTER Z
+    0x107A5: 'q',  # MODIFIER LETTER SMALL Q
+    0x1D400: 'A',  # MATHEMATICAL BOLD CAPITAL A
+    0x1D401: 'B',  # MATHEMATICAL BOLD CAPITAL B
+    0x1D402: 'C',  # MATHEMATICAL BOLD CAPITAL C
+    0x1D403: 'D',  # MATHEMATICAL BOLD CAPITAL D
+    0x1D404: 'E',  # MATHEMATICAL BOLD CAPITAL E
+    0x1D405: 'F',  # MATHEMATICAL BOLD CAPITAL F
+    0x1D406: 'G',  # MATHEMATICAL BOLD CAPITAL G
+    0x1D407: 'H',  # MATHEMATICAL BOLD CAPITAL H
+    0x1D408: 'I',  # MATHEMATICAL BOLD CAPITAL I
+    0x1D409: 'J',  # MATHEMATICAL BOLD CAPITAL J
+    0x1D40A: 'K',  # MATHEMATICAL BOLD CAPITAL K
+    0x1D40B: 'L',  # MATHEMATICAL BOLD CAPITAL L
+    0x1D40C: 'M',  # MATHEMATICAL BOLD CAPITAL M
+    0x1D40D: 'N',  # MATHEMATICAL BOLD CAPITAL N
+    0x1D40E: 'O',  # MATHEMATICAL BOLD CAPITAL O
+    0x1D40F: 'P',  # MATHEMATICAL BOLD CAPITAL P
+    0x1D410: 'Q',  # MATHEMATICAL BOLD CAPITAL Q
+    0x1D411: 'R',  # MATHEMATICAL BOLD CAPITAL R
+    0x1D412: 'S',  # MATHEMATICAL BOLD CAPITAL S
+    0x1D413: 'T',  # MATHEMATICAL BOLD CAPITAL T
+    0x1D414: 'U',  # MATHEMATICAL BOLD CAPITAL U
+    0x1D415: 'V',  # MATHEMATICAL BOLD CAPITAL V
+    0x1D416: 'W',  # MATHEMATICAL BOLD CAPITAL W
+    0x1D417: 'X',  # MATHEMATICAL BOLD CAPITAL X
+    0x1D418: 'Y',  # MATHEMATICAL BOLD CAPITAL Y
+    0x1D419: 'Z',  # MATHEMATICAL BOLD CAPITAL Z
+    0x1D41A: 'a',  # MATHEMATICAL BOLD SMALL A
+    0x1D41B: 'b',  # MATHEMATICAL BOLD SMALL B
+    0x1D41C: 'c',  # MATHEMATICAL BOLD SMALL C
+    0x1D41D: 'd',  # MATHEMATICAL BOLD SMALL D
+    0x1D41E: 'e',  # MATHEMATICAL BOLD SMALL E
+    0x1D41F: 'f',  # MATHEMATICAL BOLD SMALL F
+    0x1D420: 'g',  # MATHEMATICAL BOLD SMALL G
+    0x1D421: 'h',  # MATHEMATICAL BOLD SMALL H
+    0x1D422: 'i',  # MATHEMATICAL BOLD SMALL I
+    0x1D423: 'j',  # MATHEMATICAL BOLD SMALL J
+    0x1D424: 'k',  # MATHEMATICAL BOLD SMALL K
+    0x1D425: 'l',  # MATHEMATICAL BOLD SMALL L
+    0x1D426: 'm',  # MATHEMATICAL BOLD SMALL M
+    0x1D427: 'n',  # MATHEMATICAL BOLD SMALL N
+    0x1D428: 'o',  # MATHEMATICAL BOLD SMALL O
+    0x1D429: 'p',  # MATHEMATICAL BOLD SMALL P
+    0x1D42A: 'q',  # MATHEMATICAL BOLD SMALL Q
+    0x1D42B: 'r',  # MATHEMATICAL BOLD SMALL R
+    0x1D42C: 's',  # MATHEMATICAL BOLD SMALL S
+    0x1D42D: 't',  # MATHEMATICAL BOLD SMALL T
+    0x1D42E: 'u',  # MATHEMATICAL BOLD SMALL U
+    0x1D42F: 'v',  # MATHEMATICAL BOLD SMALL V
+    0x1D430: 'w',  # MATHEMATICAL BOLD SMALL W
+    0x1D431: 'x',  # MATHEMATICAL BOLD SMALL X
+    0x1D432: 'y',  # MATHEMATICAL BOLD SMALL Y
+    0x1D433: 'z',  # MATHEMATICAL BOLD SMALL Z
+    0x1D434: 'A',  # MATHEMATICAL ITALIC CAPITAL A
+    0x1D435: 'B',  # MATHEMATICAL ITALIC CAPITAL B
+    0x1D436: 'C',  # MATHEMATICAL ITALIC CAPITAL C
+    0x1D437: 'D',  # MATHEMATICAL ITALIC CAPITAL D
+    0x1D438: 'E',  # MATHEMATICAL ITALIC CAPITAL E
+    0x1D439: 'F',  # MATHEMATICAL ITALIC CAPITAL F
+    0x1D43A: 'G',  # MATHEMATICAL ITALIC CAPITAL G
+    0x1D43B: 'H',  # MATHEMATICAL ITALIC CAPITAL H
+    0x1D43C: 'I',  # MATHEMATICAL ITALIC CAPITAL I
+    0x1D43D: 'J',  # MATHEMATICAL ITALIC CAPITAL J
+    0x1D43E: 'K',  # MATHEMATICAL ITALIC CAPITAL K
+    0x1D43F: 'L',  # MATHEMATICAL ITALIC CAPITAL L
+    0x1D440: 'M',  # MATHEMATICAL ITALIC CAPITAL M
+    0x1D441: 'N',  # MATHEMATICAL ITALIC CAPITAL N
+    0x1D442: 'O',  # MATHEMATICAL ITALIC CAPITAL O
+    0x1D443: 'P',  # MATHEMATICAL ITALIC CAPITAL P
+    0x1D444: 'Q',  # MATHEMATICAL ITALIC CAPITAL Q
+    0x1D445: 'R',  # MATHEMATICAL ITALIC CAPITAL R
+    0x1D446: 'S',  # MATHEMATICAL ITALIC CAPITAL S
+    0x1D447: 'T',  # MATHEMATICAL ITALIC CAPITAL T
+    0x1D448: 'U',  # MATHEMATICAL ITALIC CAPITAL U
+    0x1D449: 'V',  # MATHEMATICAL ITALIC CAPITAL V
+    0x1D44A: 'W',  # MATHEMATICAL ITALIC CAPITAL W
+    0x1D44B: 'X',  # MATHEMATICAL ITALIC CAPITAL X
+    0x1D44C: 'Y',  # MATHEMATICAL ITALIC CAPITAL Y
+    0x1D44D: 'Z',  # MATHEMATICAL ITALIC CAPITAL Z
+    0x1D44E: 'a',  # MATHEMATICAL ITALIC SMALL A
+    0x1D44F: 'b',  # MATHEMATICAL ITALIC SMALL B
+    0x1D450: 'c',  # MATHEMATICAL ITALIC SMALL C
+    0x1D451: 'd',  # MATHEMATICAL ITALIC SMALL D
+    0x1D452: 'e',  # MATHEMATICAL ITALIC SMALL E
+    0x1D453: 'f',  # MATHEMATICAL ITALIC SMALL F
+    0x1D454: 'g',  # MATHEMATICAL ITALIC SMALL G
+    0x1D456: 'i',  # MATHEMATICAL ITALIC SMALL I
+    0x1D457: 'j',  # MATHEMATICAL ITALIC SMALL J
+    0x1D458: 'k',  # MATHEMATICAL ITALIC SMALL K
+    0x1D459: 'l',  # MATHEMATICAL ITALIC SMALL L
+    0x1D45A: 'm',  # MATHEMATICAL ITALIC SMALL M
+    0x1D45B: 'n',  # MATHEMATICAL ITALIC SMALL N
+    0x1D45C: 'o',  # MATHEMATICAL ITALIC SMALL O
+    0x1D45D: 'p',  # MATHEMATICAL ITALIC SMALL P
+    0x1D45E: 'q',  # MATHEMATICAL ITALIC SMALL Q
+    0x1D45F: 'r',  # MATHEMATICAL ITALIC SMALL R
+    0x1D460: 's',  # MATHEMATICAL ITALIC SMALL S
+    0x1D461: 't',  # MATHEMATICAL ITALIC SMALL T
+    0x1D462: 'u',  # MATHEMATICAL ITALIC SMALL U
+    0x1D463: 'v',  # MATHEMATICAL ITALIC SMALL V
+    0x1D464: 'w',  # MATHEMATICAL ITALIC SMALL W
+    0x1D465: 'x',  # MATHEMATICAL ITALIC SMALL X
+    0x1D466: 'y',  # MATHEMATICAL ITALIC SMALL Y
+    0x1D467: 'z',  # MATHEMATICAL ITALIC SMALL Z
+    0x1D468: 'A',  # MATHEMATICAL BOLD ITALIC CAPITAL A
+    0x1D469: 'B',  # MATHEMATICAL BOLD ITALIC CAPITAL B
+    0x1D46A: 'C',  # MATHEMATICAL BOLD ITALIC CAPITAL C
+    0x1D46B: 'D',  # MATHEMATICAL BOLD ITALIC CAPITAL D
+    0x1D46C: 'E',  # MATHEMATICAL BOLD ITALIC CAPITAL E
+    0x1D46D: 'F',  # MATHEMATICAL BOLD ITALIC CAPITAL F
+    0x1D46E: 'G',  # MATHEMATICAL BOLD ITALIC CAPITAL G
+    0x1D46F: 'H',  # MATHEMATICAL BOLD ITALIC CAPITAL H
+    0x1D470: 'I',  # MATHEMATICAL BOLD ITALIC CAPITAL I
+    0x1D471: 'J',  # MATHEMATICAL BOLD ITALIC CAPITAL J
+    0x1D472: 'K',  # MATHEMATICAL BOLD ITALIC CAPITAL K
+    0x1D473: 'L',  # MATHEMATICAL BOLD ITALIC CAPITAL L
+    0x1D474: 'M',  # MATHEMATICAL BOLD ITALIC CAPITAL M
+    0x1D475: 'N',  # MATHEMATICAL BOLD ITALIC CAPITAL N
+    0x1D476: 'O',  # MATHEMATICAL BOLD ITALIC CAPITAL O
+    0x1D477: 'P',  # MATHEMATICAL BOLD ITALIC CAPITAL P
+    0x1D478: 'Q',  # MATHEMATICAL BOLD ITALIC CAPITAL Q
+    0x1D479: 'R',  # MATHEMATICAL BOLD ITALIC CAPITAL R
+    0x1D47A: 'S',  # MATHEMATICAL BOLD ITALIC CAPITAL S
+    0x1D47B: 'T',  # MATHEMATICAL BOLD ITALIC CAPITAL T
+    0x1D47C: 'U',  # MATHEMATICAL BOLD ITALIC CAPITAL U
+    0x1D47D: 'V',  # MATHEMATICAL BOLD ITALIC CAPITAL V
+    0x1D47E: 'W',  # MATHEMATICAL BOLD ITALIC CAPITAL W
+    0x1D47F: 'X',  # MATHEMATICAL BOLD ITALIC CAPITAL X
+    0x1D480: 'Y',  # MATHEMATICAL BOLD ITALIC CAPITAL Y
+    0x1D481: 'Z',  # MATHEMATICAL BOLD ITALIC CAPITAL Z
+    0x1D482: 'a',  # MATHEMATICAL BOLD ITALIC SMALL A
+    0x1D483: 'b',  # MATHEMATICAL BOLD ITALIC SMALL B
+    0x1D484: 'c',  # MATHEMATICAL BOLD ITALIC SMALL C
+    0x1D485: 'd',  # MATHEMATICAL BOLD ITALIC SMALL D
+    0x1D486: 'e',  # MATHEMATICAL BOLD ITALIC SMALL E
+    0x1D487: 'f',  # MATHEMATICAL BOLD ITALIC SMALL F
+    0x1D488: 'g',  # MATHEMATICAL BOLD ITALIC SMALL G
+    0x1D489: 'h',  # MATHEMATICAL BOLD ITALIC SMALL H
+    0x1D48A: 'i',  # MATHEMATICAL BOLD ITALIC SMALL I
+    0x1D48B: 'j',  # MATHEMATICAL BOLD ITALIC SMALL J
+    0x1D48C: 'k',  # MATHEMATICAL BOLD ITALIC SMALL K
+    0x1D48D: 'l',  # MATHEMATICAL BOLD ITALIC SMALL L
+    0x1D48E: 'm',  # MATHEMATICAL BOLD ITALIC SMALL M
+    0x1D48F: 'n',  # MATHEMATICAL BOLD ITALIC SMALL N
+    0x1D490: 'o',  # MATHEMATICAL BOLD ITALIC SMALL O
+    0x1D491: 'p',  # MATHEMATICAL BOLD ITALIC SMALL P
+    0x1D492: 'q',  # MATHEMATICAL BOLD ITALIC SMALL Q
+    0x1D493: 'r',  # MATHEMATICAL BOLD ITALIC SMALL R
+    0x1D494: 's',  # MATHEMATICAL BOLD ITALIC SMALL S
+    0x1D495: 't',  # MATHEMATICAL BOLD ITALIC SMALL T
+    0x1D496: 'u',  # MATHEMATICAL BOLD ITALIC SMALL U
+    0x1D497: 'v',  # MATHEMATICAL BOLD ITALIC SMALL V
+    0x1D498: 'w',  # MATHEMATICAL BOLD ITALIC SMALL W
+    0x1D499: 'x',  # MATHEMATICAL BOLD ITALIC SMALL X
+    0x1D49A: 'y',  # MATHEMATICAL BOLD ITALIC SMALL Y
+    0x1D49B: 'z',  # MATHEMATICAL BOLD ITALIC SMALL Z
+    0x1D49C: 'A',  # MATHEMATICAL SCRIPT CAPITAL A
+    0x1D49E: 'C',  # MATHEMATICAL SCRIPT CAPITAL C
+    0x1D49F: 'D',  # MATHEMATICAL SCRIPT CAPITAL D
+    0x1D4A2: 'G',  # MATHEMATICAL SCRIPT CAPITAL G
+    0x1D4A5: 'J',  # MATHEMATICAL SCRIPT CAPITAL J
+    0x1D4A6: 'K',  # MATHEMATICAL SCRIPT CAPITAL K
+    0x1D4A9: 'N',  # MATHEMATICAL SCRIPT CAPITAL N
+    0x1D4AA: 'O',  # MATHEMATICAL SCRIPT CAPITAL O
+    0x1D4AB: 'P',  # MATHEMATICAL SCRIPT CAPITAL P
+    0x1D4AC: 'Q',  # MATHEMATICAL SCRIPT CAPITAL Q
+    0x1D4AE: 'S',  # MATHEMATICAL SCRIPT CAPITAL S
+    0x1D4AF: 'T',  # MATHEMATICAL SCRIPT CAPITAL T
+    0x1D4B0: 'U',  # MATHEMATICAL SCRIPT CAPITAL U
+    0x1D4B1: 'V',  # MATHEMATICAL SCRIPT CAPITAL V
+    0x1D4B2: 'W',  # MATHEMATICAL SCRIPT CAPITAL W
+    0x1D4B3: 'X',  # MATHEMATICAL SCRIPT CAPITAL X
+    0x1D4B4: 'Y',  # MATHEMATICAL SCRIPT CAPITAL Y
+    0x1D4B5: 'Z',  # MATHEMATICAL SCRIPT CAPITAL Z
+    0x1D4B6: 'a',  # MATHEMATICAL SCRIPT SMALL A
+    0x1D4B7: 'b',  # MATHEMATICAL SCRIPT SMALL B
+    0x1D4B8: 'c',  # MATHEMATICAL SCRIPT SMALL C
+    0x1D4B9: 'd',  # MATHEMATICAL SCRIPT SMALL D
+    0x1D4BB: 'f',  # MATHEMATICAL SCRIPT SMALL F
+    0x1D4BD: 'h',  # MATHEMATICAL SCRIPT SMALL H
+    0x1D4BE: 'i',  # MATHEMATICAL SCRIPT SMALL I
+    0x1D4BF: 'j',  # MATHEMATICAL SCRIPT SMALL J
+    0x1D4C0: 'k',  # MATHEMATICAL SCRIPT SMALL K
+    0x1D4C1: 'l',  # MATHEMATICAL SCRIPT SMALL L
+    0x1D4C2: 'm',  # MATHEMATICAL SCRIPT SMALL M
+    0x1D4C3: 'n',  # MATHEMATICAL SCRIPT SMALL N
+    0x1D4C5: 'p',  # MATHEMATICAL SCRIPT SMALL P
+    0x1D4C6: 'q',  # MATHEMATICAL SCRIPT SMALL Q
+    0x1D4C7: 'r',  # MATHEMATICAL SCRIPT SMALL R
+    0x1D4C8: 's',  # MATHEMATICAL SCRIPT SMALL S
+    0x1D4C9: 't',  # MATHEMATICAL SCRIPT SMALL T
+    0x1D4CA: 'u',  # MATHEMATICAL SCRIPT SMALL U
+    0x1D4CB: 'v',  # MATHEMATICAL SCRIPT SMALL V
+    0x1D4CC: 'w',  # MATHEMATICAL SCRIPT SMALL W
+    0x1D4CD: 'x',  # MATHEMATICAL SCRIPT SMALL X
+    0x1D4CE: 'y',  # MATHEMATICAL SCRIPT SMALL Y
+    0x1D4CF: 'z',  # MATHEMATICAL SCRIPT SMALL Z
+    0x1D4D0: 'A',  # MATHEMATICAL BOLD SCRIPT CAPITAL A
+    0x1D4D1: 'B',  # MATHEMATICAL BOLD SCRIPT CAPITAL B
+    0x1D4D2: 'C',  # MATHEMATICAL BOLD SCRIPT CAPITAL C
+    0x1D4D3: 'D',  # MATHEMATICAL BOLD SCRIPT CAPITAL D
+    0x1D4D4: 'E',  # MATHEMATICAL BOLD SCRIPT CAPITAL E
+    0x1D4D5: 'F',  # MATHEMATICAL BOLD SCRIPT CAPITAL F
+    0x1D4D6: 'G',  # MATHEMATICAL BOLD SCRIPT CAPITAL G
+    0x1D4D7: 'H',  # MATHEMATICAL BOLD SCRIPT CAPITAL H
+    0x1D4D8: 'I',  # MATHEMATICAL BOLD SCRIPT CAPITAL I
+    0x1D4D9: 'J',  # MATHEMATICAL BOLD SCRIPT CAPITAL J
+    0x1D4DA: 'K',  # MATHEMATICAL BOLD SCRIPT CAPITAL K
+    0x1D4DB: 'L',  # MATHEMATICAL BOLD SCRIPT CAPITAL L
+    0x1D4DC: 'M',  # MATHEMATICAL BOLD SCRIPT CAPITAL M
+    0x1D4DD: 'N',  # MATHEMATICAL BOLD SCRIPT CAPITAL N
+    0x1D4DE: 'O',  # MATHEMATICAL BOLD SCRIPT CAPITAL O
+    0x1D4DF: 'P',  # MATHEMATICAL BOLD SCRIPT CAPITAL P
+    0x1D4E0: 'Q',  # MATHEMATICAL BOLD SCRIPT CAPITAL Q
+    0x1D4E1: 'R',  # MATHEMATICAL BOLD SCRIPT CAPITAL R
+    0x1D4E2: 'S',  # MATHEMATICAL BOLD SCRIPT CAPITAL S
+    0x1D4E3: 'T',  # MATHEMATICAL BOLD SCRIPT CAPITAL T
+    0x1D4E4: 'U',  # MATHEMATICAL BOLD SCRIPT CAPITAL U
+    0x1D4E5: 'V',  # MATHEMATICAL BOLD SCRIPT CAPITAL V
+    0x1D4E6: 'W',  # MATHEMATICAL BOLD SCRIPT CAPITAL W
+    0x1D4E7: 'X',  # MATHEMATICAL BOLD SCRIPT CAPITAL X
+    0x1D4E8: 'Y',  # MATHEMATICAL BOLD SCRIPT CAPITAL Y
+    0x1D4E9: 'Z',  # MATHEMATICAL BOLD SCRIPT CAPITAL Z
+    0x1D4EA: 'a',  # MATHEMATICAL BOLD SCRIPT SMALL A
+    0x1D4EB: 'b',  # MATHEMATICAL BOLD SCRIPT SMALL B
+    0x1D4EC: 'c',  # MATHEMATICAL BOLD SCRIPT SMALL C
+    0x1D4ED: 'd',  # MATHEMATICAL BOLD SCRIPT SMALL D
+    0x1D4EE: 'e',  # MATHEMATICAL BOLD SCRIPT SMALL E
+    0x1D4EF: 'f',  # MATHEMATICAL BOLD SCRIPT SMALL F
+    0x1D4F0: 'g',  # MATHEMATICAL BOLD SCRIPT SMALL G
+    0x1D4F1: 'h',  # MATHEMATICAL BOLD SCRIPT SMALL H
+    0x1D4F2: 'i',  # MATHEMATICAL BOLD SCRIPT SMALL I
+    0x1D4F3: 'j',  # MATHEMATICAL BOLD SCRIPT SMALL J
+    0x1D4F4: 'k',  # MATHEMATICAL BOLD SCRIPT SMALL K
+    0x1D4F5: 'l',  # MATHEMATICAL BOLD SCRIPT SMALL L
+    0x1D4F6: 'm',  # MATHEMATICAL BOLD SCRIPT SMALL M
+    0x1D4F7: 'n',  # MATHEMATICAL BOLD SCRIPT SMALL N
+    0x1D4F8: 'o',  # MATHEMATICAL BOLD SCRIPT SMALL O
+    0x1D4F9: 'p',  # MATHEMATICAL BOLD SCRIPT SMALL P
+    0x1D4FA: 'q',  # MATHEMATICAL BOLD SCRIPT SMALL Q
+    0x1D4FB: 'r',  # MATHEMATICAL BOLD SCRIPT SMALL R
+    0x1D4FC: 's',  # MATHEMATICAL BOLD SCRIPT SMALL S
+    0x1D4FD: 't',  # MATHEMATICAL BOLD SCRIPT SMALL T
+    0x1D4FE: 'u',  # MATHEMATICAL BOLD SCRIPT SMALL U
+    0x1D4FF: 'v',  # MATHEMATICAL BOLD SCRIPT SMALL V
+    0x1D500: 'w',  # MATHEMATICAL BOLD SCRIPT SMALL W
+    0x1D501: 'x',  # MATHEMATICAL BOLD SCRIPT SMALL X
+    0x1D502: 'y',  # MATHEMATICAL BOLD SCRIPT SMALL Y
+    0x1D503: 'z',  # MATHEMATICAL BOLD SCRIPT SMALL Z
+    0x1D504: 'A',  # MATHEMATICAL FRAKTUR CAPITAL A
+    0x1D505: 'B',  # MATHEMATICAL FRAKTUR CAPITAL B
+    0x1D507: 'D',  # MATHEMATICAL FRAKTUR CAPITAL D
+    0x1D508: 'E',  # MATHEMATICAL FRAKTUR CAPITAL E
+    0x1D509: 'F',  # MATHEMATICAL FRAKTUR CAPITAL F
+    0x1D50A: 'G',  # MATHEMATICAL FRAKTUR CAPITAL G
+    0x1D50D: 'J',  # MATHEMATICAL FRAKTUR CAPITAL J
+    0x1D50E: 'K',  # MATHEMATICAL FRAKTUR CAPITAL K
+    0x1D50F: 'L',  # MATHEMATICAL FRAKTUR CAPITAL L
+    0x1D510: 'M',  # MATHEMATICAL FRAKTUR CAPITAL M
+    0x1D511: 'N',  # MATHEMATICAL FRAKTUR CAPITAL N
+    0x1D512: 'O',  # MATHEMATICAL FRAKTUR CAPITAL O
+    0x1D513: 'P',  # MATHEMATICAL FRAKTUR CAPITAL P
+    0x1D514: 'Q',  # MATHEMATICAL FRAKTUR CAPITAL Q
+    0x1D516: 'S',  # MATHEMATICAL FRAKTUR CAPITAL S
+    0x1D517: 'T',  # MATHEMATICAL FRAKTUR CAPITAL T
+    0x1D518: 'U',  # MATHEMATICAL FRAKTUR CAPITAL U
+    0x1D519: 'V',  # MATHEMATICAL FRAKTUR CAPITAL V
+    0x1D51A: 'W',  # MATHEMATICAL FRAKTUR CAPITAL W
+    0x1D51B: 'X',  # MATHEMATICAL FRAKTUR CAPITAL X
+    0x1D51C: 'Y',  # MATHEMATICAL FRAKTUR CAPITAL Y
+    0x1D51E: 'a',  # MATHEMATICAL FRAKTUR SMALL A
+    0x1D51F: 'b',  # MATHEMATICAL FRAKTUR SMALL B
+    0x1D520: 'c',  # MATHEMATICAL FRAKTUR SMALL C
+    0x1D521: 'd',  # MATHEMATICAL FRAKTUR SMALL D
+    0x1D522: 'e',  # MATHEMATICAL FRAKTUR SMALL E
+    0x1D523: 'f',  # MATHEMATICAL FRAKTUR SMALL F
+    0x1D524: 'g',  # MATHEMATICAL FRAKTUR SMALL G
+    0x1D525: 'h',  # MATHEMATICAL FRAKTUR SMALL H
+    0x1D526: 'i',  # MATHEMATICAL FRAKTUR SMALL I
+    0x1D527: 'j',  # MATHEMATICAL FRAKTUR SMALL J
+    0x1D528: 'k',  # MATHEMATICAL FRAKTUR SMALL K
+    0x1D529: 'l',  # MATHEMATICAL FRAKTUR SMALL L
+    0x1D52A: 'm',  # MATHEMATICAL FRAKTUR SMALL M
+    0x1D52B: 'n',  # MATHEMATICAL FRAKTUR SMALL N
+    0x1D52C: 'o',  # MATHEMATICAL FRAKTUR SMALL O
+    0x1D52D: 'p',  # MATHEMATICAL FRAKTUR SMALL P
+    0x1D52E: 'q',  # MATHEMATICAL FRAKTUR SMALL Q
+    0x1D52F: 'r',  # MATHEMATICAL FRAKTUR SMALL R
+    0x1D530: 's',  # MATHEMATICAL FRAKTUR SMALL S
+    0x1D531: 't',  # MATHEMATICAL FRAKTUR SMALL T
+    0x1D532: 'u',  # MATHEMATICAL FRAKTUR SMALL U
+    0x1D533: 'v',  # MATHEMATICAL FRAKTUR SMALL V
+    0x1D534: 'w',  # MATHEMATICAL FRAKTUR SMALL W
+    0x1D535: 'x',  # MATHEMATICAL FRAKTUR SMALL X
+    0x1D536: 'y',  # MATHEMATICAL FRAKTUR SMALL Y
+    0x1D537: 'z',  # MATHEMATICAL FRAKTUR SMALL Z
+    0x1D538: 'A',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL A
+    0x1D539: 'B',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL B
+    0x1D53B: 'D',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL D
+    0x1D53C: 'E',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL E
+    0x1D53D: 'F',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL F
+    0x1D53E: 'G',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL G
+    0x1D540: 'I',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL I
+    0x1D541: 'J',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL J
+    0x1D542: 'K',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL K
+    0x1D543: 'L',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL L
+    0x1D544: 'M',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL M
+    0x1D546: 'O',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL O
+    0x1D54A: 'S',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL S
+    0x1D54B: 'T',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL T
+    0x1D54C: 'U',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL U
+    0x1D54D: 'V',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL V
+    0x1D54E: 'W',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL W
+    0x1D54F: 'X',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL X
+    0x1D550: 'Y',  # MATHEMATICAL DOUBLE-STRUCK CAPITAL Y
+    0x1D552: 'a',  # MATHEMATICAL DOUBLE-STRUCK SMALL A
+    0x1D553: 'b',  # MATHEMATICAL DOUBLE-STRUCK SMALL B
+    0x1D554: 'c',  # MATHEMATICAL DOUBLE-STRUCK SMALL C
+    0x1D555: 'd',  # MATHEMATICAL DOUBLE-STRUCK SMALL D
+    0x1D556: 'e',  # MATHEMATICAL DOUBLE-STRUCK SMALL E
+    0x1D557: 'f',  # MATHEMATICAL DOUBLE-STRUCK SMALL F
+    0x1D558: 'g',  # MATHEMATICAL DOUBLE-STRUCK SMALL G
+    0x1D559: 'h',  # MATHEMATICAL DOUBLE-STRUCK SMALL H
+    0x1D55A: 'i',  # MATHEMATICAL DOUBLE-STRUCK SMALL I
+    0x1D55B: 'j',  # MATHEMATICAL DOUBLE-STRUCK SMALL J
+    0x1D55C: 'k',  # MATHEMATICAL DOUBLE-STRUCK SMALL K
+    0x1D55D: 'l',  # MATHEMATICAL DOUBLE-STRUCK SMALL L
+    0x1D55E: 'm',  # MATHEMATICAL DOUBLE-STRUCK SMALL M
+    0x1D55F: 'n',  # MATHEMATICAL DOUBLE-STRUCK SMALL N
+    0x1D560: 'o',  # MATHEMATICAL DOUBLE-STRUCK SMALL O
+    0x1D561: 'p',  # MATHEMATICAL DOUBLE-STRUCK SMALL P
+    0x1D562: 'q',  # MATHEMATICAL DOUBLE-STRUCK SMALL Q
+    0x1D563: 'r',  # MATHEMATICAL DOUBLE-STRUCK SMALL R
+    0x1D564: 's',  # MATHEMATICAL DOUBLE-STRUCK SMALL S
+    0x1D565: 't',  # MATHEMATICAL DOUBLE-STRUCK SMALL T
+    0x1D566: 'u',  # MATHEMATICAL DOUBLE-STRUCK SMALL U
+    0x1D567: 'v',  # MATHEMATICAL DOUBLE-STRUCK SMALL V
+    0x1D568: 'w',  # MATHEMATICAL DOUBLE-STRUCK SMALL W
+    0x1D569: 'x',  # MATHEMATICAL DOUBLE-STRUCK SMALL X
+    0x1D56A: 'y',  # MATHEMATICAL DOUBLE-STRUCK SMALL Y
+    0x1D56B: 'z',  # MATHEMATICAL DOUBLE-STRUCK SMALL Z
+    0x1D56C: 'A',  # MATHEMATICAL BOLD FRAKTUR CAPITAL A
+    0x1D56D: 'B',  # MATHEMATICAL BOLD FRAKTUR CAPITAL B
+    0x1D56E: 'C',  # MATHEMATICAL BOLD FRAKTUR CAPITAL C
+    0x1D56F: 'D',  # MATHEMATICAL BOLD FRAKTUR CAPITAL D
+    0x1D570: 'E',  # MATHEMATICAL BOLD FRAKTUR CAPITAL E
+    0x1D571: 'F',  # MATHEMATICAL BOLD FRAKTUR CAPITAL F
+    0x1D572: 'G',  # MATHEMATICAL BOLD FRAKTUR CAPITAL G
+    0x1D573: 'H',  # MATHEMATICAL BOLD FRAKTUR CAPITAL H
+    0x1D574: 'I',  # MATHEMATICAL BOLD FRAKTUR CAPITAL I
+    0x1D575: 'J',  # MATHEMATICAL BOLD FRAKTUR CAPITAL J
+    0x1D576: 'K',  # MATHEMATICAL BOLD FRAKTUR CAPITAL K
+    0x1D577: 'L',  # MATHEMATICAL BOLD FRAKTUR CAPITAL L
+    0x1D578: 'M',  # MATHEMATICAL BOLD FRAKTUR CAPITAL M
+    0x1D579: 'N',  # MATHEMATICAL BOLD FRAKTUR CAPITAL N
+    0x1D57A: 'O',  # MATHEMATICAL BOLD FRAKTUR CAPITAL O
+    0x1D57B: 'P',  # MATHEMATICAL BOLD FRAKTUR CAPITAL P
+    0x1D57C: 'Q',  # MATHEMATICAL BOLD FRAKTUR CAPITAL Q
+    0x1D57D: 'R',  # MATHEMATICAL BOLD FRAKTUR CAPITAL R
+    0x1D57E: 'S',  # MATHEMATICAL BOLD FRAKTUR CAPITAL S
+    0x1D57F: 'T',  # MATHEMATICAL BOLD FRAKTUR CAPITAL T
+    0x1D580: 'U',  # MATHEMATICAL BOLD FRAKTUR CAPITAL U
+    0x1D581: 'V',  # MATHEMATICAL BOLD FRAKTUR CAPITAL V
+    0x1D582: 'W',  # MATHEMATICAL BOLD FRAKTUR CAPITAL W
+    0x1D583: 'X',  # MATHEMATICAL BOLD FRAKTUR CAPITAL X
+    0x1D584: 'Y',  # MATHEMATICAL BOLD FRAKTUR CAPITAL Y
+    0x1D585: 'Z',  # MATHEMATICAL BOLD FRAKTUR CAPITAL Z
+    0x1D586: 'a',  # MATHEMATICAL BOLD FRAKTUR SMALL A
+    0x1D587: 'b',  # MATHEMATICAL BOLD FRAKTUR SMALL B
+    0x1D588: 'c',  # MATHEMATICAL BOLD FRAKTUR SMALL C
+    0x1D589: 'd',  # MATHEMATICAL BOLD FRAKTUR SMALL D
+    0x1D58A: 'e',  # MATHEMATICAL BOLD FRAKTUR SMALL E
+    0x1D58B: 'f',  # MATHEMATICAL BOLD FRAKTUR SMALL F
+    0x1D58C: 'g',  # MATHEMATICAL BOLD FRAKTUR SMALL G
+    0x1D58D: 'h',  # MATHEMATICAL BOLD FRAKTUR SMALL H
+    0x1D58E: 'i',  # MATHEMATICAL BOLD FRAKTUR SMALL I
+    0x1D58F: 'j',  # MATHEMATICAL BOLD FRAKTUR SMALL J
+    0x1D590: 'k',  # MATHEMATICAL BOLD FRAKTUR SMALL K
+    0x1D591: 'l',  # MATHEMATICAL BOLD FRAKTUR SMALL L
+    0x1D592: 'm',  # MATHEMATICAL BOLD FRAKTUR SMALL M
+    0x1D593: 'n',  # MATHEMATICAL BOLD FRAKTUR SMALL N
+    0x1D594: 'o',  # MATHEMATICAL BOLD FRAKTUR SMALL O
+    0x1D595: 'p',  # MATHEMATICAL BOLD FRAKTUR SMALL P
+    0x1D596: 'q',  # MATHEMATICAL BOLD FRAKTUR SMALL Q
+    0x1D597: 'r',  # MATHEMATICAL BOLD FRAKTUR SMALL R
+    0x1D598: 's',  # MATHEMATICAL BOLD FRAKTUR SMALL S
+    0x1D599: 't',  # MATHEMATICAL BOLD FRAKTUR SMALL T
+    0x1D59A: 'u',  # MATHEMATICAL BOLD FRAKTUR SMALL U
+    0x1D59B: 'v',  # MATHEMATICAL BOLD FRAKTUR SMALL V
+    0x1D59C: 'w',  # MATHEMATICAL BOLD FRAKTUR SMALL W
+    0x1D59D: 'x',  # MATHEMATICAL BOLD FRAKTUR SMALL X
+    0x1D59E: 'y',  # MATHEMATICAL BOLD FRAKTUR SMALL Y
+    0x1D59F: 'z',  # MATHEMATICAL BOLD FRAKTUR SMALL Z
+    0x1D5A0: 'A',  # MATHEMATICAL SANS-SERIF CAPITAL A
+    0x1D5A1: 'B',  # MATHEMATICAL SANS-SERIF CAPITAL B
+    0x1D5A2: 'C',  # MATHEMATICAL SANS-SERIF CAPITAL C
+    0x1D5A3: 'D',  # MATHEMATICAL SANS-SERIF CAPITAL D
+    0x1D5A4: 'E',  # MATHEMATICAL SANS-SERIF CAPITAL E
+    0x1D5A5: 'F',  # MATHEMATICAL SANS-SERIF CAPITAL F
+    0x1D5A6: 'G',  # MATHEMATICAL SANS-SERIF CAPITAL G
+    0x1D5A7: 'H',  # MATHEMATICAL SANS-SERIF CAPITAL H
+    0x1D5A8: 'I',  # MATHEMATICAL SANS-SERIF CAPITAL I
+    0x1D5A9: 'J',  # MATHEMATICAL SANS-SERIF CAPITAL J
+    0x1D5AA: 'K',  # MATHEMATICAL SANS-SERIF CAPITAL K
+    0x1D5AB: 'L',  # MATHEMATICAL SANS-SERIF CAPITAL L
+    0x1D5AC: 'M',  # MATHEMATICAL SANS-SERIF CAPITAL M
+    0x1D5AD: 'N',  # MATHEMATICAL SANS-SERIF CAPITAL N
+    0x1D5AE: 'O',  # MATHEMATICAL SANS-SERIF CAPITAL O
+    0x1D5AF: 'P',  # MATHEMATICAL SANS-SERIF CAPITAL P
+    0x1D5B0: 'Q',  # MATHEMATICAL SANS-SERIF CAPITAL Q
+    0x1D5B1: 'R',  # MATHEMATICAL SANS-SERIF CAPITAL R
+    0x1D5B2: 'S',  # MATHEMATICAL SANS-SERIF CAPITAL S
+    0x1D5B3: 'T',  # MATHEMATICAL SANS-SERIF CAPITAL T
+    0x1D5B4: 'U',  # MATHEMATICAL SANS-SERIF CAPITAL U
+    0x1D5B5: 'V',  # MATHEMATICAL SANS-SERIF CAPITAL V
+    0x1D5B6: 'W',  # MATHEMATICAL SANS-SERIF CAPITAL W
+    0x1D5B7: 'X',  # MATHEMATICAL SANS-SERIF CAPITAL X
+    0x1D5B8: 'Y',  # MATHEMATICAL SANS-SERIF CAPITAL Y
+    0x1D5B9: 'Z',  # MATHEMATICAL SANS-SERIF CAPITAL Z
+    0x1D5BA: 'a',  # MATHEMATICAL SANS-SERIF SMALL A
+    0x1D5BB: 'b',  # MATHEMATICAL SANS-SERIF SMALL B
+    0x1D5BC: 'c',  # MATHEMATICAL SANS-SERIF SMALL C
+    0x1D5BD: 'd',  # MATHEMATICAL SANS-SERIF SMALL D
+    0x1D5BE: 'e',  # MATHEMATICAL SANS-SERIF SMALL E
+    0x1D5BF: 'f',  # MATHEMATICAL SANS-SERIF SMALL F
+    0x1D5C0: 'g',  # MATHEMATICAL SANS-SERIF SMALL G
+    0x1D5C1: 'h',  # MATHEMATICAL SANS-SERIF SMALL H
+    0x1D5C2: 'i',  # MATHEMATICAL SANS-SERIF SMALL I
+    0x1D5C3: 'j',  # MATHEMATICAL SANS-SERIF SMALL J
+    0x1D5C4: 'k',  # MATHEMATICAL SANS-SERIF SMALL K
+    0x1D5C5: 'l',  # MATHEMATICAL SANS-SERIF SMALL L
+    0x1D5C6: 'm',  # MATHEMATICAL SANS-SERIF SMALL M
+    0x1D5C7: 'n',  # MATHEMATICAL SANS-SERIF SMALL N
+    0x1D5C8: 'o',  # MATHEMATICAL SANS-SERIF SMALL O
+    0x1D5C9: 'p',  # MATHEMATICAL SANS-SERIF SMALL P
+    0x1D5CA: 'q',  # MATHEMATICAL SANS-SERIF SMALL Q
+    0x1D5CB: 'r',  # MATHEMATICAL SANS-SERIF SMALL R
+    0x1D5CC: 's',  # MATHEMATICAL SANS-SERIF SMALL S
+    0x1D5CD: 't',  # MATHEMATICAL SANS-SERIF SMALL T
+    0x1D5CE: 'u',  # MATHEMATICAL SANS-SERIF SMALL U
+    0x1D5CF: 'v',  # MATHEMATICAL SANS-SERIF SMALL V
+    0x1D5D0: 'w',  # MATHEMATICAL SANS-SERIF SMALL W
+    0x1D5D1: 'x',  # MATHEMATICAL SANS-SERIF SMALL X
+    0x1D5D2: 'y',  # MATHEMATICAL SANS-SERIF SMALL Y
+    0x1D5D3: 'z',  # MATHEMATICAL SANS-SERIF SMALL Z
+    0x1D5D4: 'A',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL A
+    0x1D5D5: 'B',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL B
+    0x1D5D6: 'C',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL C
+    0x1D5D7: 'D',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL D
+    0x1D5D8: 'E',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL E
+    0x1D5D9: 'F',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL F
+    0x1D5DA: 'G',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL G
+    0x1D5DB: 'H',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL H
+    0x1D5DC: 'I',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL I
+    0x1D5DD: 'J',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL J
+    0x1D5DE: 'K',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL K
+    0x1D5DF: 'L',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL L
+    0x1D5E0: 'M',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL M
+    0x1D5E1: 'N',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL N
+    0x1D5E2: 'O',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL O
+    0x1D5E3: 'P',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL P
+    0x1D5E4: 'Q',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL Q
+    0x1D5E5: 'R',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL R
+    0x1D5E6: 'S',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL S
+    0x1D5E7: 'T',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL T
+    0x1D5E8: 'U',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL U
+    0x1D5E9: 'V',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL V
+    0x1D5EA: 'W',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL W
+    0x1D5EB: 'X',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL X
+    0x1D5EC: 'Y',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL Y
+    0x1D5ED: 'Z',  # MATHEMATICAL SANS-SERIF BOLD CAPITAL Z
+    0x1D5EE: 'a',  # MATHEMATICAL SANS-SERIF BOLD SMALL A
+    0x1D5EF: 'b',  # MATHEMATICAL SANS-SERIF BOLD SMALL B
+    0x1D5F0: 'c',  # MATHEMATICAL SANS-SERIF BOLD SMALL C
+    0x1D5F1: 'd',  # MATHEMATICAL SANS-SERIF BOLD SMALL D
+    0x1D5F2: 'e',  # MATHEMATICAL SANS-SERIF BOLD SMALL E
+    0x1D5F3: 'f',  # MATHEMATICAL SANS-SERIF BOLD SMALL F
+    0x1D5F4: 'g',  # MATHEMATICAL SANS-SERIF BOLD SMALL G
+    0x1D5F5: 'h',  # MATHEMATICAL SANS-SERIF BOLD SMALL H
+    0x1D5F6: 'i',  # MATHEMATICAL SANS-SERIF BOLD SMALL I
+    0x1D5F7: 'j',  # MATHEMATICAL SANS-SERIF BOLD SMALL J
+    0x1D5F8: 'k',  # MATHEMATICAL SANS-SERIF BOLD SMALL K
+    0x1D5F9: 'l',  # MATHEMATICAL SANS-SERIF BOLD SMALL L
+    0x1D5FA: 'm',  # MATHEMATICAL SANS-SERIF BOLD SMALL M
+    0x1D5FB: 'n',  # MATHEMATICAL SANS-SERIF BOLD SMALL N
+    0x1D5FC: 'o',  # MATHEMATICAL SANS-SERIF BOLD SMALL O
+    0x1D5FD: 'p',  # MATHEMATICAL SANS-SERIF BOLD SMALL P
+    0x1D5FE: 'q',  # MATHEMATICAL SANS-SERIF BOLD SMALL Q
+    0x1D5FF: 'r',  # MATHEMATICAL SANS-SERIF BOLD SMALL R
+    0x1D600: 's',  # MATHEMATICAL SANS-SERIF BOLD SMALL S
+    0x1D601: 't',  # MATHEMATICAL SANS-SERIF BOLD SMALL T
+    0x1D602: 'u',  # MATHEMATICAL SANS-SERIF BOLD SMALL U
+    0x1D603: 'v',  # MATHEMATICAL SANS-SERIF BOLD SMALL V
+    0x1D604: 'w',  # MATHEMATICAL SANS-SERIF BOLD SMALL W
+    0x1D605: 'x',  # MATHEMATICAL SANS-SERIF BOLD SMALL X
+    0x1D606: 'y',  # MATHEMATICAL SANS-SERIF BOLD SMALL Y
+    0x1D607: 'z',  # MATHEMATICAL SANS-SERIF BOLD SMALL Z
+    0x1D608: 'A',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL A
+    0x1D609: 'B',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL B
+    0x1D60A: 'C',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL C
+    0x1D60B: 'D',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL D
+    0x1D60C: 'E',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL E
+    0x1D60D: 'F',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL F
+    0x1D60E: 'G',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL G
+    0x1D60F: 'H',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL H
+    0x1D610: 'I',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL I
+    0x1D611: 'J',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL J
+    0x1D612: 'K',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL K
+    0x1D613: 'L',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL L
+    0x1D614: 'M',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL M
+    0x1D615: 'N',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL N
+    0x1D616: 'O',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL O
+    0x1D617: 'P',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL P
+    0x1D618: 'Q',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL Q
+    0x1D619: 'R',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL R
+    0x1D61A: 'S',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL S
+    0x1D61B: 'T',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL T
+    0x1D61C: 'U',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL U
+    0x1D61D: 'V',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL V
+    0x1D61E: 'W',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL W
+    0x1D61F: 'X',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL X
+    0x1D620: 'Y',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL Y
+    0x1D621: 'Z',  # MATHEMATICAL SANS-SERIF ITALIC CAPITAL Z
+    0x1D622: 'a',  # MATHEMATICAL SANS-SERIF ITALIC SMALL A
+    0x1D623: 'b',  # MATHEMATICAL SANS-SERIF ITALIC SMALL B
+    0x1D624: 'c',  # MATHEMATICAL SANS-SERIF ITALIC SMALL C
+    0x1D625: 'd',  # MATHEMATICAL SANS-SERIF ITALIC SMALL D
+    0x1D626: 'e',  # MATHEMATICAL SANS-SERIF ITALIC SMALL E
+    0x1D627: 'f',  # MATHEMATICAL SANS-SERIF ITALIC SMALL F
+    0x1D628: 'g',  # MATHEMATICAL SANS-SERIF ITALIC SMALL G
+    0x1D629: 'h',  # MATHEMATICAL SANS-SERIF ITALIC SMALL H
+    0x1D62A: 'i',  # MATHEMATICAL SANS-SERIF ITALIC SMALL I
+    0x1D62B: 'j',  # MATHEMATICAL SANS-SERIF ITALIC SMALL J
+    0x1D62C: 'k',  # MATHEMATICAL SANS-SERIF ITALIC SMALL K
+    0x1D62D: 'l',  # MATHEMATICAL SANS-SERIF ITALIC SMALL L
+    0x1D62E: 'm',  # MATHEMATICAL SANS-SERIF ITALIC SMALL M
+    0x1D62F: 'n',  # MATHEMATICAL SANS-SERIF ITALIC SMALL N
+    0x1D630: 'o',  # MATHEMATICAL SANS-SERIF ITALIC SMALL O
+    0x1D631: 'p',  # MATHEMATICAL SANS-SERIF ITALIC SMALL P
+    0x1D632: 'q',  # MATHEMATICAL SANS-SERIF ITALIC SMALL Q
+    0x1D633: 'r',  # MATHEMATICAL SANS-SERIF ITALIC SMALL R
+    0x1D634: 's',  # MATHEMATICAL SANS-SERIF ITALIC SMALL S
+    0x1D635: 't',  # MATHEMATICAL SANS-SERIF ITALIC SMALL T
+    0x1D636: 'u',  # MATHEMATICAL SANS-SERIF ITALIC SMALL U
+    0x1D637: 'v',  # MATHEMATICAL SANS-SERIF ITALIC SMALL V
+    0x1D638: 'w',  # MATHEMATICAL SANS-SERIF ITALIC SMALL W
+    0x1D639: 'x',  # MATHEMATICAL SANS-SERIF ITALIC SMALL X
+    0x1D63A: 'y',  # MATHEMATICAL SANS-SERIF ITALIC SMALL Y
+    0x1D63B: 'z',  # MATHEMATICAL SANS-SERIF ITALIC SMALL Z
+    0x1D63C: 'A',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL A
+    0x1D63D: 'B',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL B
+    0x1D63E: 'C',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL C
+    0x1D63F: 'D',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL D
+    0x1D640: 'E',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL E
+    0x1D641: 'F',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL F
+    0x1D642: 'G',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL G
+    0x1D643: 'H',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL H
+    0x1D644: 'I',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL I
+    0x1D645: 'J',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL J
+    0x1D646: 'K',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL K
+    0x1D647: 'L',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL L
+    0x1D648: 'M',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL M
+    0x1D649: 'N',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL N
+    0x1D64A: 'O',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL O
+    0x1D64B: 'P',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL P
+    0x1D64C: 'Q',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL Q
+    0x1D64D: 'R',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL R
+    0x1D64E: 'S',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL S
+    0x1D64F: 'T',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL T
+    0x1D650: 'U',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL U
+    0x1D651: 'V',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL V
+    0x1D652: 'W',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL W
+    0x1D653: 'X',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL X
+    0x1D654: 'Y',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL Y
+    0x1D655: 'Z',  # MATHEMATICAL SANS-SERIF BOLD ITALIC CAPITAL Z
+    0x1D656: 'a',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL A
+    0x1D657: 'b',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL B
+    0x1D658: 'c',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL C
+    0x1D659: 'd',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL D
+    0x1D65A: 'e',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL E
+    0x1D65B: 'f',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL F
+    0x1D65C: 'g',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL G
+    0x1D65D: 'h',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL H
+    0x1D65E: 'i',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL I
+    0x1D65F: 'j',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL J
+    0x1D660: 'k',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL K
+    0x1D661: 'l',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL L
+    0x1D662: 'm',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL M
+    0x1D663: 'n',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL N
+    0x1D664: 'o',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL O
+    0x1D665: 'p',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL P
+    0x1D666: 'q',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL Q
+    0x1D667: 'r',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL R
+    0x1D668: 's',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL S
+    0x1D669: 't',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL T
+    0x1D66A: 'u',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL U
+    0x1D66B: 'v',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL V
+    0x1D66C: 'w',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL W
+    0x1D66D: 'x',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL X
+    0x1D66E: 'y',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL Y
+    0x1D66F: 'z',  # MATHEMATICAL SANS-SERIF BOLD ITALIC SMALL Z
+    0x1D670: 'A',  # MATHEMATICAL MONOSPACE CAPITAL A
+    0x1D671: 'B',  # MATHEMATICAL MONOSPACE CAPITAL B
+    0x1D672: 'C',  # MATHEMATICAL MONOSPACE CAPITAL C
+    0x1D673: 'D',  # MATHEMATICAL MONOSPACE CAPITAL D
+    0x1D674: 'E',  # MATHEMATICAL MONOSPACE CAPITAL E
+    0x1D675: 'F',  # MATHEMATICAL MONOSPACE CAPITAL F
+    0x1D676: 'G',  # MATHEMATICAL MONOSPACE CAPITAL G
+    0x1D677: 'H',  # MATHEMATICAL MONOSPACE CAPITAL H
+    0x1D678: 'I',  # MATHEMATICAL MONOSPACE CAPITAL I
+    0x1D679: 'J',  # MATHEMATICAL MONOSPACE CAPITAL J
+    0x1D67A: 'K',  # MATHEMATICAL MONOSPACE CAPITAL K
+    0x1D67B: 'L',  # MATHEMATICAL MONOSPACE CAPITAL L
+    0x1D67C: 'M',  # MATHEMATICAL MONOSPACE CAPITAL M
+    0x1D67D: 'N',  # MATHEMATICAL MONOSPACE CAPITAL N
+    0x1D67E: 'O',  # MATHEMATICAL MONOSPACE CAPITAL O
+    0x1D67F: 'P',  # MATHEMATICAL MONOSPACE CAPITAL P
+    0x1D680: 'Q',  # MATHEMATICAL MONOSPACE CAPITAL Q
+    0x1D681: 'R',  # MATHEMATICAL MONOSPACE CAPITAL R
+    0x1D682: 'S',  # MATHEMATICAL MONOSPACE CAPITAL S
+    0x1D683: 'T',  # MATHEMATICAL MONOSPACE CAPITAL T
+    0x1D684: 'U',  # MATHEMATICAL MONOSPACE CAPITAL U
+    0x1D685: 'V',  # MATHEMATICAL MONOSPACE CAPITAL V
+    0x1D686: 'W',  # MATHEMATICAL MONOSPACE CAPITAL W
+    0x1D687: 'X',  # MATHEMATICAL MONOSPACE CAPITAL X
+    0x1D688: 'Y',  # MATHEMATICAL MONOSPACE CAPITAL Y
+    0x1D689: 'Z',  # MATHEMATICAL MONOSPACE CAPITAL Z
+    0x1D68A: 'a',  # MATHEMATICAL MONOSPACE SMALL A
+    0x1D68B: 'b',  # MATHEMATICAL MONOSPACE SMALL B
+    0x1D68C: 'c',  # MATHEMATICAL MONOSPACE SMALL C
+    0x1D68D: 'd',  # MATHEMATICAL MONOSPACE SMALL D
+    0x1D68E: 'e',  # MATHEMATICAL MONOSPACE SMALL E
+    0x1D68F: 'f',  # MATHEMATICAL MONOSPACE SMALL F
+    0x1D690: 'g',  # MATHEMATICAL MONOSPACE SMALL G
+    0x1D691: 'h',  # MATHEMATICAL MONOSPACE SMALL H
+    0x1D692: 'i',  # MATHEMATICAL MONOSPACE SMALL I
+    0x1D693: 'j',  # MATHEMATICAL MONOSPACE SMALL J
+    0x1D694: 'k',  # MATHEMATICAL MONOSPACE SMALL K
+    0x1D695: 'l',  # MATHEMATICAL MONOSPACE SMALL L
+    0x1D696: 'm',  # MATHEMATICAL MONOSPACE SMALL M
+    0x1D697: 'n',  # MATHEMATICAL MONOSPACE SMALL N
+    0x1D698: 'o',  # MATHEMATICAL MONOSPACE SMALL O
+    0x1D699: 'p',  # MATHEMATICAL MONOSPACE SMALL P
+    0x1D69A: 'q',  # MATHEMATICAL MONOSPACE SMALL Q
+    0x1D69B: 'r',  # MATHEMATICAL MONOSPACE SMALL R
+    0x1D69C: 's',  # MATHEMATICAL MONOSPACE SMALL S
+    0x1D69D: 't',  # MATHEMATICAL MONOSPACE SMALL T
+    0x1D69E: 'u',  # MATHEMATICAL MONOSPACE SMALL U
+    0x1D69F: 'v',  # MATHEMATICAL MONOSPACE SMALL V
+    0x1D6A0: 'w',  # MATHEMATICAL MONOSPACE SMALL W
+    0x1D6A1: 'x',  # MATHEMATICAL MONOSPACE SMALL X
+    0x1D6A2: 'y',  # MATHEMATICAL MONOSPACE SMALL Y
+    0x1D6A3: 'z',  # MATHEMATICAL MONOSPACE SMALL Z
+    0x1D7CE: '0',  # MATHEMATICAL BOLD DIGIT ZERO
+    0x1D7CF: '1',  # MATHEMATICAL BOLD DIGIT ONE
+    0x1D7D0: '2',  # MATHEMATICAL BOLD DIGIT TWO
+    0x1D7D1: '3',  # MATHEMATICAL BOLD DIGIT THREE
+    0x1D7D2: '4',  # MATHEMATICAL BOLD DIGIT FOUR
+    0x1D7D3: '5',  # MATHEMATICAL BOLD DIGIT FIVE
+    0x1D7D4: '6',  # MATHEMATICAL BOLD DIGIT SIX
+    0x1D7D5: '7',  # MATHEMATICAL BOLD DIGIT SEVEN
+    0x1D7D6: '8',  # MATHEMATICAL BOLD DIGIT EIGHT
+    0x1D7D7: '9',  # MATHEMATICAL BOLD DIGIT NINE
+    0x1D7D8: '0',  # MATHEMATICAL DOUBLE-STRUCK DIGIT ZERO
+    0x1D7D9: '1',  # MATHEMATICAL DOUBLE-STRUCK DIGIT ONE
+    0x1D7DA: '2',  # MATHEMATICAL DOUBLE-STRUCK DIGIT TWO
+    0x1D7DB: '3',  # MATHEMATICAL DOUBLE-STRUCK DIGIT THREE
+    0x1D7DC: '4',  # MATHEMATICAL DOUBLE-STRUCK DIGIT FOUR
+    0x1D7DD: '5',  # MATHEMATICAL DOUBLE-STRUCK DIGIT FIVE
+    0x1D7DE: '6',  # MATHEMATICAL DOUBLE-STRUCK DIGIT SIX
+    0x1D7DF: '7',  # MATHEMATICAL DOUBLE-STRUCK DIGIT SEVEN
+    0x1D7E0: '8',  # MATHEMATICAL DOUBLE-STRUCK DIGIT EIGHT
+    0x1D7E1: '9',  # MATHEMATICAL DOUBLE-STRUCK DIGIT NINE
+    0x1D7E2: '0',  # MATHEMATICAL SANS-SERIF DIGIT ZERO
+    0x1D7E3: '1',  # MATHEMATICAL SANS-SERIF DIGIT ONE
+    0x1D7E4: '2',  # MATHEMATICAL SANS-SERIF DIGIT TWO
+    0x1D7E5: '3',  # MATHEMATICAL SANS-SERIF DIGIT THREE
+    0x1D7E6: '4',  # MATHEMATICAL SANS-SERIF DIGIT FOUR
+    0x1D7E7: '5',  # MATHEMATICAL SANS-SERIF DIGIT FIVE
+    0x1D7E8: '6',  # MATHEMATICAL SANS-SERIF DIGIT SIX
+    0x1D7E9: '7',  # MATHEMATICAL SANS-SERIF DIGIT SEVEN
+    0x1D7EA: '8',  # MATHEMATICAL SANS-SERIF DIGIT EIGHT
+    0x1D7EB: '9',  # MATHEMATICAL SANS-SERIF DIGIT NINE
+    0x1D7EC: '0',  # MATHEMATICAL SANS-SERIF BOLD DIGIT ZERO
+    0x1D7ED: '1',  # MATHEMATICAL SANS-SERIF BOLD DIGIT ONE
+    0x1D7EE: '2',  # MATHEMATICAL SANS-SERIF BOLD DIGIT TWO
+    0x1D7EF: '3',  # MATHEMATICAL SANS-SERIF BOLD DIGIT THREE
+    0x1D7F0: '4',  # MATHEMATICAL SANS-SERIF BOLD DIGIT FOUR
+    0x1D7F1: '5',  # MATHEMATICAL SANS-SERIF BOLD DIGIT FIVE
+    0x1D7F2: '6',  # MATHEMATICAL SANS-SERIF BOLD DIGIT SIX
+    0x1D7F3: '7',  # MATHEMATICAL SANS-SERIF BOLD DIGIT SEVEN
+    0x1D7F4: '8',  # MATHEMATICAL SANS-SERIF BOLD DIGIT EIGHT
+    0x1D7F5: '9',  # MATHEMATICAL SANS-SERIF BOLD DIGIT NINE
+    0x1D7F6: '0',  # MATHEMATICAL MONOSPACE DIGIT ZERO
+    0x1D7F7: '1',  # MATHEMATICAL MONOSPACE DIGIT ONE
+    0x1D7F8: '2',  # MATHEMATICAL MONOSPACE DIGIT TWO
+    0x1D7F9: '3',  # MATHEMATICAL MONOSPACE DIGIT THREE
+    0x1D7FA: '4',  # MATHEMATICAL MONOSPACE DIGIT FOUR
+    0x1D7FB: '5',  # MATHEMATICAL MONOSPACE DIGIT FIVE
+    0x1D7FC: '6',  # MATHEMATICAL MONOSPACE DIGIT SIX
+    0x1D7FD: '7',  # MATHEMATICAL MONOSPACE DIGIT SEVEN
+    0x1D7FE: '8',  # MATHEMATICAL MONOSPACE DIGIT EIGHT
+    0x1D7FF: '9',  # MATHEMATICAL MONOSPACE DIGIT NINE
+    0x1F12B: 'C',  # CIRCLED ITALIC LATIN CAPITAL LETTER C
+    0x1F12C: 'R',  # CIRCLED ITALIC LATIN CAPITAL LETTER R
+    0x1F130: 'A',  # SQUARED LATIN CAPITAL LETTER A
+    0x1F131: 'B',  # SQUARED LATIN CAPITAL LETTER B
+    0x1F132: 'C',  # SQUARED LATIN CAPITAL LETTER C
+    0x1F133: 'D',  # SQUARED LATIN CAPITAL LETTER D
+    0x1F134: 'E',  # SQUARED LATIN CAPITAL LETTER E
+    0x1F135: 'F',  # SQUARED LATIN CAPITAL LETTER F
+    0x1F136: 'G',  # SQUARED LATIN CAPITAL LETTER G
+    0x1F137: 'H',  # SQUARED LATIN CAPITAL LETTER H
+    0x1F138: 'I',  # SQUARED LATIN CAPITAL LETTER I
+    0x1F139: 'J',  # SQUARED LATIN CAPITAL LETTER J
+    0x1F13A: 'K',  # SQUARED LATIN CAPITAL LETTER K
+    0x1F13B: 'L',  # SQUARED LATIN CAPITAL LETTER L
+    0x1F13C: 'M',  # SQUARED LATIN CAPITAL LETTER M
+    0x1F13D: 'N',  # SQUARED LATIN CAPITAL LETTER N
+    0x1F13E: 'O',  # SQUARED LATIN CAPITAL LETTER O
+    0x1F13F: 'P',  # SQUARED LATIN CAPITAL LETTER P
+    0x1F140: 'Q',  # SQUARED LATIN CAPITAL LETTER Q
+    0x1F141: 'R',  # SQUARED LATIN CAPITAL LETTER R
+    0x1F142: 'S',  # SQUARED LATIN CAPITAL LETTER S
+    0x1F143: 'T',  # SQUARED LATIN CAPITAL LETTER T
+    0x1F144: 'U',  # SQUARED LATIN CAPITAL LETTER U
+    0x1F145: 'V',  # SQUARED LATIN CAPITAL LETTER V
+    0x1F146: 'W',  # SQUARED LATIN CAPITAL LETTER W
+    0x1F147: 'X',  # SQUARED LATIN CAPITAL LETTER X
+    0x1F148: 'Y',  # SQUARED LATIN CAPITAL LETTER Y
+    0x1F149: 'Z',  # SQUARED LATIN CAPITAL LETTER Z
+    0x1FBF0: '0',  # SEGMENTED DIGIT ZERO
+    0x1FBF1: '1',  # SEGMENTED DIGIT ONE
+    0x1FBF2: '2',  # SEGMENTED DIGIT TWO
+    0x1FBF3: '3',  # SEGMENTED DIGIT THREE
+    0x1FBF4: '4',  # SEGMENTED DIGIT FOUR
+    0x1FBF5: '5',  # SEGMENTED DIGIT FIVE
+    0x1FBF6: '6',  # SEGMENTED DIGIT SIX
+    0x1FBF7: '7',  # SEGMENTED DIGIT SEVEN
+    0x1FBF8: '8',  # SEGMENTED DIGIT EIGHT
+    0x1FBF9: '9',  # SEGMENTED DIGIT NINE
+}
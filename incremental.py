@@ -0,0 +1,105 @@
+"""
+Incremental password extraction over a growing Merlin reply
+
+Merlin's blockquote renders progressively. IncrementalExtractor is fed the
+text as it grows and tracks the first closed quoted word, which is where
+the level 1–3 answer sits. Once that word has held steady for a few
+updates, the full rule-based extractor runs on the text rendered so far,
+while the rest of the reply is still arriving. finish() reuses that
+result unless reply content (not just the signature) was added after it
+ran, so in the usual case no extraction pass runs after the reply
+completes.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+QUOTED_RE = re.compile(r'"([A-Za-z0-9]+)"')
+SIGNATURE_RE = re.compile(r'\s*(?:–\s*Merlin)?\s*')
+
+# Levels whose answer is a quoted word (plain or reversed)
+LEVELS = (1, 2, 3)
+
+
+class IncrementalExtractor:
+    def __init__(self, extractor, level, stable_updates=2):
+        self.extractor = extractor  # PasswordExtractor running the rule-based pipeline
+        self.level = level
+        self.stable_updates = stable_updates
+
+        self.text = ""
+        self._quoted = None
+        self._stable = 0
+        self.provisional = None
+        self.provisional_history = []
+        self.checked_text = None  # text the rule pipeline last ran on
+        self.confirmed = None
+        self.rechecked = False
+
+    # ─────────────────────────────
+    # Feeding
+    # ─────────────────────────────
+    def update(self, full_text):
+        """Feed the current blockquote text; only the new suffix is processed"""
+        if full_text is None:
+            return self.provisional
+        if full_text.startswith(self.text):
+            return self.feed(full_text[len(self.text):])
+        # The element was re-rendered with different content: start over
+        self._reset()
+        return self.feed(full_text)
+
+    def feed(self, chunk):
+        """Append a chunk of reply text and return the current provisional candidate"""
+        if self.level not in LEVELS:
+            self.text += chunk or ""
+            return None
+        if chunk:
+            self.text += chunk
+            if self._quoted is None:
+                match = QUOTED_RE.search(self.text)
+                if match:
+                    self._quoted = match.group(1)
+
+        if self._quoted:
+            self._stable += 1
+        if self._quoted and self._stable >= self.stable_updates and self.checked_text is None:
+            self._check(self.text)
+            self.provisional = self.confirmed
+            if self.provisional:
+                self.provisional_history.append(self.provisional)
+                logger.info(f"⚡ Provisional level {self.level} candidate: '{self.provisional}'")
+        return self.provisional
+
+    def _check(self, text):
+        self.checked_text = text
+        self.confirmed = self.extractor.rule_based(self.level, text)
+
+    def _reset(self):
+        self.text = ""
+        self._quoted = None
+        self._stable = 0
+        self.provisional = None
+        self.checked_text = None
+        self.confirmed = None
+
+    # ─────────────────────────────
+    # Completion
+    # ─────────────────────────────
+    def finish(self, final_text):
+        """The reply is complete: the answer extracted while it rendered, re-checked only if content followed"""
+        self.update(final_text)
+        if self.checked_text is not None and final_text.startswith(self.checked_text) \
+                and SIGNATURE_RE.fullmatch(final_text[len(self.checked_text):]):
+            if self.confirmed:
+                logger.info(f"⚡ Provisional candidate '{self.confirmed}' extracted while the reply rendered")
+            return self.confirmed
+
+        previous = self.confirmed
+        self.rechecked = True
+        self._check(final_text)
+        if previous and previous != self.confirmed:
+            logger.info(f"⚡ Provisional candidate '{previous}' replaced by '{self.confirmed}'")
+        return self.confirmed
@@ -0,0 +1,84 @@
+"""
+Deferred loading of heavy optional dependencies
+
+The extraction core (rule pipeline, dictionary, caches) imports only the
+standard library. Selenium, webdriver_manager, the OpenAI/Groq SDKs and
+python-dotenv are loaded on first use through the proxies below, so
+extractor-only batch workers and replay jobs never pay for them.
+"""
+
+import importlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class LazyObject:
+    """Stand-in that builds the real object on first attribute access or call"""
+
+    def __init__(self, factory, name):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self):
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = self._factory()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def loaded(self):
+        return self._target is not None
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy {self._name} ({state})>"
+
+
+def _import(module, attr=None):
+    target = importlib.import_module(module)
+    return getattr(target, attr) if attr else target
+
+
+class LazyImport(LazyObject):
+    """A module, or one name from it, imported on first use"""
+
+    def __init__(self, module, attr=None):
+        super().__init__(lambda: _import(module, attr), f"{module}.{attr}" if attr else module)
+
+
+# ─────────────────────────────
+# .env loading
+# ─────────────────────────────
+_env_loaded = False
+_env_lock = threading.Lock()
+
+
+def load_env():
+    """Load .env once per process (python-dotenv is optional)"""
+    global _env_loaded
+    with _env_lock:
+        if _env_loaded:
+            return
+        _env_loaded = True
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            return  # dotenv not installed, that's okay
+        load_dotenv()
@@ -0,0 +1,192 @@
+"""
+Content-addressed cache for LLM extraction results
+
+Two tiers: an in-memory LRU in front of an on-disk SQLite table that is
+shared by every agent process on the machine. Entries expire after a TTL
+and the disk tier is trimmed (least recently used first) once it grows
+past its entry or byte budget.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from storage import connect, data_path
+
+logger = logging.getLogger(__name__)
+
+# Returned by LLMCache.get when there is no usable entry. A cached
+# negative result is returned as None, so callers must compare against MISS.
+MISS = object()
+
+POSITIVE = "positive"
+NEGATIVE = "negative"
+
+
+class LLMCache:
+    def __init__(self, path=None, memory_size=512, ttl=7 * 24 * 3600,
+                 negative_ttl=3600, max_entries=10000, max_bytes=16 * 1024 * 1024):
+        self.path = path or data_path("llm_cache.sqlite")
+        self.memory_size = memory_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._memory = OrderedDict()  # key -> (expires_at, kind, value)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._conn = connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " value TEXT,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache (last_access)")
+
+    @classmethod
+    def from_env(cls):
+        """Build the cache from environment settings, or None when disabled"""
+        if os.getenv("LLM_CACHE_DISABLE", "").lower() in ("1", "true", "yes"):
+            return None
+        try:
+            return cls(
+                path=os.getenv("LLM_CACHE_PATH") or None,
+                ttl=float(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600)),
+                negative_ttl=float(os.getenv("LLM_CACHE_NEGATIVE_TTL", 3600)),
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", 10000)),
+            )
+        except Exception as e:
+            logger.error(f"Failed to open LLM cache: {e}")
+            return None
+
+    @staticmethod
+    def make_key(model, system_msg, user_msg, **params):
+        """Hash everything that can change the model's answer into a cache key"""
+        payload = json.dumps(
+            {"model": model, "system": system_msg, "user": user_msg, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ─────────────────────────────
+    # Lookups
+    # ─────────────────────────────
+    def get(self, key):
+        """Return the cached value (None for a negative entry) or MISS"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, kind, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats["hits"] += 1
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            try:
+                row = self._conn.execute(
+                    "SELECT kind, value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except Exception as e:
+                logger.debug(f"LLM cache read failed: {e}")
+                row = None
+
+            if row is None or row[2] <= now:
+                self.stats["misses"] += 1
+                return MISS
+
+            kind, raw, expires_at = row
+            value = json.loads(raw) if kind == POSITIVE else None
+            self._remember(key, expires_at, kind, value)
+            try:
+                self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            except Exception as e:
+                logger.debug(f"LLM cache touch failed: {e}")
+            self.stats["hits"] += 1
+            self.stats["disk_hits"] += 1
+            return value
+
+    def put(self, key, value, ttl=None):
+        """Store a usable result"""
+        self._store(key, POSITIVE, value, self.ttl if ttl is None else ttl)
+
+    def put_negative(self, key, ttl=None):
+        """Remember that this exact request produced nothing usable"""
+        self._store(key, NEGATIVE, None, self.negative_ttl if ttl is None else ttl)
+
+    def delete(self, key):
+        """Drop an entry from both tiers, e.g. an answer the game has since rejected"""
+        with self._lock:
+            self._memory.pop(key, None)
+            try:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            except Exception as e:
+                logger.debug(f"LLM cache delete failed: {e}")
+
+    # ─────────────────────────────
+    # Internals
+    # ─────────────────────────────
+    def _remember(self, key, expires_at, kind, value):
+        self._memory[key] = (expires_at, kind, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _store(self, key, kind, value, ttl):
+        now = time.time()
+        expires_at = now + ttl
+        raw = json.dumps(value) if kind == POSITIVE else None
+        size = len(key) + (len(raw) if raw else 0)
+        with self._lock:
+            self._remember(key, expires_at, kind, value)
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, kind, value, size, created_at, expires_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, raw, size, now, expires_at, now),
+                )
+                self._evict(now)
+            except Exception as e:
+                logger.debug(f"LLM cache write failed: {e}")
+
+    def _evict(self, now):
+        """Drop expired rows, then least recently used rows past the size budget"""
+        removed = self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if count > self.max_entries or total > self.max_bytes:
+            # Trim to 90% of the budget so we don't evict on every insert
+            keep_entries = int(self.max_entries * 0.9)
+            keep_bytes = int(self.max_bytes * 0.9)
+            rows = self._conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access DESC").fetchall()
+            kept, kept_bytes, doomed = 0, 0, []
+            for key, size in rows:
+                if kept < keep_entries and kept_bytes + size <= keep_bytes:
+                    kept += 1
+                    kept_bytes += size
+                else:
+                    doomed.append((key,))
+            self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", doomed)
+            removed += len(doomed)
+
+        if removed:
+            self.stats["evictions"] += removed
+            logger.debug(f"💾 LLM cache evicted {removed} entries")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,174 +1,238 @@
 import re
 import logging
-from dotenv import load_dotenv
+import threading
+import time
 import os
 
+import metrics
+from lazy import LazyObject, load_env
+from llm_cache import LLMCache, MISS
+from llm_router import DEFAULT_MODELS, provider_model
+from rate_limiter import NORMAL, backoff_delay, get_limiter, is_rate_limited, retry_after
+from strategies import ResponseView, registry as strategy_registry
+
 logger = logging.getLogger(__name__)
 
+class StreamWordDetector:
+    """Spot finished candidate words in a streamed completion as tokens arrive
+
+    `is_valid` decides which finished words count; the rest are skipped and
+    the scan moves on to the next word.
+    """
+
+    WORD_RE = re.compile(r"[^\W\d_]+")
+    # A word followed by one of these is being rewritten ("ARUORA → AURORA")
+    CHAIN_MARKERS = ("=", "→", "->", "+")
+    # A word followed by one of these is a label ("ANSWER: GLIMMER"), never a candidate
+    LABEL_MARKERS = (":",)
+    # A word followed by one of these is finished
+    TERMINATORS = ("\n", ",", ".", ";", ")", "!", "?", "(")
+
+    def __init__(self, is_valid):
+        self.is_valid = is_valid
+        self.buffer = ""
+        self.decided = 0  # number of words in buffer already accepted or skipped
+
+    def feed(self, delta):
+        """Add streamed text and return any words that became final"""
+        self.buffer += delta.upper()
+        return self._scan(final=False)
+
+    def finish(self):
+        """The stream ended: whatever word is still open is final"""
+        return self._scan(final=True)
+
+    def _scan(self, final):
+        matches = list(self.WORD_RE.finditer(self.buffer))
+        finished = []
+        while self.decided < len(matches):
+            match = matches[self.decided]
+            is_last = self.decided == len(matches) - 1
+            tail = self.buffer[match.end():matches[self.decided + 1].start()] if not is_last else self.buffer[match.end():]
+
+            labelled = any(m in tail for m in self.LABEL_MARKERS)
+            if is_last and not final and not labelled and not any(t in tail for t in self.TERMINATORS):
+                break  # word (or its delimiter) may still grow
+
+            self.decided += 1
+            superseded = labelled or any(m in tail for m in self.CHAIN_MARKERS) or (
+                not is_last and not any(t in tail for t in self.TERMINATORS)
+            )
+            word = match.group(0)
+            if not superseded and self.is_valid(word):
+                finished.append(word)
+        return finished
+
+# ─────────────────────────────
+# Rule-based extraction core (compiled once, no per-item logging)
+# ─────────────────────────────
+def rule_hits(level, response):
+    """Yield (word, strategy name) from the level's strategy pipeline, in precedence order
+
+    The first hit is rule_based's answer; later hits are ranked alternatives.
+    `response` is the raw text or an already built ResponseView.
+    """
+    for word, strategy in strategy_registry.hits(level, response):
+        yield word, strategy.name
+
+
+def tagged_candidates(level, response):
+    """Every distinct rule-based candidate as {"word", "confidence", "strategy"}, best first"""
+    results = []
+    seen = set()
+    for rank, (word, strategy) in enumerate(strategy_registry.hits(level, response or "")):
+        if word in seen:
+            continue
+        seen.add(word)
+        # The precedence winner keeps its prior; later hits decay with rank
+        confidence = strategy.confidence * (0.8 ** rank)
+        results.append({"word": word, "confidence": round(confidence, 4), "strategy": strategy.name})
+    return results
+
+
+def _extract_chunk(level, start, chunk):
+    return [_batch_result(level, start + offset, response) for offset, response in enumerate(chunk)]
+
+
+def _batch_result(level, index, response):
+    candidates = tagged_candidates(level, response) if response else []
+    return {
+        "index": index,
+        "password": candidates[0]["word"] if candidates else None,
+        "candidates": candidates,
+    }
+
+
+def _chunks(responses, chunk_size):
+    chunk, start = [], 0
+    for response in responses:
+        chunk.append(response)
+        if len(chunk) >= chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def extract_many(level, responses, workers=None, chunk_size=256, window=4):
+    """Rule-based extraction over any iterable of responses, yielded in input order
+
+    Each result is {"index", "password", "candidates"} where candidates carry a
+    confidence and the strategy that produced them. With workers > 1 chunks are
+    fanned out to a process pool, keeping at most window * workers chunks in
+    flight so memory stays flat on arbitrarily long inputs.
+    """
+    if not workers or workers <= 1:
+        for index, response in enumerate(responses):
+            yield _batch_result(level, index, response)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for start, chunk in _chunks(responses, chunk_size):
+            in_flight.append(pool.submit(_extract_chunk, level, start, chunk))
+            if len(in_flight) >= window * workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
 class PasswordExtractor:
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, cache=None):
         self.llm = llm_client  # Optional AI fallback
-        load_dotenv()
+        self.model = "gpt-4o"
+        self.cache = cache  # Optional LLMCache shared across calls
+        self.async_pool = None  # Optional AsyncLLMPool for the asyncio path
+        self.async_provider = None
+        self.strategies = strategy_registry
+        self.last_rule_hit = None  # (word, strategy) of the latest rule-based answer
+        self.llm_answers = {}  # LLM word -> cache key it was stored under, until the game's verdict
+        self._answers_lock = threading.Lock()  # speculative calls remember answers from executor threads
+        self.rate_limiter = None  # Optional RateLimiter shared with other processes
+        self.rate_key = None  # bucket for self.llm; None when the client limits per provider itself
+        self.rate_priority = NORMAL  # this session's claim on scarce tokens (see set_rate_priority)
+        self.rate_limit_retries = int(os.getenv("RATE_LIMIT_RETRIES", "2"))
+        # Stream completions and stop at the first valid word(s)
+        self.stream = os.getenv("LLM_STREAM", "").lower() in ("1", "true", "yes")
 
     # ─────────────────────────────
     # Rule-based extraction
     # ─────────────────────────────
     def rule_based(self, level, response):
         logger.info(f"🔧 Using rule-based extraction for level {level}")
-        
-        # Special handling for blocking responses
-        if any(phrase in response.lower() for phrase in ["cannot comply", "manipulation attempt", "blocked", "detected"]):
-            logger.info("🚫 Detected blocking response, trying alternative extraction")
-            # Look for any words that might be passwords
-            words = re.findall(r'\b[A-Za-z]{4,}\b', response)
-            if words:
-                # Try to find the most likely password word
-                for word in sorted(words, key=len, reverse=True):
-                    if len(word) >= 4 and word.upper() not in ["MERLIN", "CANNOT", "COMPLY", "DETECTED", "MANIPULATION", "ATTEMPT", "BLOCKED"]:
-                        logger.info(f"🎯 Extracted from blocking response: '{word.upper()}'")
-                        return word.upper()
-        
-        # Level 1: Look for quoted words first, then standalone uppercase words
-        if level == 1:
-            # Remove the Merlin signature first
-            clean_response = re.sub(r'\s*–\s*Merlin\s*$', '', response).strip()
-            
-            # Try quoted words first (including mixed case)
-            quoted = re.findall(r'"([A-Za-z0-9]+)"', clean_response)
-            if quoted:
-                logger.info(f"📝 Found quoted word: '{quoted[0]}'")
-                return quoted[0].upper()
-            
-            # Try standalone uppercase words (4+ chars)
-            uppercase = re.findall(r'\b[A-Z]{4,}\b', clean_response)
-            if uppercase:
-                logger.info(f"📝 Found uppercase word: '{uppercase[0]}'")
-                return uppercase[0]
-            
-            # Try capitalized words (proper nouns) - first letter uppercase, but exclude "Merlin"
-            capitalized = re.findall(r'\b[A-Z][a-z]{3,}\b', clean_response)
-            for word in capitalized:
-                if word.lower() != 'merlin':  # Exclude Merlin from signature
-                    logger.info(f"📝 Found capitalized word: '{word}'")
-                    return word.upper()
-            
-            # Fallback to any word after comma (but exclude common words)
-            comma_words = re.findall(r',\s*([A-Za-z]{3,})', clean_response)
-            common_words = {'the', 'and', 'or', 'but', 'for', 'with', 'from'}
-            for word in comma_words:
-                if word.lower() not in common_words:
-                    logger.info(f"📝 Found word after comma: '{word}'")
-                    return word.upper()
-        
-        # Levels 2–3: always reverse the captured word
-        if level in [2, 3]:
-            # Remove the Merlin signature first
-            clean_response = re.sub(r'\s*–\s*Merlin\s*$', '', response).strip()
-            
-            # Try quoted words first (most reliable)
-            quoted = re.findall(r'"([A-Za-z0-9]+)"', clean_response)
-            if quoted:
-                reversed_word = quoted[0][::-1].upper()
-                logger.info(f"🔄 Reversed quoted word '{quoted[0]}' → '{reversed_word}'")
-                return reversed_word
-            
-            # Try standalone uppercase words (4+ chars)
-            uppercase = re.findall(r'\b[A-Z]{4,}\b', clean_response)
-            if uppercase:
-                reversed_word = uppercase[0][::-1].upper()
-                logger.info(f"🔄 Reversed uppercase word '{uppercase[0]}' → '{reversed_word}'")
-                return reversed_word
-            
-            # Fallback: find words (excluding "Merlin" from signature) - handle mixed Latin/Cyrillic
-            words = re.findall(r"\b[A-Za-zА-Яа-я]{3,}\b", clean_response)
-            # Filter out common words
-            common_words = {'the', 'password', 'is', 'secret', 'word', 'phrase'}
-            filtered_words = [word for word in words if word.lower() not in common_words]
-            
-            if len(filtered_words) == 1:
-                reversed_word = filtered_words[0][::-1].upper()
-                logger.info(f"🔄 Reversed filtered word '{filtered_words[0]}' → '{reversed_word}'")
-                return reversed_word
-            elif len(filtered_words) > 1:
-                # Multiple words - concatenate and then reverse
-                concatenated = "".join(filtered_words)
-                reversed_word = concatenated[::-1].upper()
-                logger.info(f"🔄 Concatenated '{' '.join(filtered_words)}' → '{concatenated}', reversed → '{reversed_word}'")
-                return reversed_word
-
-        # Levels 4–6: acrostic poem → first letters of each line
-        if level in [4, 5, 6]:
-            # Try splitting by lines first
-            lines = response.splitlines()
-            if len(lines) > 1:
-                acrostic = "".join(line.strip()[0] for line in lines if line.strip())
-                if acrostic:
-                    logger.info(f"📝 Acrostic from {len(lines)} lines: '{acrostic}'")
-                    return acrostic.upper()
-            
-            # Fallback: try splitting by commas (common in Level 6)
-            if ',' in response:
-                lines = response.split(', ')
-                acrostic = "".join(line.strip()[0] for line in lines if line.strip())
-                if acrostic:
-                    logger.info(f"📝 Acrostic from comma-separated lines: '{acrostic}'")
-                    return acrostic.upper()
-
-        # Level 7: try multiple extraction methods
-        if level == 7:
-            lines = response.splitlines()
-            
-            # Method 1: First letters of each line (acrostic)
-            acrostic = "".join(line.strip()[0] for line in lines if line.strip())
-            
-            # Method 2: First letters of last words
-            last_word_letters = "".join(line.strip().split()[-1][0] for line in lines if line.strip())
-            
-            # Method 3: Try comma-separated lines (like Level 6)
-            if ',' in response:
-                comma_lines = response.split(', ')
-                comma_acrostic = "".join(line.strip()[0] for line in comma_lines if line.strip())
-                if len(comma_acrostic) >= 3:
-                    logger.info(f"🎵 Level 7 comma acrostic: '{comma_acrostic}'")
-                    return comma_acrostic.upper()
-            
-            # Method 4: Look for quoted words or obvious passwords
-            quoted_words = re.findall(r'"([A-Za-z]+)"', response)
-            if quoted_words:
-                longest_quoted = max(quoted_words, key=len).upper()
-                if len(longest_quoted) >= 3:
-                    logger.info(f"🎵 Level 7 quoted word: '{longest_quoted}'")
-                    return longest_quoted
-            
-            # Method 5: Look for all caps words
-            caps_words = re.findall(r'\b[A-Z]{3,}\b', response)
-            if caps_words:
-                longest_caps = max(caps_words, key=len)
-                logger.info(f"🎵 Level 7 caps word: '{longest_caps}'")
-                return longest_caps
-            
-            # Choose the longer/more likely word from acrostic methods
-            # Prioritize acrostic if it's longer or same length
-            if len(acrostic) >= len(last_word_letters) and len(acrostic) >= 3:
-                logger.info(f"🎵 Level 7 acrostic: '{acrostic}'")
-                return acrostic.upper()
-            elif len(last_word_letters) >= 3:
-                logger.info(f"🎵 Level 7 last words: '{last_word_letters}'")
-                return last_word_letters.upper()
-            elif acrostic:
-                logger.info(f"🎵 Level 7 fallback acrostic: '{acrostic}'")
-                return acrostic.upper()
-
-        # Default fallback → pick longest word (letters only for safety)
-        candidates = re.findall(r"\b[A-Za-z]{3,}\b", response)
-        if candidates:
-            longest = max(candidates, key=len).upper()
-            logger.info(f"📋 Fallback: longest word '{longest}'")
-            return longest
+        view = ResponseView(response)
+        if view.mapped:
+            logger.info(f"🔡 Normalized look-alike characters: {view.mapped}")
+        if view.truncated:
+            logger.warning(f"✂️ Response truncated to {len(view.response)} of {len(view.raw)} chars for extraction")
+        for word, strategy in rule_hits(level, view):
+            logger.info(f"📝 {strategy}: '{word}'")
+            self.last_rule_hit = (word, strategy)
+            return word
 
         logger.warning("❌ No password found in response")
         return None
 
+    def local_corrections(self, level, response, limit=3, sources=3):
+        """(word, distance) for dictionary words spelled by the top rule-based readings, best first
+
+        Distance 0 is an exact anagram of a reading, 1 a word with one letter
+        more or fewer. No LLM call is involved.
+        """
+        try:
+            from anagram_index import get_index
+        except ImportError:
+            return []
+        index = get_index()
+        if index is None or not response:
+            return []
+
+        scored = {}
+        for rank, candidate in enumerate(tagged_candidates(level, response)[:sources]):
+            if candidate["strategy"] == "longest_word":
+                continue
+            for word, distance in index.lookup(candidate["word"]):
+                key = (distance, rank)
+                if word not in scored or key < scored[word]:
+                    scored[word] = key
+        corrections = [(word, scored[word][0]) for word in sorted(scored, key=lambda word: scored[word])[:limit]]
+        if corrections:
+            logger.info(f"🔤 Local corrections for level {level}: {corrections}")
+        return corrections
+
+    def record_rule_outcome(self, word, accepted):
+        """Credit the game's verdict on a rule-based answer to the strategy that produced it"""
+        if self.last_rule_hit and word and self.last_rule_hit[0] == word.upper():
+            self.strategies.record_outcome(self.last_rule_hit[1], accepted)
+
+    def rule_confidence(self, word):
+        """Trust in a rule-based answer: its strategy's prior, smoothed toward the game's verdicts so far"""
+        if not word or not self.last_rule_hit or self.last_rule_hit[0] != word.upper():
+            return 0.0
+        strategy = self.strategies.strategies.get(self.last_rule_hit[1])
+        if strategy is None:
+            return 0.0
+        return (strategy.correct + 2 * strategy.confidence) / (strategy.judged + 2)
+
+    def record_llm_outcome(self, word, accepted):
+        """A cached LLM answer the game rejected is dropped, so the next ask reaches the model again"""
+        with self._answers_lock:
+            cache_key = self.llm_answers.pop(word.upper(), None) if word else None
+            if cache_key and not accepted:
+                for other in [w for w, key in self.llm_answers.items() if key == cache_key]:
+                    del self.llm_answers[other]
+        if cache_key and not accepted and self.cache:
+            self.cache.delete(cache_key)
+            logger.info(f"💾 Dropped cached LLM answer '{word}' rejected by the game")
+
+    def extract_many(self, level, responses, workers=None, chunk_size=256, window=4):
+        """Rule-based extraction over a batch; see extract_many() at module level"""
+        return extract_many(level, responses, workers=workers, chunk_size=chunk_size, window=window)
+
     # ─────────────────────────────
     # AI fallback (use original game prompt)
     # ─────────────────────────────
@@ -178,6 +242,251 @@ class PasswordExtractor:
             return None
 
         logger.info(f"🧠 Using AI fallback for level {level}")
+        request = self._llm_request(level, response, k=1)
+        if self.stream:
+            return self._streamed_llm_call(*request, self._parse_llm_word, k=1)
+        return self._cached_llm_call(*request, self._parse_llm_word)
+
+    def llm_candidates(self, level, merlin_prompt, response, k=3):
+        """Ask for k ranked candidates in a single request instead of k sequential calls"""
+        if not self.llm:
+            logger.warning("🤖 No LLM client available for fallback")
+            return []
+
+        logger.info(f"🧠 Using AI fallback for level {level} ({k} candidates)")
+        request = self._llm_request(level, response, k=k)
+        parse = lambda result: self._parse_llm_candidates(result, k)
+        if self.stream:
+            candidates = self._streamed_llm_call(*request, parse, k=k)
+        else:
+            candidates = self._cached_llm_call(*request, parse)
+        return candidates or []
+
+    async def allm_fallback(self, level, merlin_prompt, response):
+        """Async variant of llm_fallback on the shared async client pool"""
+        if not self.async_pool:
+            logger.warning("🤖 No async LLM client available for fallback")
+            return None
+
+        logger.info(f"🧠 Using async AI fallback for level {level}")
+        request = self._llm_request(level, response, k=1)
+        return await self._acached_llm_call(*request, self._parse_llm_word)
+
+    async def allm_candidates(self, level, merlin_prompt, response, k=3):
+        """Async variant of llm_candidates on the shared async client pool"""
+        if not self.async_pool:
+            logger.warning("🤖 No async LLM client available for fallback")
+            return []
+
+        logger.info(f"🧠 Using async AI fallback for level {level} ({k} candidates)")
+        request = self._llm_request(level, response, k=k)
+        candidates = await self._acached_llm_call(*request, lambda result: self._parse_llm_candidates(result, k))
+        return candidates or []
+
+    def _llm_request(self, level, response, k=1):
+        """System message, user message and sampling parameters for one extraction call"""
+        system_msg = self._system_message(level, k=k)
+        user_msg = f"Level {level}\n{response}"
+        
+        logger.info(f"🤖 AI System Message: {system_msg}")
+        logger.info(f"🤖 AI User Message: {user_msg}")
+
+        params = {"temperature": 0.1, "max_tokens": 50 if k == 1 else max(50, 15 * k)}
+        return system_msg, user_msg, params
+
+    def _cached_llm_call(self, system_msg, user_msg, params, parse):
+        """Run one chat completion through the cache and parse its text"""
+        cache_key, cached = self._cache_lookup(system_msg, user_msg, params)
+        if cached is not MISS:
+            return cached
+
+        try:
+            completion = self._create_completion(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_msg},
+                    {"role": "user", "content": user_msg}
+                ],
+                timeout=10,
+                **params
+            )
+
+            result = completion.choices[0].message.content.strip().upper()
+            logger.info(f"🤖 AI extracted: '{result}'")
+            parsed = parse(result)
+            
+        except Exception as e:
+            logger.error(f"❌ AI fallback failed: {e}")
+            return None
+
+        self._cache_store(cache_key, parsed)
+        return parsed
+
+    def _streamed_llm_call(self, system_msg, user_msg, params, parse, k=1):
+        """Stream the completion and stop as soon as k valid words have been produced"""
+        # An early-stopped answer is not the full completion: keep it apart from non-streamed entries
+        cache_key, cached = self._cache_lookup(system_msg, user_msg, dict(params, stream=True))
+        if cached is not MISS:
+            return cached
+
+        # Only dictionary words end the stream early: a chatty preamble ("SURE, ...") is read past
+        detector = StreamWordDetector(self._is_dictionary_word)
+        words = []
+        text = ""
+        stream = None
+        try:
+            stream = self._create_completion(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_msg},
+                    {"role": "user", "content": user_msg}
+                ],
+                timeout=10,
+                stream=True,
+                **params
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                text += delta
+                for word in detector.feed(delta):
+                    if word not in words:
+                        words.append(word)
+                if len(words) >= k:
+                    logger.info(f"✂️ Stopping stream early after {len(text)} chars: {words}")
+                    break
+            else:
+                # Stream ran to completion: the last word is now final too
+                for word in detector.finish():
+                    if word not in words:
+                        words.append(word)
+
+        except Exception as e:
+            logger.error(f"❌ AI fallback failed: {e}")
+            return None
+        finally:
+            # Cancels the rest of the generation if we broke out early
+            if stream is not None and hasattr(stream, "close"):
+                stream.close()
+
+        logger.info(f"🤖 AI streamed: '{text.strip().upper()}'")
+        if words:
+            parsed = words[0] if k == 1 else words[:k]
+        else:
+            # No dictionary word: read the whole text as the non-streamed path would
+            parsed = parse(text.strip().upper())
+
+        self._cache_store(cache_key, parsed)
+        return parsed
+
+    def _create_completion(self, **kwargs):
+        """chat.completions.create behind the shared rate limiter, retrying 429s with backoff"""
+        attempt = 0
+        while True:
+            if self.rate_limiter and self.rate_key:
+                self.rate_limiter.acquire(self.rate_key, priority=self.rate_priority)
+            start = time.perf_counter()
+            try:
+                completion = self.llm.chat.completions.create(**kwargs)
+            except Exception as e:
+                limited = is_rate_limited(e)
+                self._record_llm_call("rate_limited" if limited else "error", start)
+                if not limited or attempt >= self.rate_limit_retries:
+                    raise
+                delay = backoff_delay(attempt, retry_after(e))
+                if self.rate_limiter and self.rate_key:
+                    # Every process backs off, not just this one
+                    self.rate_limiter.penalize(self.rate_key, delay)
+                logger.warning(f"🚦 {self.rate_key or 'LLM'} rate limited (429), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._record_llm_call("ok", start)
+            return completion
+
+    def _record_llm_call(self, outcome, start):
+        # The router records each provider it calls itself
+        if self.rate_key:
+            metrics.LLM_CALLS.inc(self.rate_key, outcome)
+            metrics.LLM_SECONDS.observe(time.perf_counter() - start, self.rate_key)
+
+    async def _acached_llm_call(self, system_msg, user_msg, params, parse):
+        """Async twin of _cached_llm_call on the async provider's own model"""
+        import asyncio  # only the async path pays for the event-loop machinery
+
+        loop = asyncio.get_running_loop()
+        model = provider_model(self.async_provider)
+        # The cache is SQLite: run it in the default executor, off the event loop
+        cache_key, cached = await loop.run_in_executor(
+            None, self._cache_lookup, system_msg, user_msg, params, model, self.async_provider
+        )
+        if cached is not MISS:
+            return cached
+
+        try:
+            completion = await self.async_pool.create(
+                self.async_provider,
+                priority=self.rate_priority,
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_msg},
+                    {"role": "user", "content": user_msg}
+                ],
+                timeout=10,
+                **params
+            )
+
+            result = completion.choices[0].message.content.strip().upper()
+            logger.info(f"🤖 AI extracted: '{result}'")
+            parsed = parse(result)
+
+        except Exception as e:
+            logger.error(f"❌ Async AI fallback failed: {e}")
+            return None
+
+        await loop.run_in_executor(None, self._cache_store, cache_key, parsed)
+        return parsed
+
+    def _cache_lookup(self, system_msg, user_msg, params, model=None, provider=None):
+        if not self.cache:
+            return None, MISS
+        cache_key = self.cache.make_key(model or self.model, system_msg, user_msg, **params)
+        cached = self.cache.get(cache_key)
+        metrics.LLM_CACHE.inc(provider or self.rate_key or "router", "miss" if cached is MISS else "hit")
+        if cached is not MISS:
+            logger.info(f"💾 LLM cache hit: {cached!r}")
+            self._remember_answers(cache_key, cached)
+        return cache_key, cached
+
+    def _cache_store(self, cache_key, parsed):
+        # Only completed calls are cached; transport errors are retried
+        if not self.cache:
+            return
+        if parsed:
+            self.cache.put(cache_key, parsed)
+            self._remember_answers(cache_key, parsed)
+        else:
+            self.cache.put_negative(cache_key)
+
+    def _remember_answers(self, cache_key, parsed):
+        words = parsed if isinstance(parsed, list) else [parsed]
+        with self._answers_lock:
+            for word in words:
+                if isinstance(word, str):
+                    self.llm_answers[word.upper()] = cache_key
+
+    def _system_message(self, level, k=1):
+        """Build the level-specific system prompt for the AI fallback"""
+        if k == 1:
+            count_rule = "- Output exactly ONE word, ALL CAPS.\n"
+            output_format = "Output: WORD"
+        else:
+            count_rule = (
+                f"- Output exactly {k} different candidate words, ALL CAPS, most likely first.\n"
+                "- Separate candidates with commas, no numbering or explanation.\n"
+            )
+            output_format = "Output: " + ", ".join(f"WORD{i + 1}" for i in range(k))
 
         # system_msg = (
         #     "Extract the game password from Merlin's reply.\n"
@@ -226,21 +535,21 @@ class PasswordExtractor:
         if level == 1:
                 system_msg = (
                     "You are an extractor for a puzzle game.\n"
-                    "CRITICAL RULES:\n"
-                    "- Output exactly ONE word, ALL CAPS.\n"
+                    "CRITICAL RULES:\n" +
+                    count_rule +
                     "- Level 1: Find the word that comes after 'The password is' and extract it.\n"
                     "- STRICT: ONLY generate valid English words.\n"
                     "- NEVER output invalid or misspelled words.\n"
                     "\n"
                     "EXAMPLE: 'The password is sacred' → SACRED\n"
-                    "\n"
-                    "Output: WORD"
+                    "\n" +
+                    output_format
                 )
         elif level in [2, 3]:
             system_msg = (
                 "You are an extractor for a puzzle game.\n"
-                "CRITICAL RULES:\n"
-                "- Output exactly ONE word, ALL CAPS.\n"
+                "CRITICAL RULES:\n" +
+                count_rule +
                 "- Levels 2-3: REVERSE the letters of the given word, then correct to a valid English word.\n"
                 "- STRICT: ONLY output words found in the English dictionary.\n"
                 "- CORRECT TYPOS: Fix spelling errors to make real words.\n"
@@ -253,14 +562,14 @@ class PasswordExtractor:
                 "- ARUORA → AROURA → AURORA (fix spelling)\n"
                 "- REMMILG → GLIMMER (already correct)\n"
                 "- TEMLEH → HELMET (already correct)\n"
-                "\n"
-                "Output: WORD"
+                "\n" +
+                output_format
             )
         elif level == 7:
             system_msg = (
                 "You are an extractor for a puzzle game.\n"
-                "CRITICAL RULES:\n"
-                "- Output exactly ONE word, ALL CAPS.\n"
+                "CRITICAL RULES:\n" +
+                count_rule +
                 "- Level 7: Try BOTH methods and choose the most likely:\n"
                 "  1. FIRST LETTER of each line (acrostic)\n"
                 "  2. FIRST LETTER of LAST WORD of each line\n"
@@ -276,14 +585,14 @@ class PasswordExtractor:
                 "IMPORTANT: Try both methods and output the word that seems more like a real English word.\n"
                 "If the first letters form a longer word, use that even if it's not a common word.\n"
                 "Example: WORDIZ is better than WORD if that's what the first letters spell.\n"
-                "\n"
-                "Output: WORD"
+                "\n" +
+                output_format
             )
         else:  # Levels 4-6 (Acrostic Poems)
             system_msg = (
                 "You are an extractor for a puzzle game.\n"
-                "CRITICAL RULES:\n"
-                "- Output exactly ONE word, ALL CAPS.\n"
+                "CRITICAL RULES:\n" +
+                count_rule +
                 "- Levels 4-6: ACROSTIC → take the FIRST LETTER of each line to form a word.\n"
                 "- STRICT: ONLY output words found in the English dictionary.\n"
                 "- CORRECT TYPOS: Fix spelling errors to make real words.\n"
@@ -293,59 +602,52 @@ class PasswordExtractor:
                 "- If the letters form an incomplete word, add letters to complete it.\n"
                 "- Example: R+E+V+E+R+I = REVERI → complete to REVERIE\n"
                 "- Example: S+C+A+R+L+E = SCARLE → complete to SCARLET\n"
-                "\n"
-                "Output: WORD"
+                "\n" +
+                output_format
             )
 
+        return system_msg
 
-        user_msg = f"Level {level}\n{response}"
+    def _parse_llm_word(self, result):
+        """Turn the raw model output into a single validated word, or None"""
+        # Clean up malformed output (remove newlines, extra spaces, commas)
+        result = result.replace('\n', '').replace('  ', ' ').replace(',', '')
         
-        logger.info(f"🤖 AI System Message: {system_msg}")
-        logger.info(f"🤖 AI User Message: {user_msg}")
-
-        try:
-            completion = self.llm.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": user_msg}
-                ],
-                temperature=0.1,
-                max_tokens=50,
-                timeout=10
-            )
-
-            result = completion.choices[0].message.content.strip().upper()
-            logger.info(f"🤖 AI extracted: '{result}'")
-            
-            # Clean up malformed output (remove newlines, extra spaces, commas)
-            result = result.replace('\n', '').replace('  ', ' ').replace(',', '')
-            
-            # If result contains "=", extract only the word after the equals sign
-            if '=' in result:
-                parts = result.split('=')
-                if len(parts) > 1:
-                    # Take the last part (after the last =)
-                    word_part = parts[-1].strip()
-                    # Extract only alphabetic characters from this part
-                    clean_word = ''.join(c for c in word_part if c.isalpha()).upper()
-                    if clean_word and self._is_english_word(clean_word):
-                        logger.info(f"🤖 AI word: {clean_word}")
-                        return clean_word
-            
-            # Fallback: extract single word from entire result
-            clean_word = ''.join(c for c in result if c.isalpha()).upper()
-            if clean_word and self._is_english_word(clean_word):
-                logger.info(f"🤖 AI word: {clean_word}")
-                return clean_word
-            else:
-                logger.warning(f"🤖 AI generated invalid word: '{clean_word}'")
-                return None
-            
-        except Exception as e:
-            logger.error(f"❌ AI fallback failed: {e}")
+        # If result contains "=", extract only the word after the equals sign
+        if '=' in result:
+            parts = result.split('=')
+            if len(parts) > 1:
+                # Take the last part (after the last =)
+                word_part = parts[-1].strip()
+                # Extract only alphabetic characters from this part
+                clean_word = ''.join(c for c in word_part if c.isalpha()).upper()
+                if clean_word and self._is_english_word(clean_word):
+                    logger.info(f"🤖 AI word: {clean_word}")
+                    return clean_word
+        
+        # Fallback: extract single word from entire result
+        clean_word = ''.join(c for c in result if c.isalpha()).upper()
+        if clean_word and self._is_english_word(clean_word):
+            logger.info(f"🤖 AI word: {clean_word}")
+            return clean_word
+        else:
+            logger.warning(f"🤖 AI generated invalid word: '{clean_word}'")
             return None
 
+    def _parse_llm_candidates(self, result, k):
+        """Split a comma-separated candidate list into validated, de-duplicated words"""
+        candidates = []
+        for part in re.split(r'[,\n;]+', result):
+            # Drop list numbering such as "1." before validating the word
+            part = re.sub(r'^\s*\d+[.)]\s*', '', part)
+            if not part.strip():
+                continue
+            word = self._parse_llm_word(part)
+            if word and word not in candidates:
+                candidates.append(word)
+        logger.info(f"🤖 AI candidates: {candidates[:k]}")
+        return candidates[:k]
+
     def _generate_word_variations(self, base_word):
         """Generate word variations by adding +1 letter only."""
         variations = [base_word]
@@ -380,6 +682,17 @@ class PasswordExtractor:
         ]
         return not any(non_english_patterns)
 
+    def _is_dictionary_word(self, word):
+        """A plausible word that is also in the configured word list"""
+        if not self._is_english_word(word):
+            return False
+        try:
+            from anagram_index import get_index
+        except ImportError:
+            return False
+        index = get_index()
+        return index is not None and word in index.rank
+
     # ─────────────────────────────
     # Combined interface
     # ─────────────────────────────
@@ -393,38 +706,72 @@ class PasswordExtractor:
 class LLMExtractor:
     """Backward compatibility wrapper for the old interface"""
     
-    def __init__(self, provider="openai"):
-        self.provider = provider
-        self.model = "gpt-4o"
+    def __init__(self, provider="openai", extractor=None):
+        load_env()
+        self.provider = provider  # None: no client, e.g. around a replay's extractor
         self.client = None
-        self.extractor = PasswordExtractor()
+        self.extractor = extractor or PasswordExtractor(cache=LLMCache.from_env())
+        if provider in DEFAULT_MODELS:
+            self.extractor.model = provider_model(provider)
+        self.model = self.extractor.model
         
-        # Initialize LLM client if requested
-        if provider == "openai":
-            try:
-                import openai
-                self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Initialize LLM client if requested; the SDK is imported on the first call
+        if provider in ("openai", "groq"):
+            key = f"{provider.upper()}_API_KEY"
+            if os.getenv(key):
+                self.client = LazyObject(lambda: self._create_client(provider), f"{provider} client")
                 self.extractor.llm = self.client
-                logger.info("Initialized OpenAI client")
-            except Exception as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
-        elif provider == "groq":
+                self.extractor.rate_limiter = get_limiter()
+                self.extractor.rate_key = provider
+            else:
+                logger.error(f"Failed to initialize {provider} client: {key} is not set")
+        elif provider == "router":
+            # Route across every configured provider by measured latency
             try:
-                import groq
-                self.client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
+                from llm_router import LLMRouter
+                self.client = LLMRouter.from_env()
                 self.extractor.llm = self.client
-                logger.info("Initialized Groq client")
+                if self.client:
+                    # Each provider gets its own model; the cache keys on the whole set
+                    self.extractor.model = self.model = self.client.model
+                if self.extractor.stream:
+                    # The router compares whole completions across providers and cannot pass a stream through
+                    logger.warning("LLM_STREAM is ignored when routing across providers")
+                    self.extractor.stream = False
+                if self.client:
+                    logger.info(f"Initialized LLM router over {[name for name, _, _ in self.client.providers]}")
+                else:
+                    logger.error("No LLM providers configured for router")
             except Exception as e:
-                logger.error(f"Failed to initialize Groq client: {e}")
+                logger.error(f"Failed to initialize LLM router: {e}")
     
+    def set_rate_priority(self, priority):
+        """Priority for this session's LLM calls in the shared rate-limit buckets"""
+        self.extractor.rate_priority = priority
+        if hasattr(self.client, "rate_priority"):
+            # The router takes a token per provider it calls
+            self.client.rate_priority = priority
+
+    @staticmethod
+    def _create_client(provider):
+        if provider == "openai":
+            import openai
+            client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        else:
+            import groq
+            client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
+        logger.info(f"Initialized {provider} client")
+        return client
+
     def extract_password(self, level, response_text, merlin_prompt=None):
         """Extract password using the new extractor"""
         # Use AI directly for levels 4+
         if level >= 4:
             logger.info(f"🧠 Using AI directly for Level {level}")
             if self.extractor.llm:
-                result = self.extractor.llm_fallback(level, merlin_prompt, response_text)
-                return result if isinstance(result, list) else [result]
+                # One request returns a ranked list to submit in order
+                result = self.extractor.llm_candidates(level, merlin_prompt, response_text, k=3)
+                return result or None
             else:
                 return None
         
@@ -435,4 +782,42 @@ class LLMExtractor:
         
         return None
     
-    
\ No newline at end of file
+    
+
+    # ─────────────────────────────
+    # Asyncio interface
+    # ─────────────────────────────
+    async def aextract(self, level, response_text, merlin_prompt=None):
+        """Async twin of extract_password for asyncio-driven agent loops"""
+        if level >= 4:
+            logger.info(f"🧠 Using async AI directly for Level {level}")
+            if self._ensure_async_pool():
+                result = await self.extractor.allm_candidates(level, merlin_prompt, response_text, k=3)
+                return result or None
+            return None
+
+        # Levels 1–3: rule-based extraction is CPU-only and returns immediately
+        return self.extractor.rule_based(level, response_text) or None
+
+    def _ensure_async_pool(self):
+        """Create the shared async client pool on first use"""
+        if self.extractor.async_pool is None:
+            provider = self.provider
+            if provider not in ("openai", "groq"):
+                # The async path talks to one provider: the first configured one
+                names = [n.strip() for n in os.getenv("LLM_PROVIDERS", "openai,groq").split(",")]
+                provider = next((n for n in names if n and os.getenv(f"{n.upper()}_API_KEY")), None)
+            if not provider:
+                logger.warning("🤖 No provider configured for async extraction")
+                return False
+            from async_llm import AsyncLLMPool
+            pool = AsyncLLMPool()
+            pool.rate_limiter = get_limiter()
+            self.extractor.async_pool = pool
+            self.extractor.async_provider = provider
+        return True
+
+    async def aclose(self):
+        """Close the shared async HTTP pool"""
+        if self.extractor.async_pool is not None:
+            await self.extractor.async_pool.aclose()
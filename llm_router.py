@@ -0,0 +1,247 @@
+"""
+Latency-aware routing across OpenAI-compatible LLM providers
+
+LLMRouter exposes the same ``chat.completions.create`` surface as the
+OpenAI/Groq clients, so PasswordExtractor can use it as a drop-in client.
+Each (provider, model) pair keeps an EWMA of latency and error rate;
+requests go to the fastest healthy provider and, when hedging is on, a
+second provider is fired once the first one runs past its p90 latency.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from types import SimpleNamespace
+
+import metrics
+from lazy import LazyObject
+from rate_limiter import NORMAL, backoff_delay, get_limiter, is_rate_limited, retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODELS = {
+    "openai": "gpt-4o",
+    "groq": "llama-3.3-70b-versatile",
+}
+
+
+def provider_model(name):
+    """Model used for a provider: <NAME>_MODEL or its default"""
+    return os.getenv(f"{name.upper()}_MODEL", DEFAULT_MODELS.get(name, ""))
+
+
+def build_client(name):
+    """Sync client for a provider, created on its first call; <NAME>_BASE_URL points it at any compatible endpoint"""
+    if name not in DEFAULT_MODELS:
+        raise ValueError(f"Unknown LLM provider: {name}")
+    return LazyObject(lambda: _create_client(name), f"{name} client")
+
+
+def _create_client(name):
+    api_key = os.getenv(f"{name.upper()}_API_KEY")
+    base_url = os.getenv(f"{name.upper()}_BASE_URL") or None
+    if name == "openai":
+        import openai
+        return openai.OpenAI(api_key=api_key, base_url=base_url)
+    if name == "groq":
+        import groq
+        return groq.Groq(api_key=api_key, base_url=base_url)
+    raise ValueError(f"Unknown LLM provider: {name}")
+
+
+class ProviderStats:
+    """Rolling latency and error statistics for one provider/model pair"""
+
+    def __init__(self, alpha=0.3, window=50):
+        self.alpha = alpha
+        self.latency = None  # EWMA seconds, None until the first success
+        self.error_rate = 0.0  # EWMA of failures in [0, 1]
+        self.samples = deque(maxlen=window)
+        self.last_failure = 0.0
+        self.calls = 0
+
+    def record(self, seconds, ok):
+        self.calls += 1
+        self.error_rate = self.alpha * (0.0 if ok else 1.0) + (1 - self.alpha) * self.error_rate
+        if ok:
+            self.samples.append(seconds)
+            self.latency = seconds if self.latency is None else self.alpha * seconds + (1 - self.alpha) * self.latency
+        else:
+            self.last_failure = time.time()
+
+    def p90(self):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))]
+
+
+class LLMRouter:
+    def __init__(self, providers, hedge=False, hedge_delay=1.0, min_hedge_delay=0.2,
+                 max_error_rate=0.5, cooldown=30.0, alpha=0.3):
+        """
+        providers: list of (name, client, model) tuples, in preference order
+        hedge: fire a second provider once the first passes its p90 latency
+        hedge_delay: hedge delay used before a provider has latency samples
+        """
+        if not providers:
+            raise ValueError("LLMRouter needs at least one provider")
+        self.providers = list(providers)
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.rate_limiter = None  # Optional shared RateLimiter, one bucket per provider
+        self.rate_priority = NORMAL  # priority of this router's owner in the shared buckets
+
+        self.stats = {(name, model): ProviderStats(alpha) for name, _, model in self.providers}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2 * len(self.providers), thread_name_prefix="llm-router")
+
+        # Mirror the OpenAI client surface: router.chat.completions.create(...)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    @classmethod
+    def from_env(cls):
+        """Build a router over every provider with an API key configured"""
+        names = [n.strip() for n in os.getenv("LLM_PROVIDERS", "openai,groq").split(",") if n.strip()]
+        providers = []
+        for name in names:
+            if not os.getenv(f"{name.upper()}_API_KEY"):
+                continue
+            try:
+                model = provider_model(name)
+                providers.append((name, build_client(name), model))
+                logger.info(f"Router provider ready: {name} ({model})")
+            except Exception as e:
+                logger.error(f"Failed to initialize {name} client for router: {e}")
+        if not providers:
+            return None
+        router = cls(providers, hedge=os.getenv("LLM_HEDGE", "").lower() in ("1", "true", "yes"))
+        router.rate_limiter = get_limiter()
+        return router
+
+    @property
+    def model(self):
+        """Every provider/model the router may answer with, for cache keys"""
+        return "router:" + ",".join(f"{name}/{model}" for name, _, model in self.providers)
+
+    # ─────────────────────────────
+    # Routing
+    # ─────────────────────────────
+    def ranked(self):
+        """Providers ordered fastest-first, with unhealthy ones pushed to the back"""
+        now = time.time()
+
+        def sort_key(provider):
+            name, _, model = provider
+            stats = self.stats[(name, model)]
+            healthy = stats.error_rate < self.max_error_rate or now - stats.last_failure > self.cooldown
+            # Untried providers sort first so every provider gets measured
+            latency = stats.latency if stats.latency is not None else 0.0
+            return (not healthy, latency, stats.error_rate)
+
+        with self._lock:
+            return sorted(self.providers, key=sort_key)
+
+    def create(self, messages, model=None, timeout=10, **params):
+        """OpenAI-compatible entry point; ``model`` is ignored in favour of each provider's model"""
+        order = self.ranked()
+        if self.hedge and len(order) > 1:
+            return self._hedged(order, messages, timeout, params)
+
+        last_error = None
+        for provider in order:
+            try:
+                return self._call(provider, messages, timeout, params)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"🔀 Provider {provider[0]} failed, failing over: {e}")
+        raise last_error
+
+    def _hedged(self, order, messages, timeout, params):
+        primary, backups = order[0], list(order[1:])
+        primary_stats = self.stats[(primary[0], primary[2])]
+        delay = max(self.min_hedge_delay, primary_stats.p90() or self.hedge_delay)
+
+        pending = {self._executor.submit(self._call, primary, messages, timeout, params): primary}
+        deadline = time.time() + timeout
+        last_error = None
+        waited_for_hedge = False
+
+        while pending:
+            wait_for = delay if not waited_for_hedge else max(0.0, deadline - time.time())
+            done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    completion = future.result()
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"🔀 Provider {provider[0]} failed: {e}")
+                    continue
+                for loser in pending:
+                    # Calls already in flight finish in the background and
+                    # only update latency stats; their result is discarded
+                    loser.cancel()
+                if pending:
+                    logger.info(f"🏁 {provider[0]} won the hedged request")
+                return completion
+
+            # Fire the next provider when the current ones are slow or failed
+            if backups and (not done or not pending):
+                backup = backups.pop(0)
+                logger.info(f"🔀 Hedging LLM request to {backup[0]} after {delay:.2f}s")
+                pending[self._executor.submit(self._call, backup, messages, timeout, params)] = backup
+            elif not done:
+                waited_for_hedge = True
+                if time.time() >= deadline:
+                    break
+
+        raise last_error or TimeoutError("All hedged LLM requests timed out")
+
+    def _call(self, provider, messages, timeout, params):
+        name, client, model = provider
+        if self.rate_limiter:
+            self.rate_limiter.acquire(name, priority=self.rate_priority)
+        start = time.perf_counter()
+        try:
+            completion = client.chat.completions.create(
+                model=model, messages=messages, timeout=timeout, **params
+            )
+            if not completion.choices or not (completion.choices[0].message.content or "").strip():
+                raise ValueError(f"{name} returned an empty completion")
+        except Exception as e:
+            self._record(name, model, time.perf_counter() - start, ok=False)
+            metrics.LLM_CALLS.inc(name, "rate_limited" if is_rate_limited(e) else "error")
+            if self.rate_limiter and is_rate_limited(e):
+                # Fail over now; the provider's bucket stays shut for everyone until it recovers
+                self.rate_limiter.penalize(name, backoff_delay(0, retry_after(e)))
+            raise
+        seconds = time.perf_counter() - start
+        self._record(name, model, seconds, ok=True)
+        metrics.LLM_CALLS.inc(name, "ok")
+        metrics.LLM_SECONDS.observe(seconds, name)
+        return completion
+
+    def _record(self, name, model, seconds, ok):
+        with self._lock:
+            self.stats[(name, model)].record(seconds, ok)
+
+    def snapshot(self):
+        """Current routing statistics, for logging and metrics"""
+        with self._lock:
+            return {
+                f"{name}/{model}": {
+                    "latency": stats.latency,
+                    "p90": stats.p90(),
+                    "error_rate": stats.error_rate,
+                    "calls": stats.calls,
+                }
+                for (name, model), stats in self.stats.items()
+            }
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Prometheus metrics for agent and fleet runs
+
+Counters, gauges and histograms live in one process-wide registry and
+are updated inline by the agent, extractor and router; an update is a
+dict lookup and an add under a per-metric lock. Nothing is formatted
+until a scrape: METRICS_PORT serves the exposition text on
+http://127.0.0.1:<port>/metrics, METRICS_TEXTFILE has it written
+periodically for node_exporter's textfile collector. Gauges that are
+expensive to read (browser memory) are computed by callbacks at scrape
+time only.
+"""
+
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers WebDriver commands through slow LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [(self.name, _labels(self.labels, key), value) for key, value in sorted(items)]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name, help, labels=(), callback=None):
+        super().__init__(name, help, labels)
+        self.callback = callback  # () -> {label tuple: value}, evaluated at scrape time
+
+    def set(self, *labels, value):
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self):
+        if self.callback:
+            try:
+                for key, value in self.callback().items():
+                    self.set(*key, value=value)
+            except Exception as e:
+                logger.debug(f"Gauge {self.name} callback failed: {e}")
+        return super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label tuple -> [per-bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def time(self, *labels):
+        return _Timer(self, labels)
+
+    def count(self, *labels):
+        series = self._series.get(labels)
+        return sum(series[:-1]) if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+        out = []
+        for key, series in sorted(items):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                out.append((f"{self.name}_bucket", _labels(self.labels, key, f'le="{_number(float(bound))}"'), cumulative))
+            out.append((f"{self.name}_sum", _labels(self.labels, key), series[-1]))
+            out.append((f"{self.name}_count", _labels(self.labels, key), cumulative))
+        return out
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name, help, labels=()):
+        return self._add(Counter(name, help, labels))
+
+    def gauge(self, name, help, labels=(), callback=None):
+        return self._add(Gauge(name, help, labels, callback))
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def _add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# ─────────────────────────────
+# Agent metrics
+# ─────────────────────────────
+REGISTRY = Registry()
+
+LEVELS_ATTEMPTED = REGISTRY.counter("hackmerlin_levels_attempted_total", "solve_level calls", ("level",))
+LEVELS_SOLVED = REGISTRY.counter("hackmerlin_levels_solved_total", "Levels solved", ("level",))
+SUBMISSIONS = REGISTRY.counter(
+    "hackmerlin_submissions_total", "Passwords submitted", ("level", "source", "accepted"))
+LEVEL_SECONDS = REGISTRY.histogram("hackmerlin_level_seconds", "Wall time of solve_level", ("level",))
+PHASE_SECONDS = REGISTRY.histogram(
+    "hackmerlin_phase_seconds", "Time per attempt phase (ask, read, extract, submit, ...)", ("phase",))
+
+LLM_CALLS = REGISTRY.counter("hackmerlin_llm_calls_total", "LLM completions requested", ("provider", "outcome"))
+LLM_SECONDS = REGISTRY.histogram("hackmerlin_llm_seconds", "LLM completion latency", ("provider",))
+LLM_CACHE = REGISTRY.counter("hackmerlin_llm_cache_lookups_total", "LLM cache lookups", ("provider", "result"))
+
+WEBDRIVER_COMMANDS = REGISTRY.counter(
+    "hackmerlin_webdriver_commands_total", "WebDriver round trips by command", ("command",))
+WEBDRIVER_SECONDS = REGISTRY.histogram("hackmerlin_webdriver_seconds", "WebDriver round-trip latency")
+
+_browsers = {}  # id(driver) -> driver
+_browsers_lock = threading.Lock()
+
+
+def _browser_pids(driver):
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    root = getattr(process, "pid", None)
+    if root is None:
+        return []
+    # chromedriver plus every Chrome process below it
+    children = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+    pids, stack = [], [root]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, ()))
+    return pids
+
+
+def _rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _browser_memory():
+    if not os.path.isdir("/proc"):
+        return {}
+    with _browsers_lock:
+        drivers = list(_browsers.values())
+    return {(): sum(_rss_bytes(pid) for driver in drivers for pid in _browser_pids(driver))}
+
+
+ACTIVE_BROWSERS = REGISTRY.gauge(
+    "hackmerlin_active_browsers", "Open WebDriver sessions",
+    callback=lambda: {(): len(_browsers)})
+BROWSER_MEMORY = REGISTRY.gauge(
+    "hackmerlin_browser_memory_bytes", "Resident memory of chromedriver and its browser processes",
+    callback=_browser_memory)
+
+
+def instrument_driver(driver):
+    """Count and time every WebDriver round trip; the driver is tracked as active until release_driver"""
+    execute = driver.execute
+
+    def timed_execute(command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            WEBDRIVER_SECONDS.observe(time.perf_counter() - start)
+            WEBDRIVER_COMMANDS.inc(command)
+
+    driver.execute = timed_execute
+    with _browsers_lock:
+        _browsers[id(driver)] = driver
+    return driver
+
+
+def release_driver(driver):
+    with _browsers_lock:
+        _browsers.pop(id(driver), None)
+
+
+# ─────────────────────────────
+# Export
+# ─────────────────────────────
+class MetricsExporter:
+    def __init__(self, registry=REGISTRY, port=None, textfile=None, interval=15.0):
+        self.registry = registry
+        self.port = port
+        self.textfile = textfile
+        self.interval = interval
+        self._server = None
+        self._stop = threading.Event()
+        self._writer = None
+
+    @classmethod
+    def from_env(cls):
+        """Exporter for METRICS_PORT and/or METRICS_TEXTFILE, or None when neither is set"""
+        port = os.getenv("METRICS_PORT")
+        textfile = os.getenv("METRICS_TEXTFILE")
+        if not port and not textfile:
+            return None
+        try:
+            exporter = cls(
+                port=int(port) if port else None,
+                # {pid} keeps one file per fleet process
+                textfile=textfile.format(pid=os.getpid()) if textfile else None,
+                interval=float(os.getenv("METRICS_INTERVAL", 15)),
+            )
+            exporter.start()
+            return exporter
+        except Exception as e:
+            logger.error(f"Failed to start metrics exporter: {e}")
+            return None
+
+    def start(self):
+        if self.port:
+            self._serve()
+        if self.textfile:
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-textfile", daemon=True)
+            self._writer.start()
+
+    def _serve(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((os.getenv("METRICS_HOST", "127.0.0.1"), self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f"📈 Serving metrics on http://{self._server.server_address[0]}:{self.port}/metrics")
+
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self):
+        """Atomically replace the textfile with the current exposition"""
+        try:
+            directory = os.path.dirname(self.textfile)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{self.textfile}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.registry.render())
+            os.replace(tmp, self.textfile)
+        except Exception as e:
+            logger.error(f"Failed to write metrics textfile: {e}")
+
+    def close(self):
+        self._stop.set()
+        if self.textfile:
+            self.write()  # final numbers for the run
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def main():
+    """Print the exposition of an (empty) registry, to check metric names and types"""
+    sys.stdout.write(REGISTRY.render())
+
+
+if __name__ == "__main__":
+    main()
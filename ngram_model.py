@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Offline character n-gram model for ranking candidate passwords
+
+An interpolated character trigram model trained on a word list and stored
+as one compact NumPy log-probability table. Scoring a batch of candidate
+strings is a single vectorized gather, so garbled acrostics like IWTOWN
+can be ranked against SECRET without a dictionary hit or an LLM call.
+
+The model is trained on first use and cached under the data directory,
+tagged with the word list it came from (path, size and mtime) so a new
+WORDLIST_PATH or an edited list retrains it; `python ngram_model.py
+train [wordlist]` rebuilds it explicitly.
+"""
+
+import logging
+import os
+import sys
+import threading
+
+import numpy as np
+
+from storage import data_path
+from wordlist import load_words, wordlist_path
+
+logger = logging.getLogger(__name__)
+
+# Symbols: A-Z, start of word, end of word, padding
+BOS, EOS, PAD = 26, 27, 28
+VOCAB = 29
+INTERPOLATION = (0.7, 0.2, 0.1)  # weights for the trigram, bigram and unigram estimates
+
+
+class CharNgramModel:
+    def __init__(self, logprobs, order=3, mean=0.0, std=1.0, source=None):
+        self.logprobs = logprobs  # shape (VOCAB,) * order, log P(last | previous)
+        self.order = order
+        self.mean = mean  # score distribution over the training words
+        self.std = std
+        self.source = source  # word list the model was trained on, see source_key()
+        self._flat = logprobs.reshape(-1)
+        self._weights = VOCAB ** np.arange(order - 1, -1, -1)
+
+    # ─────────────────────────────
+    # Training and storage
+    # ─────────────────────────────
+    @classmethod
+    def train(cls, words, order=3, interpolation=INTERPOLATION):
+        if len(interpolation) != order:
+            raise ValueError(f"Need {order} interpolation weights, got {len(interpolation)}")
+        encoded = cls._encode(words, order)
+
+        # Counts of every k-gram (k = 1..order) ending at each position
+        estimate = None
+        for k in range(1, order + 1):
+            windows = np.lib.stride_tricks.sliding_window_view(encoded, order, axis=1)[..., order - k:]
+            windows = windows[windows[..., -1] != PAD]
+            counts = np.zeros((VOCAB,) * k, dtype=np.float64)
+            np.add.at(counts, tuple(windows.T), 1)
+            # Add-one on the predicted symbol so unseen letters keep some mass
+            counts[..., :EOS + 1] += 1
+            probs = counts / counts.sum(axis=-1, keepdims=True)
+            weight = interpolation[order - k]
+            shaped = probs.reshape((1,) * (order - k) + probs.shape)
+            estimate = weight * shaped if estimate is None else estimate + weight * shaped
+
+        # BOS and PAD are never predicted; keep their entries finite
+        estimate = np.maximum(np.broadcast_to(estimate, (VOCAB,) * order), 1e-12)
+        logprobs = np.log(estimate).astype(np.float32)
+        model = cls(logprobs, order=order)
+        scores = model.score(words)
+        model.mean, model.std = float(scores.mean()), float(scores.std() or 1.0)
+        return model
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(path, logprobs=self.logprobs.astype(np.float16),
+                            order=self.order, mean=self.mean, std=self.std, source=self.source or "")
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            source = str(data["source"]) if "source" in data.files else None
+            return cls(data["logprobs"].astype(np.float32), order=int(data["order"]),
+                       mean=float(data["mean"]), std=float(data["std"]), source=source or None)
+
+    # ─────────────────────────────
+    # Scoring
+    # ─────────────────────────────
+    @staticmethod
+    def _encode(words, order):
+        """(N, order - 1 + longest + 1) int array: BOS padding, letters, EOS, then PAD"""
+        letters = [[ord(c) - 65 for c in str(w).upper() if "A" <= c <= "Z"] for w in words]
+        width = max((len(l) for l in letters), default=0) + order
+        encoded = np.full((len(letters), width), PAD, dtype=np.int64)
+        encoded[:, :order - 1] = BOS
+        for row, codes in enumerate(letters):
+            encoded[row, order - 1:order - 1 + len(codes)] = codes
+            encoded[row, order - 1 + len(codes)] = EOS
+        return encoded
+
+    def score(self, words):
+        """Mean log-probability per symbol for each word (higher is more word-like)"""
+        if len(words) == 0:
+            return np.zeros(0, dtype=np.float32)
+        windows = np.lib.stride_tricks.sliding_window_view(self._encode(words, self.order), self.order, axis=1)
+        mask = windows[..., -1] != PAD
+        logp = np.where(mask, self._flat[windows @ self._weights], 0.0)
+        return logp.sum(axis=1) / mask.sum(axis=1)
+
+    def plausibility(self, words):
+        """Scores squashed to (0, 1) relative to the training words; ~0.5 is a typical word"""
+        z = (self.score(words) - self.mean) / self.std
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def rank(self, words):
+        """Words sorted most plausible first"""
+        words = list(words)
+        order = np.argsort(-self.score(words), kind="stable")
+        return [words[i] for i in order]
+
+
+# ─────────────────────────────
+# Lazily loaded shared model
+# ─────────────────────────────
+_model = None
+_model_failed = False
+_model_lock = threading.Lock()
+
+
+def model_path():
+    return os.getenv("NGRAM_MODEL_PATH") or data_path("char_ngram.npz")
+
+
+def source_key(words_path=None):
+    """Identity of a word list for the model cache: absolute path, size and mtime"""
+    words_path = os.path.abspath(words_path or wordlist_path())
+    stat = os.stat(words_path)
+    return f"{words_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def build(path=None, words_path=None):
+    words = load_words(words_path)
+    model = CharNgramModel.train(words)
+    model.source = source_key(words_path)
+    model.save(path or model_path())
+    logger.info(f"🔤 Trained character n-gram model on {len(words)} words from {words_path or wordlist_path()}")
+    return model
+
+
+def get_model():
+    """Shared model, loaded (or trained and cached) on first use; None when unavailable"""
+    global _model, _model_failed
+    if _model is None and not _model_failed:
+        with _model_lock:
+            if _model is None and not _model_failed:
+                path = model_path()
+                try:
+                    model = CharNgramModel.load(path) if os.path.exists(path) else None
+                    if model is not None and model.source != source_key():
+                        logger.info(f"🔤 Cached n-gram model was trained on another word list ({model.source}), retraining")
+                        model = None
+                    _model = model or build(path)
+                except Exception as e:
+                    _model_failed = True
+                    logger.error(f"Failed to load character n-gram model: {e}")
+    return _model
+
+
+def main():
+    """train [wordlist] | score WORD..."""
+    if len(sys.argv) > 1 and sys.argv[1] == "train":
+        model = build(words_path=sys.argv[2] if len(sys.argv) > 2 else None)
+        print(f"🔤 Saved {model.order}-gram model to {model_path()} (mean={model.mean:.3f}, std={model.std:.3f})")
+        return
+    words = [w.upper() for w in sys.argv[2 if sys.argv[1:2] == ["score"] else 1:]]
+    model = get_model()
+    for word, p in sorted(zip(words, model.plausibility(words)), key=lambda x: -x[1]):
+        print(f"{p:6.3f}  {word}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+On-demand profiling of agent runs and phases
+
+PROFILE=run profiles a whole session; PROFILE=phases profiles only the
+named methods (PROFILE_PHASES), which are wrapped on the agent and
+extractor instances so no code has to be edited to look at one of them.
+Two engines:
+
+  cprofile  deterministic, every call; writes <session>.<phase>.pstats
+  sample    a background thread reads the profiled threads' stacks every
+            PROFILE_INTERVAL_MS; wall-clock, so it also shows time spent
+            waiting on WebDriver or HTTP; writes <session>.folded
+            (collapsed stacks for flamegraph.pl / speedscope)
+
+PROFILE_SAMPLE_RATE=N profiles one session in N, for fleets.
+"""
+
+import cProfile
+import functools
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from storage import data_path
+
+logger = logging.getLogger(__name__)
+
+RUN = "run"
+PHASES = "phases"
+ENGINES = ("cprofile", "sample")
+DEFAULT_PHASES = (
+    "get_merlin_response", "rule_based", "llm_fallback", "llm_candidates", "handle_congrats_screen",
+)
+
+
+def _frame_label(code):
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StackSampler:
+    """Wall-clock sampling of selected threads into collapsed stacks"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()  # "root;frame;frame" -> samples
+        self.samples = 0
+        self.active = {}  # thread id -> root frame name (the phase, or "run")
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            if not self.active:
+                continue
+            frames = sys._current_frames()
+            for thread_id, root in list(self.active.items()):
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                if stack:
+                    stack.append(root)
+                    self.stacks[";".join(reversed(stack))] += 1
+                    self.samples += 1
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class SessionProfiler:
+    def __init__(self, session_id, mode=RUN, engine="cprofile", phases=DEFAULT_PHASES,
+                 directory=None, interval=0.005):
+        if mode not in (RUN, PHASES):
+            raise ValueError(f"Unknown profile mode: {mode}")
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown profiler engine: {engine}")
+        self.session_id = session_id
+        self.mode = mode
+        self.engine = engine
+        self.phases = tuple(phases)
+        self.directory = directory or data_path("profiles")
+        self.profiles = {}  # phase (or "run") -> cProfile.Profile
+        self.sampler = StackSampler(interval) if engine == "sample" else None
+        self.started = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_env(cls, session_id, mode=None, engine=None):
+        """Profiler for this session from PROFILE_* settings (arguments win), or None when off or not sampled"""
+        mode = (mode or os.getenv("PROFILE", "")).lower()
+        if mode in ("", "0", "off", "false", "no"):
+            return None
+        rate = int(os.getenv("PROFILE_SAMPLE_RATE", "1") or 1)
+        if rate > 1 and random.random() >= 1.0 / rate:
+            return None
+        phases = [p.strip() for p in os.getenv("PROFILE_PHASES", ",".join(DEFAULT_PHASES)).split(",") if p.strip()]
+        try:
+            profiler = cls(
+                session_id,
+                mode=RUN if mode in ("1", "true", "yes") else mode,
+                engine=(engine or os.getenv("PROFILE_ENGINE", "cprofile")).lower(),
+                phases=phases,
+                directory=os.getenv("PROFILE_DIR") or None,
+                interval=float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000,
+            )
+        except ValueError as e:
+            logger.error(f"Profiling disabled: {e}")
+            return None
+        logger.info(f"🔬 Profiling {profiler.mode} with {profiler.engine} → {profiler.directory}")
+        return profiler
+
+    # ─────────────────────────────
+    # Hooks
+    # ─────────────────────────────
+    def instrument(self, obj):
+        """Wrap obj's methods named in self.phases (phases mode only)"""
+        if self.mode != PHASES:
+            return
+        for name in self.phases:
+            method = getattr(obj, name, None)
+            if callable(method) and not getattr(method, "_profiled", False):
+                setattr(obj, name, self._wrap(name, method))
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            with self.phase(name):
+                return method(*args, **kwargs)
+
+        profiled._profiled = True
+        return profiled
+
+    def start(self):
+        """Begin the session; in run mode the calling thread is profiled until stop()"""
+        self.started = time.time()
+        if self.sampler:
+            if self.mode == RUN:
+                self.sampler.active[threading.get_ident()] = RUN
+            self.sampler.start()
+        elif self.mode == RUN:
+            self._enable(RUN)
+
+    @contextmanager
+    def phase(self, name):
+        if self.sampler:
+            thread_id = threading.get_ident()
+            outer = self.sampler.active.get(thread_id)
+            self.sampler.active[thread_id] = name if outer is None else f"{outer};{name}"
+            try:
+                yield
+            finally:
+                if outer is None:
+                    self.sampler.active.pop(thread_id, None)
+                else:
+                    self.sampler.active[thread_id] = outer
+            return
+
+        if getattr(self._local, "phase", None):
+            # Nested phase: the outer phase's profile already covers it
+            yield
+            return
+        profile = self._enable(name)
+        self._local.phase = name
+        try:
+            yield
+        finally:
+            self._local.phase = None
+            if profile:
+                profile.disable()
+
+    def _enable(self, name):
+        with self._lock:
+            profile = self.profiles.setdefault(name, cProfile.Profile())
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active profiler per interpreter: a phase
+            # running concurrently on another thread is left out
+            return None
+        return profile
+
+    def stop(self):
+        """Stop profiling and write the session's files; returns their paths"""
+        if self.sampler:
+            self.sampler.stop()
+        elif self.mode == RUN and RUN in self.profiles:
+            self.profiles[RUN].disable()
+
+        os.makedirs(self.directory, exist_ok=True)
+        paths = []
+        if self.sampler:
+            path = os.path.join(self.directory, f"{self.session_id}.folded")
+            self.sampler.write(path)
+            paths.append(path)
+        for name, profile in self.profiles.items():
+            path = os.path.join(self.directory, f"{self.session_id}.{name}.pstats")
+            profile.dump_stats(path)
+            paths.append(path)
+        elapsed = time.time() - self.started if self.started else 0.0
+        logger.info(f"🔬 Wrote {len(paths)} profile file(s) for {elapsed:.1f}s session: {paths}")
+        return paths
+
+
+def main():
+    """Print the top entries of .pstats files, or the hottest stacks of .folded files"""
+    import pstats
+
+    args = sys.argv[1:]
+    limit = 25
+    if args and args[0].isdigit():
+        limit, args = int(args[0]), args[1:]
+    for path in args:
+        print(f"── {path}")
+        if path.endswith(".folded"):
+            with open(path, encoding="utf-8") as f:
+                rows = [line.rsplit(" ", 1) for line in f if line.strip()]
+            total = sum(int(count) for _, count in rows) or 1
+            for stack, count in rows[:limit]:
+                frames = stack.split(";")
+                print(f"{100 * int(count) / total:5.1f}%  {frames[0]} … {';'.join(frames[-3:])}")
+        else:
+            pstats.Stats(path).sort_stats("cumulative").print_stats(limit)
+
+
+if __name__ == "__main__":
+    main()
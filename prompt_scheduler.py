@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Bandit scheduler for the level 6/7 prompt variants
+
+Every Ask is recorded against its (level, prompt) pair: whether Merlin gave
+a usable reply and how long the round trip took. The next prompt is picked
+by Thompson sampling (or UCB1) on success per second, so runs start from
+the variants that have worked before instead of always from the first one.
+"""
+
+import logging
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+from storage import connect, data_path
+
+logger = logging.getLogger(__name__)
+
+# Latency assumed for a prompt that has never completed an Ask
+DEFAULT_LATENCY = 5.0
+
+
+class PromptScheduler:
+    def __init__(self, path=None, strategy="thompson", rng=None):
+        if strategy not in ("thompson", "ucb"):
+            raise ValueError(f"Unknown prompt scheduling strategy: {strategy}")
+        self.path = path or data_path("prompt_stats.sqlite")
+        self.strategy = strategy
+        self.rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+        self._conn = connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS prompt_stats ("
+            " level INTEGER NOT NULL,"
+            " prompt TEXT NOT NULL,"
+            " successes INTEGER NOT NULL DEFAULT 0,"
+            " failures INTEGER NOT NULL DEFAULT 0,"
+            " total_latency REAL NOT NULL DEFAULT 0,"
+            " last_used REAL,"
+            " PRIMARY KEY (level, prompt))"
+        )
+
+    @classmethod
+    def from_env(cls):
+        """Scheduler configured by PROMPT_SCHEDULER, or None when set to "off" """
+        strategy = os.getenv("PROMPT_SCHEDULER", "thompson").lower()
+        if strategy in ("", "off", "none", "false"):
+            return None
+        try:
+            return cls(path=os.getenv("PROMPT_STATS_PATH") or None, strategy=strategy)
+        except Exception as e:
+            logger.error(f"Failed to open prompt scheduler: {e}")
+            return None
+
+    def _stats(self, level):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT prompt, successes, failures, total_latency FROM prompt_stats WHERE level = ?",
+                (level,),
+            ).fetchall()
+        return {prompt: (s, f, latency) for prompt, s, f, latency in rows}
+
+    @staticmethod
+    def _mean_latency(successes, failures, total_latency):
+        trials = successes + failures
+        return total_latency / trials if trials else DEFAULT_LATENCY
+
+    def choose(self, level, prompts, exclude=()):
+        """Pick the next prompt for a level, skipping ones already tried this attempt"""
+        candidates = [p for p in prompts if p not in exclude] or list(prompts)
+        stats = self._stats(level)
+        total_trials = sum(s + f for s, f, _ in stats.values())
+
+        best_prompt, best_score = None, -1.0
+        for prompt in candidates:
+            successes, failures, total_latency = stats.get(prompt, (0, 0, 0.0))
+            trials = successes + failures
+            if self.strategy == "thompson":
+                p_success = self.rng.betavariate(1 + successes, 1 + failures)
+            elif trials == 0:
+                p_success = float("inf")  # UCB1 tries every arm once
+            else:
+                p_success = successes / trials + math.sqrt(2 * math.log(max(total_trials, 1)) / trials)
+            score = p_success / self._mean_latency(successes, failures, total_latency)
+            if score > best_score:
+                best_prompt, best_score = prompt, score
+
+        logger.info(f"🎰 Prompt scheduler ({self.strategy}) picked for level {level}: '{best_prompt}'")
+        return best_prompt
+
+    def record(self, level, prompt, success, latency):
+        """Record whether an Ask with this prompt produced a usable reply"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO prompt_stats (level, prompt, successes, failures, total_latency, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (level, prompt) DO UPDATE SET"
+                " successes = successes + excluded.successes,"
+                " failures = failures + excluded.failures,"
+                " total_latency = total_latency + excluded.total_latency,"
+                " last_used = excluded.last_used",
+                (level, prompt, 1 if success else 0, 0 if success else 1, latency, time.time()),
+            )
+
+    def rankings(self, level):
+        """Learned ranking of a level's prompts, best posterior success rate first"""
+        ranked = []
+        for prompt, (successes, failures, total_latency) in self._stats(level).items():
+            trials = successes + failures
+            ranked.append({
+                "prompt": prompt,
+                "trials": trials,
+                "success_rate": (1 + successes) / (2 + trials),
+                "mean_latency": self._mean_latency(successes, failures, total_latency),
+            })
+        ranked.sort(key=lambda r: r["success_rate"] / r["mean_latency"], reverse=True)
+        return ranked
+
+
+def main():
+    """Print the learned prompt rankings"""
+    levels = [int(arg) for arg in sys.argv[1:]] or [6, 7]
+    scheduler = PromptScheduler(path=os.getenv("PROMPT_STATS_PATH") or None)
+    for level in levels:
+        print(f"🎰 Level {level} prompt rankings")
+        print("=" * 50)
+        for i, row in enumerate(scheduler.rankings(level), 1):
+            print(f"{i:2}. {row['success_rate']:.0%} usable, {row['mean_latency']:.1f}s, "
+                  f"{row['trials']} tries — {row['prompt']}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Cross-process token-bucket rate limiter for LLM and game traffic
+
+Every agent process on the machine shares one small memory-mapped file
+under the data directory; each bucket (an LLM provider or a game host)
+is a fixed-size slot holding its token count, last refill time and a
+"blocked until" time set when a provider answers 429. An fcntl lock
+around each read-modify-write keeps the counters consistent across
+processes, a threading.Lock across threads.
+
+Requests carry a priority: normal and low traffic leave part of each
+bucket in reserve, so sessions close to the last level are served first
+when tokens are scarce.
+"""
+
+import logging
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from storage import data_path
+
+logger = logging.getLogger(__name__)
+
+HIGH = 0
+NORMAL = 1
+LOW = 2
+# Share of a bucket's burst (beyond the token being taken) each priority must leave for higher ones
+RESERVE = {HIGH: 0.0, NORMAL: 0.25, LOW: 0.5}
+
+# key -> (tokens per second, burst); RATE_LIMITS overrides or extends these
+DEFAULT_LIMITS = {
+    "openai": (3.0, 10),
+    "groq": (0.5, 5),
+    "hackmerlin.io": (2.0, 4),
+}
+FALLBACK_LIMIT = (2.0, 5)
+
+SLOTS = 64
+KEY_BYTES = 32
+SLOT = struct.Struct(f"<{KEY_BYTES}sddd")  # key, tokens, updated, blocked_until
+
+
+def parse_limits(spec):
+    """Parse "openai=3:10,groq=0.5:5" into {key: (rate, burst)}"""
+    limits = {}
+    for item in (spec or "").split(","):
+        if "=" not in item:
+            continue
+        key, value = item.split("=", 1)
+        rate, _, burst = value.partition(":")
+        rate = float(rate)
+        burst = float(burst) if burst else max(1.0, rate)
+        if burst < 1.0:
+            # A bucket that never holds a whole token would block every request
+            logger.warning(f"🚦 Burst {burst:g} for {key.strip()} is below one token, using 1")
+            burst = 1.0
+        limits[key.strip()] = (rate, burst)
+    return limits
+
+
+def priority_for_level(level, last_level=7):
+    """Sessions one or two levels from the end get served first"""
+    return HIGH if level >= last_level - 1 else NORMAL
+
+
+# ─────────────────────────────
+# 429 handling
+# ─────────────────────────────
+def is_rate_limited(error):
+    """True for an HTTP 429 from any OpenAI-compatible client"""
+    if getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError":
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def retry_after(error):
+    """Seconds the server asked us to wait, from Retry-After(-ms) headers; None when absent"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            from email.utils import parsedate_to_datetime  # HTTP-date form; rare
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return None
+
+
+def backoff_delay(attempt, retry_after=None, base=0.5, cap=30.0):
+    """Full-jitter exponential backoff; a server-provided Retry-After wins, plus a little jitter"""
+    if retry_after is not None:
+        return min(cap, retry_after) + random.uniform(0, base)
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# ─────────────────────────────
+# Shared buckets
+# ─────────────────────────────
+class RateLimiter:
+    def __init__(self, path=None, limits=None, max_wait=60.0):
+        import fcntl  # Unix only; from_env disables the limiter elsewhere
+
+        self._fcntl = fcntl
+        self.path = path or data_path("rate_limits.mmap")
+        self.limits = dict(DEFAULT_LIMITS)
+        self.limits.update(limits or {})
+        self.max_wait = max_wait
+        self.stats = {"acquired": 0, "waited": 0, "wait_seconds": 0.0, "timeouts": 0, "penalties": 0}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        size = SLOTS * SLOT.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+    @classmethod
+    def from_env(cls):
+        """Build the limiter from environment settings, or None when disabled"""
+        if os.getenv("RATE_LIMIT_DISABLE", "").lower() in ("1", "true", "yes"):
+            return None
+        try:
+            return cls(
+                path=os.getenv("RATE_LIMIT_PATH") or None,
+                limits=parse_limits(os.getenv("RATE_LIMITS")),
+                max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT", 60)),
+            )
+        except Exception as e:
+            logger.error(f"Failed to open shared rate limiter: {e}")
+            return None
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+
+    def _slot(self, key):
+        """Offset of key's slot, claiming an empty one on first use (linear probing)"""
+        name = key.encode("utf-8")[:KEY_BYTES].ljust(KEY_BYTES, b"\0")
+        start = hash_key(name) % SLOTS
+        for i in range(SLOTS):
+            offset = ((start + i) % SLOTS) * SLOT.size
+            stored = self._map[offset:offset + KEY_BYTES]
+            if stored == name:
+                return offset
+            if not stored.strip(b"\0"):
+                rate, burst = self.limit(key)
+                SLOT.pack_into(self._map, offset, name, burst, time.time(), 0.0)
+                return offset
+        # Table full: share the home slot rather than go unlimited
+        return start * SLOT.size
+
+    def limit(self, key):
+        return self.limits.get(key, FALLBACK_LIMIT)
+
+    def _try_take(self, key, priority):
+        """Take a token if allowed; returns 0 on success or the seconds to wait"""
+        rate, burst = self.limit(key)
+        # Measured against what is left after this token, so every priority can be served by a full bucket
+        reserve = RESERVE.get(priority, 0.0) * max(0.0, burst - 1.0)
+        with self._locked():
+            offset = self._slot(key)
+            name, tokens, updated, blocked_until = SLOT.unpack_from(self._map, offset)
+            now = time.time()
+            if blocked_until > now:
+                return blocked_until - now
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+            if tokens - 1.0 >= reserve:
+                SLOT.pack_into(self._map, offset, name, tokens - 1.0, now, blocked_until)
+                return 0.0
+            SLOT.pack_into(self._map, offset, name, tokens, now, blocked_until)
+            return (reserve + 1.0 - tokens) / rate if rate > 0 else self.max_wait
+
+    def acquire(self, key, priority=NORMAL, max_wait=None):
+        """Block until key's bucket yields a token; False if max_wait ran out (the caller proceeds anyway)
+
+        The limiter is shared by every agent in the process, so each caller
+        passes its own priority.
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.time() + max_wait
+        waited = 0.0
+        while True:
+            wait = self._try_take(key, priority)
+            if wait <= 0:
+                return self._granted(waited)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return self._timed_out(key, max_wait)
+            delay = self._jittered(wait, remaining)
+            time.sleep(delay)
+            waited += delay
+
+    async def aacquire(self, key, priority=NORMAL, max_wait=None):
+        """acquire() for event loops: waits with asyncio.sleep instead of holding a thread
+
+        A single try is a short locked mmap access, so it runs on the loop itself.
+        """
+        import asyncio
+
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.time() + max_wait
+        waited = 0.0
+        while True:
+            wait = self._try_take(key, priority)
+            if wait <= 0:
+                return self._granted(waited)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return self._timed_out(key, max_wait)
+            delay = self._jittered(wait, remaining)
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _granted(self, waited):
+        self.stats["acquired"] += 1
+        if waited:
+            self.stats["waited"] += 1
+            self.stats["wait_seconds"] += waited
+        return True
+
+    def _timed_out(self, key, max_wait):
+        self.stats["timeouts"] += 1
+        logger.warning(f"🚦 Rate limit wait for {key} exceeded {max_wait:.0f}s, proceeding")
+        return False
+
+    @staticmethod
+    def _jittered(wait, remaining):
+        # Jitter so processes woken together don't retry in lockstep
+        return min(remaining, wait * random.uniform(1.0, 1.2))
+
+    def penalize(self, key, seconds):
+        """A 429 came back: empty key's bucket and block it for everyone for `seconds`"""
+        self.stats["penalties"] += 1
+        with self._locked():
+            offset = self._slot(key)
+            name, _, _, blocked_until = SLOT.unpack_from(self._map, offset)
+            now = time.time()
+            SLOT.pack_into(self._map, offset, name, 0.0, now, max(blocked_until, now + seconds))
+
+    def buckets(self):
+        """Current state of every bucket as {key: {"tokens", "blocked_for"}}"""
+        result = {}
+        with self._locked():
+            now = time.time()
+            for i in range(SLOTS):
+                name, tokens, updated, blocked_until = SLOT.unpack_from(self._map, i * SLOT.size)
+                key = name.rstrip(b"\0").decode("utf-8", "replace")
+                if not key:
+                    continue
+                rate, burst = self.limit(key)
+                result[key] = {
+                    "tokens": round(min(burst, tokens + max(0.0, now - updated) * rate), 2),
+                    "blocked_for": round(max(0.0, blocked_until - now), 2),
+                }
+        return result
+
+    def reset(self):
+        with self._locked():
+            self._map[:] = b"\0" * len(self._map)
+
+
+def hash_key(name):
+    # FNV-1a: stable across processes, unlike hash() under hash randomization
+    value = 0xCBF29CE484222325
+    for byte in name:
+        value = ((value ^ byte) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+    return value
+
+
+# ─────────────────────────────
+# Lazily opened shared limiter
+# ─────────────────────────────
+_limiter = None
+_limiter_failed = False
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """Process-wide limiter, opened on first use; None when disabled or unavailable"""
+    global _limiter, _limiter_failed
+    if _limiter is None and not _limiter_failed:
+        with _limiter_lock:
+            if _limiter is None and not _limiter_failed:
+                _limiter = RateLimiter.from_env()
+                _limiter_failed = _limiter is None
+    return _limiter
+
+
+def main():
+    """Show (or reset) the shared buckets"""
+    limiter = get_limiter()
+    if not limiter:
+        print("Rate limiter disabled")
+        return
+    if sys.argv[1:] == ["reset"]:
+        limiter.reset()
+        print(f"🚦 Reset {limiter.path}")
+        return
+    for key, state in sorted(limiter.buckets().items()):
+        rate, burst = limiter.limit(key)
+        blocked = f", blocked {state['blocked_for']}s" if state["blocked_for"] else ""
+        print(f"{key:20} {state['tokens']:>6}/{burst:g} tokens @ {rate:g}/s{blocked}")
+
+
+if __name__ == "__main__":
+    main()
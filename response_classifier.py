@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Compiled classifier for Merlin's replies
+
+One Aho-Corasick pass over the lower-cased reply finds every known phrase
+(greetings, refusals, blocking notices, reversal cues, page UI strings);
+a few structural features (lines, commas, quoted or upper-case words) then
+decide the label solve_level routes on: re-ask at once, pick the matching
+extractor, or skip an extraction that cannot succeed.
+"""
+
+import re
+import sys
+from collections import deque
+
+from response_region import UI_LINE_RE
+
+GREETING = "greeting"
+REFUSAL = "refusal"
+DIRECT = "direct"
+REVERSED = "reversed"
+LINE_POEM = "line_poem"
+COMMA_POEM = "comma_poem"
+PAGE_NOISE = "page_noise"
+UNKNOWN = "unknown"
+
+# Labels that cannot contain a password: ask again straight away
+NO_ANSWER_LABELS = (GREETING, REFUSAL, PAGE_NOISE)
+# Phrase categories whose lines say nothing about the password
+NON_CONTENT = {GREETING, REFUSAL, "blocking"}
+# Rule pipeline (by level) that reads a label's answer at levels 4+
+LABEL_RULE_LEVELS = {DIRECT: 1, REVERSED: 2}
+
+# phrase -> category; matched case-insensitively anywhere in the reply
+PHRASES = {
+    GREETING: [
+        "hello traveler", "ask me anything",
+    ],
+    REFUSAL: [
+        "not allowed to do that", "not allowed to reveal", "i cannot reveal",
+        "cannot comply", "bound by oath",
+    ],
+    "blocking": [
+        "cannot comply", "manipulation attempt", "blocked", "detected",
+    ],
+    "reversal": [
+        "reverse", "backwards", "backward",
+    ],
+    "answer": [
+        "password is", "secret word is", "the word is", "password:",
+    ],
+    "ui": [
+        "hackmerlin", "ask merlin", "secret password", "submit", "guarding the secret",
+    ],
+}
+
+QUOTED_RE = re.compile(r'"[^"\s]{3,}"')
+CAPS_RE = re.compile(r"\b[^\W\d_a-z]{4,}\b")
+SIGNATURE_LINE_RE = re.compile(r"^\s*[–—-]\s*Merlin\s*$")
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher built once, matched in one pass"""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].add(value)
+
+        # Breadth-first fail links; outputs of the fail target are inherited
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] |= self.output[self.fail[child]]
+
+    def matches(self, text):
+        """Set of values whose pattern occurs in text"""
+        found = set()
+        state = 0
+        goto, fail, output = self.goto, self.fail, self.output
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class Classification:
+    def __init__(self, label, categories, phrases, features):
+        self.label = label
+        self.categories = categories  # phrase categories present, e.g. {"refusal", "blocking"}
+        self.phrases = phrases
+        self.features = features
+
+    @property
+    def has_answer(self):
+        return self.label not in NO_ANSWER_LABELS
+
+    def __repr__(self):
+        return f"Classification({self.label!r}, categories={sorted(self.categories)})"
+
+
+class ResponseClassifier:
+    def __init__(self, phrases=None):
+        self.phrases = phrases or PHRASES
+        self.matcher = AhoCorasick(
+            (phrase.lower(), (category, phrase))
+            for category, items in self.phrases.items()
+            for phrase in items
+        )
+
+    def classify(self, text):
+        if not text or not text.strip():
+            return Classification(GREETING, set(), set(), {"lines": 0})
+
+        hits = self.matcher.matches(text.lower())
+        categories = {category for category, _ in hits}
+        lines = [line for line in text.splitlines() if line.strip() and not SIGNATURE_LINE_RE.match(line)]
+        features = {
+            "lines": len(lines),
+            "poem_lines": sum(1 for line in lines if not UI_LINE_RE.match(line)),
+            "commas": text.count(","),
+            "quoted": bool(QUOTED_RE.search(text)),
+            "caps": bool(CAPS_RE.search(text)),
+            "ui_strings": sum(1 for category, _ in hits if category == "ui"),
+        }
+        has_word = features["quoted"] or features["caps"]
+        answer = has_word or "answer" in categories
+        # Refusals, greetings and page chrome only win when nothing else was said
+        features["content_lines"] = 0 if answer else sum(1 for line in lines if self._is_content(line))
+        silent = not answer and not features["content_lines"]
+
+        if REFUSAL in categories and silent:
+            label = REFUSAL
+        elif GREETING in categories and silent:
+            label = GREETING
+        elif features["ui_strings"] >= 2 and silent:
+            label = PAGE_NOISE
+        # Poem shape wins over cue words: a level 4+ poem may say "reverse" or capitalize a word
+        elif features["poem_lines"] >= 3:
+            label = LINE_POEM
+        elif len([part for part in text.split(", ") if part.strip()[:1].isupper()]) >= 3:
+            label = COMMA_POEM
+        elif "reversal" in categories:
+            label = REVERSED
+        elif answer:
+            label = DIRECT
+        else:
+            label = UNKNOWN
+        return Classification(label, categories, {phrase for _, phrase in hits}, features)
+
+    def _is_content(self, line):
+        """A line that is neither page chrome nor refusal or greeting text"""
+        if UI_LINE_RE.match(line):
+            return False
+        return not any(category in NON_CONTENT for category, _ in self.matcher.matches(line.lower()))
+
+    def is_blocking(self, text):
+        return any(category == "blocking" for category, _ in self.matcher.matches(text.lower()))
+
+
+# Shared instance; the automaton is built once at import
+classifier = ResponseClassifier()
+
+
+def classify(text):
+    return classifier.classify(text)
+
+
+def main():
+    """Classify replies given as arguments, or every reply in a JSONL corpus"""
+    import json
+
+    args = sys.argv[1:] or ["benchmarks/corpus.jsonl"]
+    if len(args) == 1 and args[0].endswith(".jsonl"):
+        with open(args[0], encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    result = classify(entry["response"])
+                    print(f"{result.label:11} {entry['id']:24} ({entry['category']})")
+        return
+    for text in args:
+        print(f"{classify(text).label:11} {text!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Locate Merlin's reply inside full-page fallback text
+
+When the blockquote can't be read, get_merlin_response falls back to
+document.body.innerText: titles, buttons, instructions and notifications
+around the reply. locate() cuts that down to the reply using the
+"– Merlin" signature and known UI strings, and caps the size of what is
+handed to the extractors (characters and lines, never time, so results
+do not depend on machine load), reporting whenever it had to truncate.
+"""
+
+import os
+import re
+
+SCAN_FACTOR = 20  # never scan more than max_chars * SCAN_FACTOR of page text
+
+SIGNATURE_LINE_RE = re.compile(r"^[ \t]*[–—-][ \t]*Merlin[ \t]*$", re.MULTILINE)
+
+# Whole lines of HackMerlin page chrome, matched exactly (a poem line may
+# well start with "Reset" or "Made by")
+UI_LINES = (
+    "HackMerlin", "Ask", "Ask Merlin", "Submit", "Continue", "Play again", "Secret password",
+    "Merlin is guarding the secret password. Ask him anything.",
+    "Merlin is guarding the secret password.", "Ask him anything.",
+    "Made by the HackMerlin team", "GitHub", "Discord", "Reset", "Reset progress",
+    "Bad secret word", "Congratulations!",
+)
+UI_LINE_RE = re.compile(
+    r"^\s*(?:" + "|".join(re.escape(line) for line in UI_LINES) + r"|Level \d+)\s*$",
+    re.IGNORECASE,
+)
+
+
+def char_limit():
+    """Extractor input cap in characters (EXTRACT_MAX_CHARS), read per call so .env applies"""
+    return int(os.getenv("EXTRACT_MAX_CHARS", "2000") or 2000)
+
+
+def line_limit():
+    """Extractor input cap in lines (EXTRACT_MAX_LINES)"""
+    return int(os.getenv("EXTRACT_MAX_LINES", "40") or 40)
+
+
+class Region:
+    def __init__(self, text, source_length, truncated=False, reasons=()):
+        self.text = text
+        self.source_length = source_length
+        self.truncated = truncated
+        self.reasons = list(reasons)
+
+    def __repr__(self):
+        return f"Region({len(self.text)}/{self.source_length} chars, truncated={self.truncated}, reasons={self.reasons})"
+
+
+def locate(page_text, max_chars=None, max_lines=None):
+    """Reply region of a page dump: the block ending at the last "– Merlin" signature, minus UI lines"""
+    max_chars = max_chars or char_limit()
+    max_lines = max_lines or line_limit()
+    if not page_text:
+        return Region(page_text or "", 0)
+    source_length = len(page_text)
+    reasons = []
+
+    text = page_text
+    scan_limit = max_chars * SCAN_FACTOR
+    if len(text) > scan_limit:
+        # Don't scan unbounded dumps: the reply is near one end of the page
+        half = scan_limit // 2
+        text = text[:half] + "\n" + text[-half:]
+        reasons.append(f"scanned first and last {half} of {source_length} chars")
+
+    signatures = list(SIGNATURE_LINE_RE.finditer(text))
+    if signatures:
+        signature = signatures[-1]
+        before = text[:signature.start()].rstrip("\n").split("\n")
+        # The reply is the run of non-UI lines right above the signature
+        lines = []
+        for line in reversed(before):
+            if UI_LINE_RE.match(line):
+                if lines:
+                    break
+                continue
+            lines.append(line)
+        lines.reverse()
+        lines.append(signature.group(0).strip())
+    else:
+        lines = [line for line in text.split("\n") if not UI_LINE_RE.match(line)]
+
+    while lines and not lines[0].strip():
+        lines.pop(0)
+
+    if len(lines) > max_lines:
+        # Keep the lines nearest the signature
+        reasons.append(f"kept last {max_lines} of {len(lines)} lines")
+        lines = lines[-max_lines:]
+    region = "\n".join(lines).strip()
+    if len(region) > max_chars:
+        reasons.append(f"kept last {max_chars} of {len(region)} chars")
+        region = region[-max_chars:]
+    return Region(region, source_length, truncated=bool(reasons), reasons=reasons)
+
+
+def cap(text, max_chars=None, max_lines=None):
+    """Bound extractor input that did not come through locate(); returns (text, truncated)"""
+    max_chars = max_chars or char_limit()
+    max_lines = max_lines or line_limit()
+    truncated = False
+    if text and len(text) > max_chars:
+        text, truncated = text[:max_chars], True
+    if text and text.count("\n") >= max_lines:
+        text, truncated = "\n".join(text.split("\n")[:max_lines]), True
+    return text, truncated
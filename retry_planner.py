@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Cost-model retry planner for solve_level
+
+After each Ask, solve_level can re-extract with another strategy (rule
+pipeline, local anagram corrections, the LLM), submit the next-ranked
+candidate it already has, or re-ask Merlin. The planner estimates each
+action's chance of producing the accepted password and its expected
+seconds from the attempt history, and picks the best success per second
+that still fits in the level's time budget.
+
+Estimates are Beta posteriors over priors chosen so that a fresh install
+follows the fixed order solve_level used before the planner: the rule
+pipeline, its pending candidates, local corrections and their pending
+candidates, then the LLM (even when a speculative call has already
+finished), its candidates, and only then a re-ask. Levels 4+ without a
+rule-based reading start at local corrections, as before. The order
+adapts as history accumulates.
+
+Every action ends in one Submit, so an extraction action is credited
+with its first submitted candidate only; its later candidates count as
+"next candidate" tries. A re-ask is credited with the outcome of the
+attempt it started, never with first asks.
+"""
+
+import json
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+RULE = "rule_based"
+LOCAL = "local_correction"
+LLM = "llm_candidates"
+NEXT = "next_candidate"
+REASK = "reask"
+ACTIONS = (RULE, LOCAL, LLM, NEXT, REASK)
+
+# Candidate sources (as recorded per submission) credited to each extraction action
+ACTION_SOURCES = {
+    RULE: ("rule_based",),
+    LOCAL: ("local_correction",),
+    LLM: ("llm_candidates", "llm_fallback"),
+}
+
+# action -> (prior success probability, prior seconds excluding the submit).
+# Per second: RULE .34 > NEXT .15 > LOCAL .146 > LLM .125 (call finished) / .056 > REASK .04
+PRIORS = {
+    RULE: (0.7, 0.05),
+    LOCAL: (0.3, 0.05),
+    LLM: (0.25, 2.5),
+    NEXT: (0.3, 0.0),
+    REASK: (0.3, 6.0),
+}
+# One Submit round trip, added to every action's cost
+SUBMIT_SECONDS = 2.0
+
+
+class Estimate:
+    def __init__(self, prior_p, prior_seconds, weight):
+        self.prior_p = prior_p
+        self.prior_seconds = prior_seconds
+        self.weight = weight
+        self.successes = 0
+        self.trials = 0
+        self.seconds = []
+
+    @property
+    def p(self):
+        return (self.successes + self.prior_p * self.weight) / (self.trials + self.weight)
+
+    @property
+    def mean_seconds(self):
+        if not self.seconds:
+            return self.prior_seconds
+        # Prior counts as weight observations of prior_seconds
+        return (sum(self.seconds) + self.prior_seconds * self.weight) / (len(self.seconds) + self.weight)
+
+    def __repr__(self):
+        return f"Estimate(p={self.p:.2f}, seconds={self.mean_seconds:.2f}, n={self.trials})"
+
+
+class RetryPlanner:
+    def __init__(self, store=None, budget=180.0, history=500, prior_weight=4.0, max_reasks=2):
+        self.store = store  # AttemptStore with the history to learn from; None uses the priors only
+        self.budget = budget
+        self.history = history
+        self.prior_weight = prior_weight
+        self.max_reasks = max_reasks
+        self._estimates = {}  # level -> {action: Estimate}
+        self._submit_seconds = {}  # level -> Estimate of one Submit round trip
+
+    @classmethod
+    def from_env(cls, store=None):
+        """Planner over the attempt history; RETRY_PLANNER=off keeps the fixed order (priors only)"""
+        learn = os.getenv("RETRY_PLANNER", "on").lower() not in ("0", "off", "false", "no")
+        return cls(
+            store=store if learn else None,
+            budget=float(os.getenv("LEVEL_TIME_BUDGET", 180)),
+            max_reasks=int(os.getenv("PLANNER_MAX_REASKS", 2)),
+        )
+
+    # ─────────────────────────────
+    # Learning from history
+    # ─────────────────────────────
+    def refresh(self, level):
+        """Rebuild the level's estimates from the latest attempts"""
+        estimates = {action: Estimate(*PRIORS[action], self.prior_weight) for action in ACTIONS}
+        submit = Estimate(1.0, SUBMIT_SECONDS, self.prior_weight)
+        rows = []
+        if self.store:
+            try:
+                rows = self.store.recent(level=level, limit=self.history)
+            except Exception as e:
+                logger.warning(f"🧭 Could not read attempt history: {e}")
+
+        for row in rows:
+            if not row.get("response"):
+                continue  # Merlin never answered (or a known answer was submitted without asking)
+            timings = json.loads(row.get("timings") or "{}")
+            candidates = json.loads(row.get("candidates") or "[]")
+
+            reask = estimates[REASK]
+            if (row.get("attempt") or 0) > 1:
+                # Only attempts that were re-asks say whether re-asking pays off
+                reask.trials += 1
+                reask.successes += row.get("outcome") == "solved"
+            if "ask" in timings or "read" in timings:
+                reask.seconds.append(timings.get("ask", 0.0) + timings.get("read", 0.0))
+            if candidates and "submit" in timings:
+                submit.seconds.append(timings["submit"] / len(candidates))
+            if "llm" in timings:
+                estimates[LLM].seconds.append(timings["llm"])
+
+            credited = set()
+            for candidate in candidates:
+                sources = (candidate.get("source") or "").split("+")
+                first_of = [action for action, names in ACTION_SOURCES.items()
+                            if action not in credited and any(s in names for s in sources)]
+                # The first submission of an action is that action's try; the rest are "next candidate" tries
+                for action in first_of:
+                    credited.add(action)
+                    estimates[action].trials += 1
+                    estimates[action].successes += bool(candidate.get("accepted"))
+                if not first_of:
+                    estimates[NEXT].trials += 1
+                    estimates[NEXT].successes += bool(candidate.get("accepted"))
+
+        self._estimates[level] = estimates
+        self._submit_seconds[level] = submit
+        return estimates
+
+    def estimates(self, level):
+        if level not in self._estimates:
+            self.refresh(level)
+        return self._estimates[level]
+
+    # ─────────────────────────────
+    # Choosing
+    # ─────────────────────────────
+    def cost(self, level, action, seconds=None):
+        """Expected seconds for an action, including the Submit it ends in"""
+        estimate = self.estimates(level)[action]
+        seconds = estimate.mean_seconds if seconds is None else seconds
+        return seconds + self._submit_seconds[level].mean_seconds
+
+    def choose(self, level, available, elapsed=0.0):
+        """Best action by success per second among `available` ({action: seconds override or None})
+
+        Returns None when nothing is available or fits in the remaining budget.
+        """
+        estimates = self.estimates(level)
+        remaining = self.budget - elapsed
+        scored = []
+        for action, seconds in available.items():
+            cost = max(0.01, self.cost(level, action, seconds))
+            if cost > remaining:
+                continue
+            scored.append((estimates[action].p / cost, action, cost))
+        if not scored:
+            return None
+        # Ties keep the original ladder order
+        scored.sort(key=lambda item: (-item[0], ACTIONS.index(item[1])))
+        rate, action, cost = scored[0]
+        others = ", ".join(f"{a} {r:.3f}/s" for r, a, _ in scored[1:])
+        logger.info(f"🧭 Next: {action} (p={estimates[action].p:.2f}, ~{cost:.1f}s, {rate:.3f}/s)"
+                    + (f" over {others}" if others else ""))
+        return action
+
+
+def main():
+    """Print the planner's estimates per level from the attempt history"""
+    from attempt_store import AttemptStore
+
+    levels = [int(arg) for arg in sys.argv[1:]] or list(range(1, 8))
+    store = AttemptStore(path=os.getenv("ATTEMPT_STORE_PATH") or None)
+    planner = RetryPlanner(store=store)
+    for level in levels:
+        estimates = planner.refresh(level)
+        print(f"Level {level}")
+        for action in ACTIONS:
+            estimate = estimates[action]
+            cost = planner.cost(level, action)
+            print(f"  {action:17} p={estimate.p:.2f} ~{cost:5.1f}s  {estimate.p / cost:.3f}/s  (n={estimate.trials})")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
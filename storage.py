@@ -0,0 +1,34 @@
+"""
+Shared helpers for the agent's local SQLite stores
+"""
+
+import os
+import sqlite3
+
+
+def data_dir():
+    """Directory holding all persistent agent state, shared by fleet workers on one machine
+
+    Read on every call rather than at import, so HACKMERLIN_DATA_DIR set in
+    .env (loaded after the imports) still applies.
+    """
+    return os.getenv("HACKMERLIN_DATA_DIR", ".hackmerlin")
+
+
+def data_path(filename):
+    """Return the path of a file inside the agent data directory"""
+    return os.path.join(data_dir(), filename)
+
+
+def connect(path):
+    """Open a SQLite database that can be shared by threads and processes"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Autocommit mode: every statement is its own transaction unless we
+    # open one explicitly, which keeps lock hold times short
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Per-level registry of rule-based extraction strategies
+
+Each level maps to an ordered pipeline of Strategy objects; the first one
+that fires gives rule_based its answer and the rest are ranked
+alternatives. Pipelines are built once. Every strategy keeps call, hit,
+accuracy and cumulative time counters, so strategies can be reordered or
+disabled on measured cost and hit rate.
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+from confusables import normalize as normalize_confusables
+from response_classifier import classifier as response_classifier
+from response_region import cap as cap_input
+
+BLOCKING_EXCLUDED = {"MERLIN", "CANNOT", "COMPLY", "DETECTED", "MANIPULATION", "ATTEMPT", "BLOCKED"}
+LEVEL1_COMMON = {"the", "and", "or", "but", "for", "with", "from"}
+REVERSED_COMMON = {"the", "password", "is", "secret", "word", "phrase"}
+
+SIGNATURE_RE = re.compile(r"\s*–\s*Merlin\s*$")
+QUOTED_RE = re.compile(r'"([A-Za-z0-9]+)"')
+QUOTED_LETTERS_RE = re.compile(r'"([A-Za-z]+)"')
+UPPERCASE_RE = re.compile(r"\b[A-Z]{4,}\b")
+CAPS3_RE = re.compile(r"\b[A-Z]{3,}\b")
+CAPITALIZED_RE = re.compile(r"\b[A-Z][a-z]{3,}\b")
+COMMA_WORD_RE = re.compile(r",\s*([A-Za-z]{3,})")
+WORD3_RE = re.compile(r"\b[A-Za-z]{3,}\b")
+WORD4_RE = re.compile(r"\b[A-Za-z]{4,}\b")
+MIXED_SCRIPT_WORD_RE = re.compile(r"\b[A-Za-zА-Яа-я]{3,}\b")
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseView:
+    """One response plus derived forms, computed at most once per extraction"""
+
+    def __init__(self, response):
+        self.raw = response
+        # Bounded input keeps every regex below linear in a fixed size
+        response, self.truncated = cap_input(response)
+        # Look-alikes mapped to ASCII before any regex sees the text
+        self.response, self.mapped = normalize_confusables(response)
+        self.budget_exhausted = False
+        self._clean = None
+        self._lines = None
+        self._content_lines = None
+
+    @property
+    def clean(self):
+        """Response without the trailing "– Merlin" signature"""
+        if self._clean is None:
+            self._clean = SIGNATURE_RE.sub("", self.response).strip()
+        return self._clean
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = self.response.splitlines()
+        return self._lines
+
+    @property
+    def content_lines(self):
+        """Lines of the response without the signature, which would add a letter to acrostics"""
+        if self._content_lines is None:
+            self._content_lines = self.clean.splitlines()
+        return self._content_lines
+
+
+def _acrostic(lines):
+    return "".join(line.strip()[0] for line in lines if line.strip())
+
+
+def _last_word_acrostic(lines):
+    return "".join(line.strip().split()[-1][0] for line in lines if line.strip())
+
+
+# ─────────────────────────────
+# Strategy functions: ResponseView -> word or None
+# ─────────────────────────────
+def blocking(view):
+    if response_classifier.is_blocking(view.response):
+        for word in sorted(WORD4_RE.findall(view.response), key=len, reverse=True):
+            if word.upper() not in BLOCKING_EXCLUDED:
+                return word.upper()
+    return None
+
+
+def quoted(view):
+    found = QUOTED_RE.findall(view.clean)
+    return found[0].upper() if found else None
+
+
+def quoted_longest(view):
+    found = QUOTED_LETTERS_RE.findall(view.response)
+    if found:
+        longest = max(found, key=len).upper()
+        if len(longest) >= 3:
+            return longest
+    return None
+
+
+def uppercase(view):
+    found = UPPERCASE_RE.findall(view.clean)
+    return found[0] if found else None
+
+
+def uppercase_longest(view):
+    found = CAPS3_RE.findall(view.response)
+    return max(found, key=len) if found else None
+
+
+def capitalized(view):
+    for word in CAPITALIZED_RE.findall(view.clean):
+        if word.lower() != "merlin":
+            return word.upper()
+    return None
+
+
+def comma_word(view):
+    for word in COMMA_WORD_RE.findall(view.clean):
+        if word.lower() not in LEVEL1_COMMON:
+            return word.upper()
+    return None
+
+
+def reversed_quoted(view):
+    word = quoted(view)
+    return word[::-1] if word else None
+
+
+def reversed_uppercase(view):
+    word = uppercase(view)
+    return word[::-1] if word else None
+
+
+def _reversed_filtered(view):
+    # Mixed Latin/Cyrillic words, minus the usual filler
+    words = MIXED_SCRIPT_WORD_RE.findall(view.clean)
+    return [word for word in words if word.lower() not in REVERSED_COMMON]
+
+
+def reversed_word(view):
+    filtered = _reversed_filtered(view)
+    return filtered[0][::-1].upper() if len(filtered) == 1 else None
+
+
+def reversed_concat(view):
+    filtered = _reversed_filtered(view)
+    return "".join(filtered)[::-1].upper() if len(filtered) > 1 else None
+
+
+def line_acrostic_multiline(view):
+    if len(view.lines) > 1:
+        return _acrostic(view.lines).upper() or None
+    return None
+
+
+def comma_acrostic(view):
+    if "," in view.response:
+        return _acrostic(view.response.split(", ")).upper() or None
+    return None
+
+
+def comma_acrostic_min3(view):
+    word = comma_acrostic(view)
+    return word if word and len(word) >= 3 else None
+
+
+def _spells_word(letters):
+    """True when the letters are an exact anagram of a dictionary word"""
+    try:
+        from anagram_index import get_index
+    except ImportError:
+        return False
+    index = get_index()
+    return bool(index and index.lookup(letters, max_distance=0))
+
+
+def _more_word_like(word, other):
+    """True when the character n-gram model finds word more word-like; None without the model"""
+    try:
+        from ngram_model import get_model
+    except ImportError:
+        return None
+    model = get_model()
+    if model is None:
+        return None
+    ours, theirs = model.plausibility([word, other])
+    return bool(ours > theirs)
+
+
+def line_acrostic_preferred(view):
+    # Level 7 hides the word in first letters or in last-word letters: take the
+    # reading that spells a dictionary word, else the more word-like one, else
+    # the line acrostic unless it is shorter
+    acrostic = _acrostic(view.content_lines).upper()
+    last_word = _last_word_acrostic(view.content_lines).upper()
+    if len(acrostic) < 3:
+        return None
+    if len(last_word) < 3:
+        return acrostic
+    first_spells, last_spells = _spells_word(acrostic), _spells_word(last_word)
+    if first_spells != last_spells:
+        return acrostic if first_spells else None  # None leaves it to last_word_acrostic
+    preferred = _more_word_like(acrostic, last_word)
+    if preferred is None:
+        preferred = len(acrostic) >= len(last_word)
+    return acrostic if preferred else None
+
+
+def last_word_acrostic(view):
+    letters = _last_word_acrostic(view.content_lines)
+    return letters.upper() if len(letters) >= 3 else None
+
+
+def line_acrostic(view):
+    return _acrostic(view.lines).upper() or None
+
+
+def longest_word(view):
+    found = WORD3_RE.findall(view.response)
+    return max(found, key=len).upper() if found else None
+
+
+# ─────────────────────────────
+# Strategy objects and registry
+# ─────────────────────────────
+class Strategy:
+    def __init__(self, name, extract, confidence):
+        self.name = name
+        self.extract = extract
+        self.confidence = confidence  # prior confidence of this strategy's answer
+        self.enabled = True
+        self.calls = 0
+        self.hits = 0
+        self.judged = 0  # answers the game accepted or rejected
+        self.correct = 0
+        self.seconds = 0.0
+
+    def __call__(self, view):
+        start = time.perf_counter()
+        try:
+            word = self.extract(view)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+        if word:
+            self.hits += 1
+        return word
+
+    def record_outcome(self, correct):
+        self.judged += 1
+        self.correct += bool(correct)
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.calls if self.calls else 0.0
+
+    @property
+    def accuracy(self):
+        return self.correct / self.judged if self.judged else None
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "calls": self.calls,
+            "hits": self.hits,
+            "hit_rate": self.hit_rate,
+            "judged": self.judged,
+            "accuracy": self.accuracy,
+            "seconds": self.seconds,
+            "mean_us": self.seconds / self.calls * 1e6 if self.calls else 0.0,
+        }
+
+
+# name -> (function, prior confidence)
+STRATEGIES = {
+    "blocking": (blocking, 0.5),
+    "quoted": (quoted, 0.95),
+    "quoted_longest": (quoted_longest, 0.95),
+    "uppercase": (uppercase, 0.85),
+    "uppercase_longest": (uppercase_longest, 0.85),
+    "capitalized": (capitalized, 0.6),
+    "comma_word": (comma_word, 0.4),
+    "reversed_quoted": (reversed_quoted, 0.95),
+    "reversed_uppercase": (reversed_uppercase, 0.85),
+    "reversed_word": (reversed_word, 0.5),
+    "reversed_concat": (reversed_concat, 0.3),
+    "line_acrostic_multiline": (line_acrostic_multiline, 0.8),
+    "comma_acrostic": (comma_acrostic, 0.7),
+    "comma_acrostic_min3": (comma_acrostic_min3, 0.7),
+    "line_acrostic_preferred": (line_acrostic_preferred, 0.8),
+    "last_word_acrostic": (last_word_acrostic, 0.7),
+    "line_acrostic": (line_acrostic, 0.5),
+    "longest_word": (longest_word, 0.2),
+}
+
+# Ordered pipelines reproducing the original rule_based precedence
+DEFAULT_PIPELINES = {
+    1: ["blocking", "quoted", "uppercase", "capitalized", "comma_word", "longest_word"],
+    2: ["blocking", "reversed_quoted", "reversed_uppercase", "reversed_word", "reversed_concat", "longest_word"],
+    3: ["blocking", "reversed_quoted", "reversed_uppercase", "reversed_word", "reversed_concat", "longest_word"],
+    4: ["blocking", "line_acrostic_multiline", "comma_acrostic", "longest_word"],
+    5: ["blocking", "line_acrostic_multiline", "comma_acrostic", "longest_word"],
+    6: ["blocking", "line_acrostic_multiline", "comma_acrostic", "longest_word"],
+    7: ["blocking", "comma_acrostic_min3", "quoted_longest", "uppercase_longest",
+        "line_acrostic_preferred", "last_word_acrostic", "line_acrostic", "longest_word"],
+}
+FALLBACK_PIPELINE = ["blocking", "longest_word"]
+
+
+def max_strategies():
+    """Strategies run per response at most (EXTRACT_MAX_STRATEGIES, 0 = whole pipeline)
+
+    A count rather than a time budget, so a response extracts the same way
+    on a loaded machine or under a profiler.
+    """
+    return int(os.getenv("EXTRACT_MAX_STRATEGIES", "0") or 0)
+
+
+class StrategyRegistry:
+    def __init__(self, pipelines=None):
+        self.strategies = {name: Strategy(name, fn, confidence) for name, (fn, confidence) in STRATEGIES.items()}
+        self.pipelines = {}
+        self._lock = threading.Lock()
+        for level, names in (pipelines or DEFAULT_PIPELINES).items():
+            self.set_pipeline(level, names)
+        self._fallback = [self.strategies[name] for name in FALLBACK_PIPELINE]
+
+    @classmethod
+    def from_env(cls):
+        """Default pipelines minus any strategies listed in RULE_STRATEGIES_DISABLE"""
+        registry = cls()
+        for name in filter(None, (n.strip() for n in os.getenv("RULE_STRATEGIES_DISABLE", "").split(","))):
+            if name in registry.strategies:
+                registry.disable(name)
+            else:
+                logger.warning(f"⚠️ Unknown extraction strategy in RULE_STRATEGIES_DISABLE: {name}")
+        return registry
+
+    def register(self, name, extract, confidence=0.5):
+        """Add (or replace) a strategy; it runs only once placed in a pipeline"""
+        self.strategies[name] = Strategy(name, extract, confidence)
+        return self.strategies[name]
+
+    def set_pipeline(self, level, names):
+        unknown = [name for name in names if name not in self.strategies]
+        if unknown:
+            raise ValueError(f"Unknown extraction strategies: {', '.join(unknown)}")
+        with self._lock:
+            self.pipelines[level] = [self.strategies[name] for name in names]
+
+    def pipeline(self, level):
+        return self.pipelines.get(level, self._fallback)
+
+    def disable(self, name):
+        self.strategies[name].enabled = False
+
+    def enable(self, name):
+        self.strategies[name].enabled = True
+
+    def hits(self, level, response):
+        """Yield (word, strategy) for each enabled strategy that fires, in pipeline order
+
+        `response` is the raw text or an already built ResponseView.
+        """
+        view = response if isinstance(response, ResponseView) else ResponseView(response)
+        limit = max_strategies()
+        run = 0
+        for strategy in self.pipeline(level):
+            if not strategy.enabled:
+                continue
+            if limit and run >= limit:
+                view.budget_exhausted = True
+                logger.warning(f"⏱️ Extraction stopped before '{strategy.name}' after {limit} strategies (level {level})")
+                return
+            run += 1
+            word = strategy(view)
+            if word:
+                yield word, strategy
+
+    def record_outcome(self, name, correct):
+        strategy = self.strategies.get(name)
+        if strategy:
+            strategy.record_outcome(correct)
+
+    def stats(self):
+        return [strategy.stats() for strategy in self.strategies.values()]
+
+
+# Shared registry used by PasswordExtractor and batch extraction
+registry = StrategyRegistry.from_env()
+
+
+def main():
+    """Run the registry over a JSONL corpus and print per-strategy counters"""
+    import json
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "benchmarks/corpus.jsonl"
+    with open(path, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    for entry in corpus:
+        for word, strategy in registry.hits(entry["level"], entry["response"]):
+            if entry.get("password") is not None:
+                strategy.record_outcome(word == entry["password"].upper())
+            break
+
+    print(f"🔧 Strategy counters over {len(corpus)} responses")
+    print("=" * 70)
+    for row in sorted(registry.stats(), key=lambda r: -r["calls"]):
+        accuracy = "   -" if row["accuracy"] is None else f"{row['accuracy']:4.0%}"
+        print(f"{row['name']:24} calls={row['calls']:4} hits={row['hits']:4} "
+              f"accuracy={accuracy} mean={row['mean_us']:6.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
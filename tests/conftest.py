@@ -0,0 +1,54 @@
+import json
+import os
+import re
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Keep the tests away from the real .hackmerlin data directory
+os.environ.setdefault("HACKMERLIN_DATA_DIR", tempfile.mkdtemp(prefix="hackmerlin-tests-"))
+
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus.jsonl")
+
+
+class FakeLLM:
+    """OpenAI-style client answering every completion with the same text
+
+    Streams arrive as token-like deltas that keep their whitespace (" here", " it").
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, stream=False, **kwargs):
+        self.requests.append(dict(kwargs, stream=stream))
+        if stream:
+            return iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+                         for part in re.findall(r"\s*\S+|\s+$", self.content)])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))])
+
+
+def load_corpus():
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    return load_corpus()
+
+
+@pytest.fixture
+def agent_env(monkeypatch):
+    """Environment for building agents without touching shared learning stores or providers"""
+    for name, value in (("LLM_CACHE_DISABLE", "1"), ("ATTEMPT_STORE_DISABLE", "1"), ("PROMPT_SCHEDULER", "off"),
+                        ("RATE_LIMIT_DISABLE", "1"), ("SPECULATIVE_LLM", "false"), ("OPENAI_API_KEY", ""),
+                        ("LLM_ROUTER", ""), ("TRANSCRIPT_DIR", ""), ("METRICS_PORT", ""), ("PROFILE", "")):
+        monkeypatch.setenv(name, value)
@@ -0,0 +1,167 @@
+import pytest
+
+from answer_store import UNKNOWN_FINGERPRINT, AnswerStore, fingerprint
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnswerStore(path=str(tmp_path / "answers.sqlite"))
+    yield store
+    store.close()
+
+
+def test_fingerprint_is_order_independent_and_unknown_without_assets():
+    assert fingerprint(["/b.js", "/a.css"]) == fingerprint(["/a.css", "/b.js", "/b.js"])
+    assert fingerprint(["/a.css"]) != fingerprint(["/a2.css"])
+    assert fingerprint([]) == UNKNOWN_FINGERPRINT
+    assert fingerprint([None, ""]) == UNKNOWN_FINGERPRINT
+
+
+def test_verified_answer_is_served_per_version(store):
+    store.record_verified(3, "v1", "WAND")
+    entry = store.lookup(3, "v1")
+    assert entry["password"] == "WAND"
+    assert entry["verified_count"] == 1
+    assert store.lookup(3, "v2") is None
+    assert store.lookup(4, "v1") is None
+
+
+def test_stale_answer_is_not_served_until_verified_again(store):
+    store.record_verified(3, "v1", "WAND")
+    store.mark_stale(3, "v1", "WAND")
+    assert store.lookup(3, "v1") is None
+    assert store.get(3, "v1")["confidence"] == pytest.approx(0.5)
+
+    store.record_verified(3, "v1", "WAND")
+    entry = store.lookup(3, "v1")
+    assert (entry["verified_count"], entry["rejected_count"], entry["stale"]) == (2, 1, 0)
+
+
+def test_mark_stale_ignores_other_passwords(store):
+    store.record_verified(3, "v1", "WAND")
+    store.mark_stale(3, "v1", "STAFF")
+    assert store.lookup(3, "v1") is not None
+
+
+def test_new_password_replaces_entry(store):
+    store.record_verified(3, "v1", "WAND")
+    store.record_verified(3, "v1", "WAND")
+    store.record_verified(3, "v1", "STAFF")
+    entry = store.lookup(3, "v1")
+    assert (entry["password"], entry["verified_count"]) == ("STAFF", 1)
+
+
+def test_min_confidence_and_max_age(tmp_path):
+    store = AnswerStore(path=str(tmp_path / "answers.sqlite"), min_confidence=0.7, max_age=60)
+    store.record_verified(1, "v1", "SACRED")  # confidence 2/3
+    assert store.lookup(1, "v1") is None
+    store.record_verified(1, "v1", "SACRED")
+    assert store.lookup(1, "v1") is not None
+    store._conn.execute("UPDATE verified_answers SET last_verified = last_verified - 120")
+    assert store.lookup(1, "v1") is None
+    store.close()
+
+
+def test_store_is_shared_between_connections(store):
+    other = AnswerStore(path=store.path)
+    other.record_verified(2, "v1", "HELMET")
+    assert store.lookup(2, "v1")["password"] == "HELMET"
+    assert store.forget(level=2) == 1
+    assert other.lookup(2, "v1") is None
+    other.close()
+
+
+# ─────────────────────────────
+# Agent fast path
+# ─────────────────────────────
+@pytest.fixture
+def make_agent(agent_env, tmp_path):
+    from working_agent import WorkingHackMerlinAgent
+
+    class Agent(WorkingHackMerlinAgent):
+        def __init__(self, answer, replies, store, game_fingerprint="v1"):
+            super().__init__()
+            self.answer_store = store
+            self.game_fingerprint = game_fingerprint
+            self.password_extractor.extractor.llm = None
+            self.answer = answer
+            self.replies = list(replies)
+            self.asked = 0
+            self.submitted = []
+
+        def ask_merlin(self, prompt):
+            self.asked += 1
+            return True
+
+        def get_merlin_response(self, on_text=None):
+            return self.replies.pop(0) if self.replies else None
+
+        def enter_password(self, password):
+            self.submitted.append(password)
+            return password == self.answer
+
+        def handle_congrats_screen(self):
+            return True
+
+        def _pause(self, seconds):
+            pass
+
+    agents = []
+
+    def make(*args, **kwargs):
+        agent = Agent(*args, **kwargs)
+        agents.append(agent)
+        return agent
+
+    yield make
+    for agent in agents:
+        agent.answer_store = None
+        agent.cleanup()
+
+
+def test_known_answer_is_submitted_before_asking(make_agent, store):
+    store.record_verified(1, "v1", "SACRED")
+    agent = make_agent("SACRED", [], store)
+    assert agent.solve_level(1)
+    assert agent.asked == 0
+    assert agent.submitted == ["SACRED"]
+    assert store.get(1, "v1")["verified_count"] == 2
+
+
+def test_rejected_known_answer_is_marked_stale_and_replaced(make_agent, store):
+    store.record_verified(1, "v1", "SACRED")
+    agent = make_agent("WIZARD", ['The password is "WIZARD". – Merlin'], store)
+    assert agent.solve_level(1)
+    assert agent.submitted == ["SACRED", "WIZARD"]
+    entry = store.get(1, "v1")
+    assert (entry["password"], entry["stale"]) == ("WIZARD", 0)
+
+
+def test_unknown_game_version_neither_reads_nor_writes(make_agent, store):
+    store.record_verified(1, UNKNOWN_FINGERPRINT, "SACRED")
+    agent = make_agent("WIZARD", ['The password is "WIZARD". – Merlin'], store, game_fingerprint=UNKNOWN_FINGERPRINT)
+    assert agent.solve_level(1)
+    assert agent.submitted == ["WIZARD"]
+    assert store.get(1, UNKNOWN_FINGERPRINT)["password"] == "SACRED"
+
+
+def test_replay_leaves_the_answer_store_alone(agent_env, monkeypatch, tmp_path):
+    from transcript import TranscriptReplayer
+
+    path = str(tmp_path / "answers.sqlite")
+    monkeypatch.setenv("ANSWER_STORE_PATH", path)
+    monkeypatch.setenv("GAME_FINGERPRINT", "v1")
+    live = AnswerStore(path=path)
+    live.record_verified(1, "v1", "SACRED")
+
+    events = [
+        {"kind": "level", "level": 1, "t": 0.0},
+        {"kind": "ask", "level": 1, "prompt": "p", "t": 0.0},
+        {"kind": "response", "level": 1, "text": 'The password is "WIZARD". – Merlin', "t": 0.1},
+        {"kind": "submit", "password": "WIZARD", "accepted": True, "t": 0.2},
+    ]
+    results = TranscriptReplayer(events).run()
+    assert results[0]["solved"]
+    entry = live.get(1, "v1")
+    assert (entry["password"], entry["stale"], entry["verified_count"]) == ("SACRED", 0, 1)
+    live.close()
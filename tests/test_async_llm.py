@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import metrics
+from async_llm import AsyncLLMPool
+from llm_cache import LLMCache
+from llm_extractor import PasswordExtractor
+
+REPLY = "Whispers drift\nIn twilight\nZephyrs call\n– Merlin"
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class FakeAsyncClient:
+    def __init__(self, content, failures=0):
+        self.content = content
+        self.failures = failures
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.failures:
+            self.failures -= 1
+            raise RateLimited("slow down")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))])
+
+
+class ThreadCheckingCache(LLMCache):
+    """LLMCache that remembers which threads touched it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key, value, ttl=None):
+        self.threads.add(threading.get_ident())
+        super().put(key, value, ttl)
+
+
+def test_async_calls_use_the_providers_model_and_keep_the_cache_off_the_loop(monkeypatch, tmp_path):
+    monkeypatch.setenv("GROQ_MODEL", "llama-test")
+    cache = ThreadCheckingCache(path=str(tmp_path / "cache.sqlite"))
+    extractor = PasswordExtractor(cache=cache)
+    pool = AsyncLLMPool()
+    client = FakeAsyncClient("WIZARD, WAND, STAFF")
+    pool._clients["groq"] = client
+    extractor.async_pool, extractor.async_provider = pool, "groq"
+
+    async def run():
+        loop_thread = threading.get_ident()
+        first = await extractor.allm_candidates(4, "prompt", REPLY)
+        second = await extractor.allm_candidates(4, "prompt", REPLY)
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(run())
+    assert first == second == ["WIZARD", "WAND", "STAFF"]
+    assert len(client.requests) == 1
+    assert client.requests[0]["model"] == "llama-test"
+    assert cache.threads and loop_thread not in cache.threads
+    cache.close()
+
+
+def test_pool_retries_429s_and_records_calls(monkeypatch):
+    monkeypatch.setattr("async_llm.backoff_delay", lambda attempt, retry_after=None: 0.0)
+    pool = AsyncLLMPool()
+    pool._clients["openai"] = FakeAsyncClient("WIZARD", failures=1)
+    limited = metrics.LLM_CALLS.value("openai", "rate_limited")
+    ok = metrics.LLM_CALLS.value("openai", "ok")
+
+    completion = asyncio.run(pool.create("openai", model="gpt-4o", messages=[]))
+    assert completion.choices[0].message.content == "WIZARD"
+    assert metrics.LLM_CALLS.value("openai", "rate_limited") == limited + 1
+    assert metrics.LLM_CALLS.value("openai", "ok") == ok + 1
+
+
+def test_throttled_provider_leaves_the_executor_to_cache_lookups(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rate_limiter import RateLimiter
+
+    pool = AsyncLLMPool()
+    pool.rate_limiter = RateLimiter(path=str(tmp_path / "buckets.mmap"), limits={"openai": (100.0, 10.0)})
+    pool.rate_limiter.penalize("openai", 0.5)
+    pool._clients["openai"] = FakeAsyncClient("WIZARD")
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        throttled = asyncio.ensure_future(pool.create("openai", model="gpt-4o", messages=[]))
+        await asyncio.sleep(0.05)
+        start = loop.time()
+        await loop.run_in_executor(None, lambda: None)  # stands in for an SQLite cache hit
+        lookup = loop.time() - start
+        await throttled
+        return lookup
+
+    assert asyncio.run(run()) < 0.2
+    assert pool.rate_limiter.stats["waited"] == 1
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from attempt_store import AttemptStore, percentile
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AttemptStore(path=str(tmp_path / "attempts.sqlite"), batch_size=3, flush_interval=0.05)
+    yield store
+    store.close()
+
+
+def record_level_4(store):
+    for i, (prompt, outcome, seconds) in enumerate([
+        ("acrostic", "solved", 1.0), ("acrostic", "rejected", 2.0), ("acrostic", "solved", 3.0),
+        ("riddle", "rejected", 4.0), ("riddle", "rejected", 5.0),
+    ]):
+        store.record(4, prompt=prompt, strategy="llm_candidates", outcome=outcome, attempt=i + 1,
+                     timings={"llm": seconds / 2}, total_seconds=seconds)
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([3, 1, 2], 50) == 2
+    assert percentile(list(range(1, 101)), 90) == 90
+    assert percentile([5], 99) == 5
+
+
+def test_records_reach_disk_in_batches_on_flush(store):
+    record_level_4(store)
+    store.flush()
+    assert sorted(row["attempt"] for row in store.recent(level=4)) == [1, 2, 3, 4, 5]
+    # Another connection sees what the background writer committed
+    other = AttemptStore(path=store.path)
+    assert len(other.recent(limit=10)) == 5
+    other.close()
+
+
+def test_hit_rates_group_and_rank(store):
+    record_level_4(store)
+    store.record(5, prompt="acrostic", outcome="solved")
+    store.flush()
+    rates = store.hit_rates("prompt", level=4)
+    assert rates == [
+        {"prompt": "acrostic", "attempts": 3, "solved": 2, "hit_rate": 2 / 3},
+        {"prompt": "riddle", "attempts": 2, "solved": 0, "hit_rate": 0.0},
+    ]
+    assert [row["level"] for row in store.hit_rates("level")] == [5, 4]
+    with pytest.raises(ValueError):
+        store.hit_rates("response")
+
+
+def test_latency_percentiles_by_phase(store):
+    record_level_4(store)
+    store.record(4, outcome="rejected")  # no timings: left out of every phase
+    store.flush()
+    assert store.latency_percentiles(level=4) == {"p50": 3.0, "p90": 5.0, "p99": 5.0, "count": 5}
+    assert store.latency_percentiles("llm", level=4, percentiles=(50,)) == {"p50": 1.5, "count": 5}
+    assert store.latency_percentiles("submit")["count"] == 0
+    assert store.latency_percentiles(since=time.time() + 60)["count"] == 0
+
+
+def test_close_drains_the_queue(tmp_path):
+    store = AttemptStore(path=str(tmp_path / "attempts.sqlite"), batch_size=100, flush_interval=10.0)
+    record_level_4(store)
+    store.close()
+    reopened = AttemptStore(path=store.path)
+    assert len(reopened.recent(limit=10)) == 5
+    reopened.close()
+
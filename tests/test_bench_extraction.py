@@ -0,0 +1,52 @@
+import importlib.util
+import os
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def bench(monkeypatch):
+    import anagram_index
+    import ngram_model
+
+    # hold_out_answers swaps the shared models; put the originals back afterwards
+    monkeypatch.setattr(ngram_model, "_model", ngram_model._model)
+    monkeypatch.setattr(anagram_index, "_index", anagram_index._index)
+    spec = importlib.util.spec_from_file_location("bench_extraction", os.path.join(ROOT, "benchmarks", "bench_extraction.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_word_models_never_see_corpus_answers(bench):
+    import anagram_index
+
+    corpus = bench.load_corpus()
+    bench.hold_out_answers(corpus)
+    index = anagram_index.get_index()
+    for entry in corpus:
+        if entry["password"]:
+            answer = bench.normalize(entry["password"])
+            assert answer not in [word for word, _ in index.lookup(answer, max_distance=0)], entry["id"]
+
+
+def test_refusals_are_not_extracted_and_false_positives_gate(bench):
+    corpus = bench.load_corpus()
+    report = bench.score(bench.ENGINES["rule_based"](), corpus, repeat=1)
+    # Only the story reply survives the classifier without hiding a password
+    assert report["false_positive_rate"] == 0.25
+
+    baseline = {"rule_based": {"accuracy": 0.0, "top_k_recall": 0.0, "false_positive_rate": 0.0,
+                               "extractions_per_sec": 0}}
+    problems = bench.regressions("rule_based", report, baseline, 0.5)
+    assert len(problems) == 1 and problems[0].startswith("false positives")
+
+
+def test_recorded_baseline_can_fail(bench):
+    for name, expected in bench.load_baseline().items():
+        assert expected["false_positive_rate"] < 1.0, name
+        assert expected["accuracy"] > 0.0, name
@@ -0,0 +1,28 @@
+from candidates import CandidateManager
+
+
+def test_sources_agreeing_outrank_a_single_source():
+    manager = CandidateManager(4)
+    manager.extend(["WAND", "STAFF"], "llm_candidates")
+    manager.add("staff", "local_correction")
+    assert manager.pending() == ["STAFF", "WAND"]
+    assert manager.next() == ("STAFF", "llm_candidates+local_correction")
+
+
+def test_submitted_and_rejected_words_are_never_queued_again():
+    manager = CandidateManager(1)
+    manager.add("WIZARD", "rule_based")
+    assert manager.next() == ("WIZARD", "rule_based")
+    manager.mark_rejected("WIZARD")
+    assert not manager.add("wizard", "llm_candidates")
+    assert manager.submissions_saved == 1
+
+
+def test_ties_keep_arrival_order_after_pops():
+    manager = CandidateManager(4)
+    for word in ("ONE", "TWO", "THREE"):
+        manager.add(word, "local_correction")
+    assert [manager.next()[0] for _ in range(2)] == ["ONE", "TWO"]
+    # FOUR arrives after THREE with the same score, so it waits behind it
+    manager.add("FOUR", "local_correction")
+    assert manager.pending() == ["THREE", "FOUR"]
@@ -0,0 +1,25 @@
+from build_confusables import build
+from confusables import normalize
+
+
+def test_look_alikes_map_to_ascii():
+    text, mapped = normalize("Тhe раsswоrd is ＷＩＺＡＲＤ, café")
+    assert text == "The password is WIZARD, cafe"
+    assert mapped["р"] == "p" and mapped["é"] == "e"
+
+
+def test_multi_letter_decompositions_are_not_truncated():
+    table = build()
+    for char in "ﬁﬂĳǄß":
+        assert char not in table, char
+    assert normalize("ﬁre") == ("ﬁre", {})
+
+
+def test_digits_inside_words_are_undone():
+    assert normalize("The password is p4ssw0rd") == ("The password is password", {"4": "A", "0": "O"})
+    assert normalize("W0RD") == ("WORD", {"0": "O"})
+
+
+def test_numbers_and_trailing_digits_are_kept():
+    for text in ("MERLIN2024", "Level5", "4th", "10 lines"):
+        assert normalize(text) == (text, {}), text
@@ -0,0 +1,26 @@
+import pytest
+
+from llm_extractor import PasswordExtractor, extract_many, tagged_candidates
+
+
+@pytest.fixture(scope="module")
+def level_1_replies(corpus):
+    replies = [entry["response"] for entry in corpus if entry["level"] == 1]
+    # Empty replies keep their slot in the output
+    return (replies + ["", None]) * 4
+
+
+def test_serial_results_carry_tagged_candidates(level_1_replies):
+    results = list(extract_many(1, level_1_replies))
+    assert [result["index"] for result in results] == list(range(len(level_1_replies)))
+    for result, response in zip(results, level_1_replies):
+        candidates = tagged_candidates(1, response) if response else []
+        assert result["candidates"] == candidates
+        assert result["password"] == (candidates[0]["word"] if candidates else None)
+
+
+def test_workers_match_the_serial_order_and_output(level_1_replies):
+    serial = list(extract_many(1, level_1_replies))
+    # Small chunks and a small window so results arrive from many chunks in flight
+    parallel = list(PasswordExtractor().extract_many(1, iter(level_1_replies), workers=2, chunk_size=3, window=1))
+    assert parallel == serial
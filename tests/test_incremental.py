@@ -0,0 +1,75 @@
+from incremental import IncrementalExtractor
+from llm_extractor import PasswordExtractor
+
+
+class CountingExtractor(PasswordExtractor):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def rule_based(self, level, response):
+        self.calls.append(response)
+        return super().rule_based(level, response)
+
+
+def render(incremental, text, step=4):
+    for end in range(step, len(text) + step, step):
+        incremental.update(text[:end])
+
+
+def test_extracts_while_rendering_and_skips_final_pass():
+    extractor = CountingExtractor()
+    incremental = IncrementalExtractor(extractor, 1)
+    body = 'The password is "WIZARD".'
+    render(incremental, body)
+    assert incremental.provisional == "WIZARD"
+    assert len(extractor.calls) == 1
+
+    assert incremental.finish(body + "\n– Merlin") == "WIZARD"
+    assert not incremental.rechecked
+    assert len(extractor.calls) == 1
+
+
+def test_reversed_level_uses_level_pipeline():
+    incremental = IncrementalExtractor(PasswordExtractor(), 2)
+    body = 'The password in reverse is "TEMLEH".'
+    render(incremental, body)
+    assert incremental.finish(body) == "HELMET"
+
+
+def test_rechecks_when_content_follows_the_check():
+    extractor = CountingExtractor()
+    incremental = IncrementalExtractor(extractor, 1)
+    render(incremental, 'I shall not say "NEVER", young one.')
+    assert incremental.checked_text is not None
+    final = 'I shall not say "NEVER". But the password is "SACRED". – Merlin'
+    incremental.finish(final)
+    assert incremental.rechecked
+    assert extractor.calls[-1] == final
+    assert incremental.confirmed == PasswordExtractor().rule_based(1, final)
+
+
+def test_single_render_runs_one_pass():
+    extractor = CountingExtractor()
+    incremental = IncrementalExtractor(extractor, 1)
+    final = 'The password is "SACRED". – Merlin'
+    assert incremental.finish(final) == "SACRED"
+    assert len(extractor.calls) == 1
+
+
+def test_other_levels_are_not_tracked():
+    extractor = CountingExtractor()
+    incremental = IncrementalExtractor(extractor, 5)
+    render(incremental, "Dancing flames\nRising\nAncient\n")
+    assert incremental.provisional is None
+    assert extractor.calls == []
+
+
+def test_matches_full_extraction_on_corpus(corpus):
+    for entry in corpus:
+        if entry["level"] > 3:
+            continue
+        incremental = IncrementalExtractor(PasswordExtractor(), entry["level"])
+        render(incremental, entry["response"])
+        expected = PasswordExtractor().rule_based(entry["level"], entry["response"])
+        assert incremental.finish(entry["response"]) == expected, entry["id"]
@@ -0,0 +1,65 @@
+import pytest
+
+from conftest import FakeLLM
+from llm_cache import MISS, LLMCache
+from llm_extractor import LLMExtractor, PasswordExtractor
+
+REPLY = "Whispers drift\nIn twilight\nZephyrs call\n– Merlin"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(path=str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_entries_expire_and_negatives_read_as_none(cache):
+    cache.put("k", ["WIZARD"], ttl=60)
+    cache.put_negative("n")
+    cache.put("old", ["WAND"], ttl=-1)
+    assert cache.get("k") == ["WIZARD"]
+    assert cache.get("n") is None
+    assert cache.get("old") is MISS
+    assert cache.get("missing") is MISS
+
+
+def test_disk_tier_is_shared_between_instances(cache):
+    cache.put("k", "WIZARD")
+    other = LLMCache(path=cache.path)
+    assert other.get("k") == "WIZARD"
+    other.delete("k")
+    other.close()
+    cache._memory.clear()
+    assert cache.get("k") is MISS
+
+
+def test_rejected_answer_is_dropped_from_the_cache(cache):
+    extractor = PasswordExtractor(llm_client=FakeLLM("WIZARD, WAND, STAFF"), cache=cache)
+    assert extractor.llm_candidates(4, "prompt", REPLY) == ["WIZARD", "WAND", "STAFF"]
+    assert extractor.llm_candidates(4, "prompt", REPLY) == ["WIZARD", "WAND", "STAFF"]
+    assert len(extractor.llm.requests) == 1
+
+    extractor.record_llm_outcome("WIZARD", accepted=False)
+    extractor.llm_candidates(4, "prompt", REPLY)
+    assert len(extractor.llm.requests) == 2
+
+
+def test_accepted_answer_stays_cached(cache):
+    extractor = PasswordExtractor(llm_client=FakeLLM("WIZARD"), cache=cache)
+    extractor.llm_fallback(1, "prompt", REPLY)
+    extractor.record_llm_outcome("WIZARD", accepted=True)
+    extractor.llm_fallback(1, "prompt", REPLY)
+    assert len(extractor.llm.requests) == 1
+
+
+def test_requests_and_cache_keys_use_the_providers_model(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_DISABLE", "1")
+    monkeypatch.setenv("GROQ_API_KEY", "test")
+    monkeypatch.setenv("GROQ_MODEL", "llama-test")
+    extractor = LLMExtractor(provider="groq").extractor
+    extractor.llm = FakeLLM("WIZARD")
+    extractor.rate_limiter = None
+    extractor.llm_fallback(1, "prompt", REPLY)
+    assert extractor.llm.requests[0]["model"] == "llama-test"
+    assert extractor.model == "llama-test"
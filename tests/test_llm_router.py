@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("groq")
+
+from llm_router import LLMRouter, build_client
+from rate_limiter import RateLimiter
+
+MESSAGES = [{"role": "user", "content": "Level 4"}]
+
+
+class FakeEndpoint:
+    """Local OpenAI-compatible /chat/completions server with a scripted answer, delay or status"""
+
+    def __init__(self, content="WIZARD", delay=0.0, status=200):
+        self.content = content
+        self.delay = delay
+        self.status = status
+        self.requests = []
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                endpoint.requests.append(body)
+                time.sleep(endpoint.delay)
+                if endpoint.status != 200:
+                    payload = {"error": {"message": "scripted failure", "type": "fake"}}
+                else:
+                    payload = {
+                        "id": "fake", "object": "chat.completion", "created": 0, "model": body["model"],
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": endpoint.content}}],
+                    }
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(endpoint.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("x-should-retry", "false")  # the router fails over, not the SDK
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def base_url(self, provider):
+        root = f"http://127.0.0.1:{self.server.server_address[1]}"
+        # The Groq SDK appends /openai/v1 itself
+        return root + "/v1" if provider == "openai" else root
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def endpoints(monkeypatch):
+    servers = {"openai": FakeEndpoint("WIZARD"), "groq": FakeEndpoint("WAND")}
+    monkeypatch.setenv("LLM_PROVIDERS", "openai,groq")
+    monkeypatch.setenv("RATE_LIMIT_DISABLE", "1")
+    for name, server in servers.items():
+        monkeypatch.setenv(f"{name.upper()}_API_KEY", "test")
+        monkeypatch.setenv(f"{name.upper()}_BASE_URL", server.base_url(name))
+    monkeypatch.setenv("GROQ_MODEL", "llama-test")
+    yield servers
+    for server in servers.values():
+        server.close()
+
+
+def answer(completion):
+    return completion.choices[0].message.content
+
+
+def test_router_sends_each_provider_its_own_model(endpoints):
+    router = LLMRouter.from_env()
+    assert [name for name, _, _ in router.providers] == ["openai", "groq"]
+    # Untried providers are measured first, so two calls reach both
+    answers = {answer(router.chat.completions.create(model="ignored", messages=MESSAGES)) for _ in range(2)}
+    assert answers == {"WIZARD", "WAND"}
+    assert endpoints["openai"].requests[0]["model"] == "gpt-4o"
+    assert endpoints["groq"].requests[0]["model"] == "llama-test"
+    assert router.model == "router:openai/gpt-4o,groq/llama-test"
+
+
+def test_router_prefers_the_faster_provider(endpoints):
+    endpoints["openai"].delay = 0.2
+    router = LLMRouter.from_env()
+    for _ in range(2):
+        router.create(messages=MESSAGES)
+    assert router.ranked()[0][0] == "groq"
+    assert answer(router.create(messages=MESSAGES)) == "WAND"
+
+
+def test_router_fails_over_on_errors_and_marks_the_provider_unhealthy(endpoints):
+    endpoints["openai"].status = 500
+    router = LLMRouter.from_env()
+    assert answer(router.create(messages=MESSAGES)) == "WAND"
+    snapshot = router.snapshot()
+    assert snapshot["openai/gpt-4o"]["error_rate"] > 0
+    assert snapshot["groq/llama-test"]["error_rate"] == 0
+
+
+def test_rate_limited_provider_is_penalized_for_everyone(endpoints, tmp_path):
+    endpoints["openai"].status = 429
+    router = LLMRouter.from_env()
+    path = str(tmp_path / "buckets.mmap")
+    router.rate_limiter = RateLimiter(path=path, limits={"openai": (100.0, 10.0), "groq": (100.0, 10.0)})
+    assert answer(router.create(messages=MESSAGES)) == "WAND"
+    # Another process sharing the buckets now has to wait for openai
+    other = RateLimiter(path=path, limits={"openai": (100.0, 10.0)})
+    assert other.buckets()["openai"]["blocked_for"] > 0
+
+
+def test_hedged_request_is_answered_by_the_backup(endpoints):
+    endpoints["openai"].delay = 1.0
+    router = LLMRouter([("openai", build_client("openai"), "gpt-4o"), ("groq", build_client("groq"), "llama-test")],
+                       hedge=True, hedge_delay=0.05, min_hedge_delay=0.05)
+    start = time.perf_counter()
+    assert answer(router.create(messages=MESSAGES)) == "WAND"
+    assert time.perf_counter() - start < 0.9
+
+
+def test_extractor_reads_candidates_through_the_router(endpoints, monkeypatch):
+    from llm_extractor import LLMExtractor
+
+    endpoints["openai"].content = endpoints["groq"].content = "WIZARD, WAND, STAFF"
+    monkeypatch.setenv("LLM_CACHE_DISABLE", "1")
+    extractor = LLMExtractor(provider="router")
+    assert extractor.extractor.llm_candidates(4, "prompt", "Whispers\nIn\nZephyrs\n– Merlin") == \
+        ["WIZARD", "WAND", "STAFF"]
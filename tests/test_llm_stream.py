@@ -0,0 +1,87 @@
+from conftest import FakeLLM
+from llm_cache import LLMCache
+from llm_extractor import LLMExtractor, PasswordExtractor, StreamWordDetector
+
+
+def stream_words(text, step=3):
+    detector = StreamWordDetector(lambda word: True)
+    words = []
+    for i in range(0, len(text), step):
+        words += detector.feed(text[i:i + step])
+    return words + detector.finish()
+
+
+def test_label_words_are_not_candidates():
+    assert stream_words("Answer: GLIMMER") == ["GLIMMER"]
+    assert stream_words("REVERSED: AURORA\n") == ["AURORA"]
+
+
+def test_rewritten_and_listed_words():
+    assert stream_words("ARUORA → AURORA") == ["AURORA"]
+    assert stream_words("WIZARD, WAND, STAFF") == ["WIZARD", "WAND", "STAFF"]
+
+
+def test_word_is_final_at_terminator():
+    detector = StreamWordDetector(lambda word: True)
+    assert detector.feed("GLIM") == []
+    assert detector.feed("MER") == []
+    assert detector.feed(",") == ["GLIMMER"]
+
+
+def test_streamed_results_use_their_own_cache_key(tmp_path):
+    cache = LLMCache(path=str(tmp_path / "cache.sqlite"))
+    extractor = PasswordExtractor(llm_client=FakeLLM("ANSWER: GLIMMER"), cache=cache)
+    extractor._is_english_word = lambda word: word == "GLIMMER"
+    extractor.stream = True
+    assert extractor.llm_fallback(1, "prompt", 'The password is "GLIMMER"') == "GLIMMER"
+
+    # The non-streamed path must not be answered from the early-stopped entry
+    extractor.stream = False
+    extractor.llm = FakeLLM("WIZARD")
+    extractor.llm_fallback(1, "prompt", 'The password is "GLIMMER"')
+    assert len(extractor.llm.requests) == 1
+    cache.close()
+
+
+def test_router_turns_streaming_off(monkeypatch):
+    monkeypatch.setenv("LLM_STREAM", "true")
+    monkeypatch.setenv("LLM_PROVIDERS", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("LLM_CACHE_DISABLE", "1")
+    extractor = LLMExtractor(provider="router")
+    assert extractor.client is not None
+    assert extractor.extractor.stream is False
+
+
+def streamed(content, k=1, cache=None):
+    extractor = PasswordExtractor(llm_client=FakeLLM(content), cache=cache)
+    extractor.stream = True
+    if k == 1:
+        return extractor.llm_fallback(1, "prompt", 'The password is "GLIMMER"')
+    return extractor.llm_candidates(4, "prompt", "Whispers\nIn\nZephyrs\n– Merlin", k=k)
+
+
+def test_fake_stream_keeps_token_whitespace():
+    chunks = FakeLLM("Sure, here it is: GLIMMER").create(stream=True)
+    assert "".join(chunk.choices[0].delta.content for chunk in chunks) == "Sure, here it is: GLIMMER"
+
+
+def test_chatty_preamble_is_read_past():
+    assert streamed("Sure, here it is: GLIMMER") == "GLIMMER"
+    assert streamed("Okay. The word is GLIMMER.") == "GLIMMER"
+    assert streamed("Sure, here it is: GLIMMER", k=3) == ["GLIMMER"]
+
+
+def test_dictionary_word_stops_the_stream_early():
+    extractor = PasswordExtractor(llm_client=FakeLLM("GLIMMER, and a long tail the model never needs to send"))
+    extractor.stream = True
+    streams = []
+    create = extractor.llm.create
+
+    def keep_stream(**kwargs):
+        streams.append(create(**kwargs))
+        return streams[-1]
+
+    extractor.llm.chat.completions.create = keep_stream
+    assert extractor.llm_fallback(1, "prompt", "reply") == "GLIMMER"
+    assert next(streams[0], None) is not None  # the tail was never read
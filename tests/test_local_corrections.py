@@ -0,0 +1,103 @@
+import pytest
+
+from candidates import normalize
+from strategies import ResponseView, line_acrostic_preferred
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def held_out(monkeypatch, corpus):
+    """Word models trained without any corpus answer, as in the extraction benchmark"""
+    import anagram_index
+    import ngram_model
+    from anagram_index import AnagramIndex
+    from ngram_model import CharNgramModel
+    from wordlist import load_words
+
+    answers = {normalize(entry["password"]) for entry in corpus if entry["password"]}
+    words = [word for word in load_words() if word not in answers]
+    monkeypatch.setattr(ngram_model, "_model", CharNgramModel.train(words))
+    monkeypatch.setattr(anagram_index, "_index", AnagramIndex(words))
+
+
+def test_level_7_last_word_readings_win_over_initials(held_out, corpus):
+    entries = [entry for entry in corpus if entry["level"] == 7 and entry["category"] == "last_word"]
+    assert entries
+    for entry in entries:
+        # The initials (IWTOWN, BWTP, ...) spell nothing; the last words do
+        assert line_acrostic_preferred(ResponseView(entry["response"])) is None, entry["id"]
+
+
+def test_level_7_acrostic_still_read_when_it_spells_a_word(held_out):
+    response = "Sun rises slowly\nTrees are quiet\nAll is calm\nRiver is deep"
+    assert line_acrostic_preferred(ResponseView(response)) == "STAR"
+
+
+# ─────────────────────────────
+# Agent ordering
+# ─────────────────────────────
+@pytest.fixture
+def make_agent(agent_env):
+    from working_agent import WorkingHackMerlinAgent
+
+    from retry_planner import LLM, LOCAL, NEXT, RULE
+
+    def local_first(level, available, elapsed=0.0):
+        return next((action for action in (RULE, LOCAL, NEXT, LLM) if action in available), None)
+
+    class Agent(WorkingHackMerlinAgent):
+        def __init__(self, answer, replies, ai_candidates):
+            super().__init__()
+            self.answer_store = None
+            self.answer = answer
+            self.replies = list(replies)
+            self.submitted = []
+            self.retry_planner.choose = local_first  # submit local corrections before asking the LLM
+            extractor = self.password_extractor.extractor
+            extractor.llm = object()  # any client: llm_candidates is replaced below
+            extractor.llm_candidates = lambda level, prompt, response, k=3: list(ai_candidates)
+
+        def ask_merlin(self, prompt):
+            return True
+
+        def get_merlin_response(self, on_text=None):
+            return self.replies.pop(0) if self.replies else None
+
+        def enter_password(self, password):
+            self.submitted.append(password)
+            return password == self.answer
+
+        def handle_congrats_screen(self):
+            return True
+
+        def _pause(self, seconds):
+            pass
+
+    agents = []
+
+    def make(*args):
+        agent = Agent(*args)
+        agents.append(agent)
+        return agent
+
+    yield make
+    for agent in agents:
+        agent.cleanup()
+
+
+def test_near_corrections_wait_for_the_llm(make_agent, corpus):
+    entry = next(entry for entry in corpus if entry["id"] == "l7-comma")
+    agent = make_agent(entry["password"], [entry["response"]], [entry["password"]])
+    assert agent.solve_level(7)
+    # TOKEN is a letter longer than the TONE reading: only worth a Submit once the LLM has answered
+    assert "TOKEN" not in agent.submitted
+    assert agent.submitted[-1] == entry["password"]
+
+
+def test_near_corrections_are_submitted_without_an_llm(make_agent, corpus):
+    entry = next(entry for entry in corpus if entry["id"] == "l7-comma")
+    agent = make_agent("TOKEN", [entry["response"]], [])
+    agent.password_extractor.extractor.llm = None
+    assert agent.solve_level(7)
+    assert agent.submitted[-1] == "TOKEN"
@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+import ngram_model
+from ngram_model import CharNgramModel, get_model, source_key
+
+
+@pytest.fixture
+def cached(monkeypatch, tmp_path):
+    """Fresh shared-model state with the cache file and word lists under tmp_path"""
+    monkeypatch.setenv("NGRAM_MODEL_PATH", str(tmp_path / "char_ngram.npz"))
+    monkeypatch.setattr(ngram_model, "_model", None)
+    monkeypatch.setattr(ngram_model, "_model_failed", False)
+
+    def use(words, name):
+        path = tmp_path / name
+        path.write_text("\n".join(words) + "\n")
+        monkeypatch.setenv("WORDLIST_PATH", str(path))
+        monkeypatch.setattr(ngram_model, "_model", None)
+        return get_model()
+
+    return use
+
+
+def test_cached_model_is_reused_for_the_same_word_list(cached, monkeypatch):
+    model = cached(["wizard", "wand", "staff"], "a.txt")
+    assert model.source == source_key()
+    monkeypatch.setattr(ngram_model, "build", lambda *args, **kwargs: pytest.fail("retrained"))
+    monkeypatch.setattr(ngram_model, "_model", None)
+    assert get_model().source == model.source
+
+
+def test_new_word_list_retrains_the_cached_model(cached):
+    first = cached(["wizard", "wand", "staff"], "a.txt")
+    second = cached(["zzyzx", "qwfp", "xylyl"], "b.txt")
+    assert second.source == source_key() != first.source
+    assert second.rank(["QWFPX", "WIZARD"])[0] == "QWFPX"
+
+
+def test_model_cached_without_a_source_is_retrained(cached, tmp_path):
+    CharNgramModel.train(["wizard", "wand"]).save(str(tmp_path / "char_ngram.npz"))
+    assert CharNgramModel.load(str(tmp_path / "char_ngram.npz")).source is None
+    assert cached(["ember", "lantern"], "c.txt").source == source_key()
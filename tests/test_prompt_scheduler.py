@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from prompt_scheduler import PromptScheduler
+
+PROMPTS = ["acrostic", "riddle", "story"]
+
+
+@pytest.fixture(params=["thompson", "ucb"])
+def scheduler(request, tmp_path):
+    return PromptScheduler(path=str(tmp_path / "prompt_stats.sqlite"), strategy=request.param, rng=random.Random(7))
+
+
+def test_unknown_strategy_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        PromptScheduler(path=str(tmp_path / "prompt_stats.sqlite"), strategy="greedy")
+
+
+def test_ucb_tries_every_untried_prompt_first(tmp_path):
+    scheduler = PromptScheduler(path=str(tmp_path / "prompt_stats.sqlite"), strategy="ucb")
+    scheduler.record(6, "acrostic", success=True, latency=0.5)
+    tried = []
+    for _ in PROMPTS[1:]:
+        prompt = scheduler.choose(6, PROMPTS, exclude=tried)
+        tried.append(prompt)
+        scheduler.record(6, prompt, success=False, latency=1.0)
+    assert sorted(tried) == ["riddle", "story"]
+
+
+def test_winning_prompt_leads_the_rankings_and_is_chosen(scheduler):
+    for prompt in PROMPTS:
+        scheduler.record(7, prompt, success=False, latency=2.0)
+    for _ in range(20):
+        scheduler.record(7, "story", success=True, latency=1.0)
+        scheduler.record(7, "riddle", success=False, latency=2.0)
+
+    rankings = scheduler.rankings(7)
+    assert [row["prompt"] for row in rankings][0] == "story"
+    assert rankings[0]["trials"] == 21
+    assert rankings[0]["success_rate"] == pytest.approx(21 / 23)
+    picks = [scheduler.choose(7, PROMPTS) for _ in range(20)]
+    assert picks.count("story") >= 18
+
+
+def test_exclude_skips_prompts_tried_this_attempt(scheduler):
+    for _ in range(10):
+        scheduler.record(6, "story", success=True, latency=1.0)
+    assert scheduler.choose(6, PROMPTS, exclude=["story"]) in ("acrostic", "riddle")
+    # With everything excluded the full list is used again
+    assert scheduler.choose(6, PROMPTS, exclude=PROMPTS) in PROMPTS
+
+
+def test_levels_keep_separate_statistics(scheduler):
+    scheduler.record(6, "story", success=True, latency=1.0)
+    assert [row["prompt"] for row in scheduler.rankings(6)] == ["story"]
+    assert scheduler.rankings(7) == []
+    assert scheduler.rankings(6)[0]["mean_latency"] == 1.0
+
+
+def test_statistics_persist_across_instances(scheduler):
+    scheduler.record(6, "riddle", success=True, latency=3.0)
+    other = PromptScheduler(path=scheduler.path, strategy=scheduler.strategy)
+    assert other.rankings(6)[0]["prompt"] == "riddle"
+    assert other.rankings(6)[0]["trials"] == 1
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from rate_limiter import HIGH, LOW, NORMAL, RateLimiter, backoff_delay, is_rate_limited, parse_limits, retry_after
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return RateLimiter(path=str(tmp_path / "buckets.mmap"), limits={"test": (10.0, 4)}, max_wait=1.0)
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers=None):
+        super().__init__("429")
+        self.status_code = 429
+        self.response = SimpleNamespace(status_code=429, headers=headers or {})
+
+
+def test_parse_limits():
+    assert parse_limits("openai=3:10, groq=0.5:5") == {"openai": (3.0, 10.0), "groq": (0.5, 5.0)}
+    assert parse_limits("openai=0.5") == {"openai": (0.5, 1.0)}
+    assert parse_limits("openai=2:0.5") == {"openai": (2.0, 1.0)}
+    assert parse_limits("") == {}
+
+
+@pytest.mark.parametrize("priority", [HIGH, NORMAL, LOW])
+def test_single_token_bucket_serves_every_priority(tmp_path, priority):
+    limiter = RateLimiter(path=str(tmp_path / "b.mmap"), limits=parse_limits("openai=0.5"), max_wait=0.5)
+    start = time.time()
+    assert limiter.acquire("openai", priority=priority)
+    assert time.time() - start < 0.1
+
+
+def test_burst_then_wait(limiter):
+    start = time.time()
+    for _ in range(4):
+        assert limiter.acquire("test", priority=HIGH)
+    assert time.time() - start < 0.05
+    assert limiter.acquire("test", priority=HIGH)
+    assert time.time() - start >= 0.08  # one token at 10/s
+
+
+def test_lower_priorities_leave_a_reserve(limiter):
+    taken = 0
+    while limiter._try_take("test", LOW) == 0:
+        taken += 1
+    # LOW keeps half of the three tokens beyond the one it takes
+    assert taken == 2
+    assert limiter._try_take("test", HIGH) == 0
+
+
+def test_penalize_blocks_other_instances(limiter):
+    other = RateLimiter(path=limiter.path, limits=limiter.limits, max_wait=0.1)
+    limiter.penalize("test", 5.0)
+    assert other._try_take("test", HIGH) > 4.0
+    assert not other.acquire("test", max_wait=0.05)
+    assert other.buckets()["test"]["blocked_for"] > 4.0
+
+
+def test_retry_after_and_backoff():
+    assert is_rate_limited(RateLimitError())
+    assert not is_rate_limited(ValueError())
+    assert retry_after(RateLimitError({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(RateLimitError({"retry-after": "3"})) == 3.0
+    assert retry_after(RateLimitError()) is None
+    assert 2.0 <= backoff_delay(0, retry_after=2.0) <= 2.5
+    assert 0 <= backoff_delay(3) <= 4.0
+
+
+def test_async_pool_uses_limiter_and_retries_429(limiter, monkeypatch):
+    from async_llm import AsyncLLMPool
+
+    monkeypatch.setattr("async_llm.backoff_delay", lambda attempt, retry=None: 0.01)
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise RateLimitError()
+        return "completion"
+
+    pool = AsyncLLMPool()
+    pool.rate_limiter = limiter
+    pool._clients["test"] = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    assert asyncio.run(pool.create("test", model="m")) == "completion"
+    assert len(calls) == 2
+    assert limiter.stats["acquired"] == 2
+    assert limiter.stats["penalties"] == 1
+
+
+class RecordingLimiter:
+    """Stands in for the process-wide limiter and notes each caller's priority"""
+
+    def __init__(self):
+        self.calls = []
+
+    def acquire(self, key, priority=NORMAL, max_wait=None):
+        self.calls.append((key, priority))
+        return True
+
+
+def test_agents_sharing_a_limiter_keep_their_own_priority(agent_env):
+    from conftest import FakeLLM
+    from working_agent import WorkingHackMerlinAgent
+
+    shared = RecordingLimiter()
+
+    class Agent(WorkingHackMerlinAgent):
+        def __init__(self, other=None):
+            super().__init__()
+            self.other = other
+            self.rate_limiter = shared
+            extractor = self.password_extractor.extractor
+            extractor.llm, extractor.rate_limiter, extractor.rate_key = FakeLLM("WIZARD"), shared, "openai"
+
+        def _solve_level(self, level):
+            if self.other:
+                self.other.solve_level(1)  # another session in the process moves on meanwhile
+            self._throttle_game()
+            self.password_extractor.extractor.llm_fallback(level, "prompt", "reply")
+            return False
+
+    early = Agent()
+    late = Agent(other=early)
+    try:
+        late.solve_level(7)
+    finally:
+        early.cleanup()
+        late.cleanup()
+    assert shared.calls == [("hackmerlin.io", NORMAL), ("openai", NORMAL),
+                            ("hackmerlin.io", HIGH), ("openai", HIGH)]
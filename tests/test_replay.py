@@ -0,0 +1,37 @@
+import os
+
+from transcript import TranscriptReplayer
+
+EVENTS = [
+    {"kind": "level", "level": 1, "t": 0.0},
+    {"kind": "ask", "level": 1, "prompt": "p", "t": 0.0},
+    {"kind": "response", "level": 1, "text": 'The password is "WIZARD". – Merlin', "t": 0.1},
+    {"kind": "submit", "password": "WIZARD", "accepted": True, "t": 0.2},
+]
+
+
+def test_replay_agent_opens_no_live_resources(monkeypatch, tmp_path):
+    # Everything a live session would open, configured to land in tmp_path
+    for name, value in (("TRANSCRIPT_DIR", str(tmp_path / "transcripts")),
+                        ("ATTEMPT_STORE_PATH", str(tmp_path / "attempts.sqlite")),
+                        ("ANSWER_STORE_PATH", str(tmp_path / "answers.sqlite")),
+                        ("LLM_CACHE_PATH", str(tmp_path / "cache.sqlite")),
+                        ("METRICS_TEXTFILE", str(tmp_path / "metrics.prom")),
+                        ("PROFILE", "run"), ("PROFILE_DIR", str(tmp_path / "profiles")),
+                        ("LLM_PROVIDER", "openai"), ("OPENAI_API_KEY", "test")):
+        monkeypatch.setenv(name, value)
+
+    replayer = TranscriptReplayer(EVENTS)
+    agent = replayer.make_agent()
+    assert agent.password_extractor.client is None
+    assert agent.retry_planner.store is None
+    assert (agent.attempt_store, agent.answer_store, agent.recorder) == (None, None, None)
+    assert (agent.rate_limiter, agent.metrics_exporter, agent.profiler) == (None, None, None)
+    assert agent.solve_level(1)
+    agent.cleanup()
+    assert os.listdir(tmp_path) == []
+
+
+def test_replay_reaches_the_recorded_answer(agent_env):
+    results = TranscriptReplayer(EVENTS).run()
+    assert [(r["level"], r["solved"], r["recorded_answer"]) for r in results] == [(1, True, "WIZARD")]
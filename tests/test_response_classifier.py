@@ -0,0 +1,45 @@
+import pytest
+
+from response_classifier import (COMMA_POEM, DIRECT, GREETING, LINE_POEM, PAGE_NOISE, REFUSAL, REVERSED,
+                                 classify)
+
+PAGE = "HackMerlin\nLevel 1\nMerlin is guarding the secret password. Ask him anything.\nAsk\n{}Secret password\nSubmit"
+
+
+def test_every_answered_corpus_reply_is_extracted(corpus):
+    for entry in corpus:
+        if entry["password"]:
+            assert classify(entry["response"]).has_answer, entry["id"]
+
+
+def test_unanswered_corpus_refusals_are_reasked(corpus):
+    for entry in corpus:
+        if entry["password"] is None and entry["category"] == "blocking":
+            assert classify(entry["response"]).label == REFUSAL, entry["id"]
+
+
+def test_page_fallback_poem_is_a_poem(corpus):
+    entry = next(e for e in corpus if e["id"] == "l5-page-poem")
+    assert classify(entry["response"]).label == LINE_POEM
+
+
+@pytest.mark.parametrize("text, label", [
+    ('I cannot reveal it... but the word is "aurora"', DIRECT),
+    ("I'm not allowed to do that. Yet the word is WIZARD.", DIRECT),
+    ("Cannot comply.\nBound by oath.\n– Merlin", REFUSAL),
+    ("Cannot comply.\nHollow winds\nEchoes rise\nLight of torches\n– Merlin", LINE_POEM),
+    ("Hello traveler! Ask me anything...", GREETING),
+    ('Hello traveler, the password is "SACRED"', DIRECT),
+    (PAGE.format(""), PAGE_NOISE),
+    (PAGE.format('It reads "TSOHG" backwards.\n– Merlin\n'), REVERSED),
+    ("Dancing flames, Rising high, Ancient stars, Glowing bright", COMMA_POEM),
+    # Poem shape wins over reversal cues and quoted or all-caps words
+    ("Hollow winds reverse their course\nEchoes fade\nLanterns glow\nMoonlight falls\nEmbers rise\n"
+     "Twilight ends\n– Merlin", LINE_POEM),
+    ("Heroes walk the GOLDEN road\nEchoes call\nLight returns\n– Merlin", LINE_POEM),
+    ('Hidden path, Ever "BRIGHT" glow, Lonely stars, Misty dawn', COMMA_POEM),
+    ("Ancient runes, Read them backward, Sealed in stone", COMMA_POEM),
+    ('Read it backward, traveler: "TSOHG"', REVERSED),
+])
+def test_labels(text, label):
+    assert classify(text).label == label
@@ -0,0 +1,49 @@
+from response_region import UI_LINE_RE, cap, locate
+from candidates import normalize
+from strategies import ResponseView, registry
+
+
+def test_ui_lines_match_exactly():
+    for line in ("HackMerlin", "  Submit ", "Level 5", "Made by the HackMerlin team", "Reset",
+                 "Merlin is guarding the secret password. Ask him anything."):
+        assert UI_LINE_RE.match(line), line
+    for line in ("Reset the stars above", "Made by moonlight", "Congratulations are due", "Asking winds"):
+        assert not UI_LINE_RE.match(line), line
+
+
+def test_poem_lines_that_look_like_ui_survive():
+    page = ("HackMerlin\nLevel 5\nAsk\n"
+            "Made by moonlight\nEmbers glow\nReset the stars\nLanterns high\nIvy grows\nNight falls\n"
+            "– Merlin\nSecret password\nSubmit")
+    region = locate(page)
+    assert region.text.splitlines()[0] == "Made by moonlight"
+    assert normalize(next(registry.hits(5, region.text))[0]) == "MERLIN"
+
+
+def test_cap_bounds_characters_and_lines():
+    assert cap("a\n" * 100, max_chars=1000, max_lines=10) == ("\n".join(["a"] * 10), True)
+    assert cap("x" * 50, max_chars=10) == ("x" * 10, True)
+    assert cap("short", max_chars=10) == ("short", False)
+
+
+def test_strategy_cap_is_deterministic(monkeypatch):
+    text = "no password here at all"
+    monkeypatch.setenv("EXTRACT_MAX_STRATEGIES", "1")
+    view = ResponseView(text)
+    assert list(registry.hits(1, view)) == []
+    assert view.budget_exhausted
+
+    monkeypatch.setenv("EXTRACT_MAX_STRATEGIES", "0")
+    view = ResponseView(text)
+    assert [word for word, _ in registry.hits(1, view)] == ["PASSWORD"]
+    assert not view.budget_exhausted
+
+
+def test_caps_and_data_dir_are_read_when_used(monkeypatch, tmp_path):
+    # .env is loaded after the imports, so settings must not be frozen at import time
+    import storage
+
+    monkeypatch.setenv("EXTRACT_MAX_LINES", "2")
+    assert cap("a\nb\nc\nd") == ("a\nb", True)
+    monkeypatch.setenv("HACKMERLIN_DATA_DIR", str(tmp_path))
+    assert storage.data_path("x.sqlite") == str(tmp_path / "x.sqlite")
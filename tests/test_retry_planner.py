@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from retry_planner import LLM, LOCAL, NEXT, REASK, RULE, RetryPlanner
+
+
+class FakeAttemptStore:
+    """The part of AttemptStore the planner reads"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def recent(self, level=None, limit=20):
+        return [row for row in self.rows if level is None or row["level"] == level][:limit]
+
+
+def attempt(level, attempt_number, outcome, candidates, timings=None):
+    return {
+        "level": level,
+        "attempt": attempt_number,
+        "response": "reply",
+        "outcome": outcome,
+        "candidates": json.dumps([{"password": p, "source": s, "accepted": a} for p, s, a in candidates]),
+        "timings": json.dumps(timings or {}),
+    }
+
+
+def ladder(planner, level, steps):
+    """Actions chosen as each step in turn becomes unavailable; steps: {action: seconds override or None}"""
+    order = []
+    available = dict(steps)
+    while available:
+        action = planner.choose(level, available)
+        order.append(action)
+        del available[action]
+    return order
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_fresh_planner_keeps_the_old_order_at_levels_1_to_3(level):
+    planner = RetryPlanner()
+    steps = {RULE: None, NEXT: None, LOCAL: None, LLM: None, REASK: None}
+    assert ladder(planner, level, steps) == [RULE, NEXT, LOCAL, LLM, REASK]
+    # A finished speculative call costs only its Submit, and still waits for local corrections
+    assert planner.choose(level, {LOCAL: None, LLM: 0.0}) == LOCAL
+    assert planner.choose(level, {NEXT: None, LLM: 0.0}) == NEXT
+
+
+@pytest.mark.parametrize("level", [4, 5, 6, 7])
+def test_fresh_planner_tries_local_corrections_before_the_llm_at_levels_4_plus(level):
+    planner = RetryPlanner()
+    assert ladder(planner, level, {LOCAL: None, LLM: None, REASK: None}) == [LOCAL, LLM, REASK]
+    # Pending local corrections are submitted before the LLM is asked
+    assert planner.choose(level, {NEXT: None, LLM: None}) == NEXT
+
+
+def test_history_moves_the_llm_ahead_of_local_corrections():
+    rows = [attempt(5, 1, "solved", [("GHOST", "llm_candidates", True)], {"llm": 1.0}) for _ in range(20)]
+    rows += [attempt(5, 1, "rejected", [("HOST", "local_correction", False)]) for _ in range(20)]
+    planner = RetryPlanner(store=FakeAttemptStore(rows))
+    assert planner.choose(5, {LOCAL: None, LLM: None}) == LLM
+    # Other levels keep their own history
+    assert planner.choose(4, {LOCAL: None, LLM: None}) == LOCAL
+
+
+def test_only_first_submission_of_an_action_credits_it():
+    rows = [attempt(4, 1, "solved", [("A", "llm_candidates", False), ("B", "llm_candidates", False),
+                                     ("C", "llm_candidates", True)])]
+    estimates = RetryPlanner(store=FakeAttemptStore(rows)).refresh(4)
+    assert (estimates[LLM].trials, estimates[LLM].successes) == (1, 0)
+    assert (estimates[NEXT].trials, estimates[NEXT].successes) == (2, 1)
+
+
+def test_reask_is_scored_on_reasks_only():
+    rows = [attempt(4, 1, "solved", [("GHOST", "llm_candidates", True)]) for _ in range(10)]
+    rows += [attempt(4, 2, "rejected", [("HOST", "llm_candidates", False)]),
+             attempt(4, 3, "solved", [("GHOST", "llm_candidates", True)])]
+    rows.append(attempt(4, 0, "solved", [("GHOST", "known_answer", True)]))
+    rows[-1]["response"] = None
+    estimates = RetryPlanner(store=FakeAttemptStore(rows)).refresh(4)
+    assert (estimates[REASK].trials, estimates[REASK].successes) == (2, 1)
+    assert estimates[NEXT].trials == 0
+
+
+def test_nothing_fits_in_the_remaining_budget():
+    planner = RetryPlanner(budget=10.0)
+    assert planner.choose(4, {LLM: None, REASK: None}, elapsed=9.0) is None
+    assert planner.choose(4, {}) is None
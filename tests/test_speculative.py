@@ -0,0 +1,81 @@
+import pytest
+
+
+@pytest.fixture
+def make_agent(agent_env, monkeypatch):
+    from working_agent import WorkingHackMerlinAgent
+
+    monkeypatch.setenv("SPECULATIVE_LLM", "true")
+
+    class Agent(WorkingHackMerlinAgent):
+        def __init__(self, answer, reply):
+            super().__init__()
+            self.answer_store = None
+            self.answer = answer
+            self.replies = [reply]
+            self.submitted = []
+            self.speculative = 0
+            extractor = self.password_extractor.extractor
+            extractor.llm = object()  # any client: llm_candidates is replaced below
+            extractor.llm_candidates = lambda level, prompt, response, k=3: [self.answer]
+            submit = self._llm_executor.submit
+
+            def speculate(*args):
+                self.speculative += 1
+                return submit(*args)
+
+            self._llm_executor.submit = speculate
+
+        def ask_merlin(self, prompt):
+            return True
+
+        def get_merlin_response(self, on_text=None):
+            return self.replies.pop(0) if self.replies else None
+
+        def enter_password(self, password):
+            self.submitted.append(password)
+            return password == self.answer
+
+        def handle_congrats_screen(self):
+            return True
+
+        def _pause(self, seconds):
+            pass
+
+    agents = []
+
+    def make(*args):
+        agent = Agent(*args)
+        agents.append(agent)
+        return agent
+
+    yield make
+    for agent in agents:
+        agent.cleanup()
+
+
+def test_confident_rule_answer_starts_no_llm_call(make_agent):
+    agent = make_agent("WIZARD", 'The password is "WIZARD". – Merlin')
+    assert agent.solve_level(1)
+    assert agent.speculative == 0
+
+
+def test_weak_rule_answer_starts_the_llm_alongside(make_agent):
+    # Only the capitalized-word strategy (prior confidence 0.6) fires
+    agent = make_agent("LANTERN", "The secret word is Lantern. – Merlin")
+    assert agent.solve_level(1)
+    assert agent.speculative == 1
+
+
+def test_rejections_lower_a_strategys_confidence():
+    from llm_extractor import PasswordExtractor
+    from strategies import StrategyRegistry
+
+    extractor = PasswordExtractor()
+    extractor.strategies = StrategyRegistry()  # keep the shared registry's counts out of it
+    assert extractor.rule_based(1, 'The password is "WIZARD". – Merlin') == "WIZARD"
+    assert extractor.rule_confidence("WIZARD") == pytest.approx(0.95)
+    assert extractor.rule_confidence("WAND") == 0.0
+    for _ in range(3):
+        extractor.record_rule_outcome("WIZARD", False)
+    assert extractor.rule_confidence("WIZARD") < 0.8
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Record-and-replay transcripts of agent runs
+
+TranscriptRecorder appends every interaction of a live run to a JSONL file:
+prompts sent, Merlin's raw replies, submissions with their notification
+text, level changes and LLM requests/responses with timings.
+
+TranscriptReplayer feeds a transcript back through solve_level and the
+extractors with a fake game transport and a fake LLM, either at full speed
+or at the recorded pace, so production failures can be reproduced and
+extractor changes benchmarked without a browser or network.
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────
+# Recording
+# ─────────────────────────────
+class TranscriptRecorder:
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    @classmethod
+    def from_env(cls, run_id):
+        """One transcript file per run under TRANSCRIPT_DIR, or None when unset"""
+        directory = os.getenv("TRANSCRIPT_DIR")
+        if not directory:
+            return None
+        try:
+            return cls(os.path.join(directory, f"{run_id}.jsonl"))
+        except Exception as e:
+            logger.error(f"Failed to open transcript: {e}")
+            return None
+
+    def record(self, kind, **data):
+        event = {"t": round(time.perf_counter() - self._start, 4), "ts": time.time(), "kind": kind}
+        event.update(data)
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def wrap_llm(self, client):
+        """Wrap an LLM client so every chat completion is recorded"""
+        return RecordingLLM(client, self) if client is not None else None
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class RecordingLLM:
+    """chat.completions.create proxy that records requests, responses and timings"""
+
+    def __init__(self, client, recorder):
+        self.client = client
+        self.recorder = recorder
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        start = time.perf_counter()
+        request = {k: v for k, v in kwargs.items() if k != "timeout"}
+        try:
+            completion = self.client.chat.completions.create(**kwargs)
+        except Exception as e:
+            self.recorder.record("llm", request=request, error=str(e), seconds=time.perf_counter() - start)
+            raise
+        if kwargs.get("stream"):
+            return _RecordingStream(completion, self.recorder, request, start)
+        content = completion.choices[0].message.content if completion.choices else None
+        self.recorder.record("llm", request=request, content=content, seconds=time.perf_counter() - start)
+        return completion
+
+
+class _RecordingStream:
+    """Pass a streamed completion through while collecting its text for the transcript"""
+
+    def __init__(self, stream, recorder, request, start):
+        self.stream = stream
+        self.recorder = recorder
+        self.request = request
+        self.start = start
+        self.parts = []
+        self._recorded = False
+
+    def __iter__(self):
+        for chunk in self.stream:
+            if chunk.choices:
+                self.parts.append(chunk.choices[0].delta.content or "")
+            yield chunk
+        self._finish(complete=True)
+
+    def close(self):
+        if hasattr(self.stream, "close"):
+            self.stream.close()
+        self._finish(complete=False)
+
+    def _finish(self, complete):
+        if not self._recorded:
+            self._recorded = True
+            self.recorder.record("llm", request=self.request, content="".join(self.parts),
+                                 complete=complete, seconds=time.perf_counter() - self.start)
+
+
+# ─────────────────────────────
+# Replay
+# ─────────────────────────────
+def load_events(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class FakeLLM:
+    """Serves recorded completions, matched on the exact messages sent"""
+
+    def __init__(self, events):
+        self._by_messages = defaultdict(list)
+        for event in events:
+            if event["kind"] == "llm" and event.get("content") is not None:
+                key = json.dumps(event["request"].get("messages"), sort_keys=True)
+                self._by_messages[key].append(event["content"])
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self.misses = 0
+
+    def create(self, messages=None, stream=False, **kwargs):
+        key = json.dumps(messages, sort_keys=True)
+        recorded = self._by_messages.get(key)
+        if not recorded:
+            self.misses += 1
+            raise LookupError("No recorded LLM response for this request")
+        # Replay repeated requests in recorded order, then keep the last answer
+        content = recorded.pop(0) if len(recorded) > 1 else recorded[0]
+        if stream:
+            return [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TranscriptReplayer:
+    def __init__(self, events, realtime=False):
+        self.events = events
+        self.realtime = realtime
+        self.exchanges = defaultdict(list)  # level -> [(ask_event, response_event)]
+        self.accepted = {}  # level -> password
+        self.rejected = defaultdict(set)
+        self.levels = []
+
+        level, pending_ask = None, None
+        for event in events:
+            kind = event["kind"]
+            if kind == "level":
+                level = event["level"]
+                if level not in self.levels:
+                    self.levels.append(level)
+            elif kind == "ask":
+                pending_ask = event
+            elif kind == "response" and pending_ask is not None:
+                self.exchanges[level].append((pending_ask, event))
+                pending_ask = None
+            elif kind == "submit":
+                if event.get("accepted"):
+                    self.accepted[level] = event["password"]
+                else:
+                    self.rejected[level].add(event["password"])
+
+    @classmethod
+    def from_file(cls, path, realtime=False):
+        return cls(load_events(path), realtime=realtime)
+
+    def make_agent(self):
+        """A WorkingHackMerlinAgent whose browser and LLM are served from the transcript"""
+        from llm_extractor import LLMExtractor, PasswordExtractor
+        from working_agent import WorkingHackMerlinAgent
+
+        replayer = self
+
+        class ReplayAgent(WorkingHackMerlinAgent):
+            def __init__(self):
+                # Session state only: replays never open the live stores, clients, transcripts or exporters
+                extractor = PasswordExtractor(llm_client=FakeLLM(replayer.events), cache=None)
+                self._init_session(LLMExtractor(provider=None, extractor=extractor))
+                self.speculative_llm = False
+                self._queue = {}
+                self._pending_response = None
+
+            def setup_driver(self):
+                return True
+
+            def navigate_to_hackmerlin(self):
+                return True
+
+            def ask_merlin(self, prompt):
+                queue = self._queue.setdefault(self.current_level, list(replayer.exchanges.get(self.current_level, [])))
+                if not queue:
+                    return False
+                ask, response = queue.pop(0)
+                if prompt != ask["prompt"]:
+                    logger.info(f"🎞️ Prompt differs from recording ('{ask['prompt']}'), replaying recorded reply")
+                replayer.pace(ask, response)
+                self._pending_response = response["text"]
+                return True
+
+            def get_merlin_response(self, on_text=None):
+                text, self._pending_response = self._pending_response, None
+                if on_text and text:
+                    on_text(text)
+                return text
+
+            def enter_password(self, password):
+                expected = replayer.accepted.get(self.current_level)
+                return expected is not None and password.upper() == expected.upper()
+
+            def _pause(self, seconds):
+                if replayer.realtime:
+                    time.sleep(seconds)
+
+            def handle_congrats_screen(self):
+                self.current_level += 1
+                return True
+
+        return ReplayAgent()
+
+    def pace(self, ask, response):
+        if self.realtime:
+            time.sleep(max(0.0, response["t"] - ask["t"]))
+
+    def run(self):
+        """Replay every recorded level through solve_level; returns per-level results"""
+        agent = self.make_agent()
+        results = []
+        for level in self.levels:
+            agent.current_level = level
+            start = time.perf_counter()
+            solved = agent.solve_level(level)
+            results.append({
+                "level": level,
+                "solved": solved,
+                "recorded_answer": self.accepted.get(level),
+                "seconds": time.perf_counter() - start,
+            })
+        agent.cleanup()
+        return results
+
+
+def rescore(events, workers=None):
+    """Re-run batch extraction over every recorded reply; yields per-reply results"""
+    from llm_extractor import extract_many
+
+    replayer = TranscriptReplayer(events)
+    for level in replayer.levels:
+        responses = [response.get("text") for _, response in replayer.exchanges.get(level, [])]
+        expected = replayer.accepted.get(level)
+        for result in extract_many(level, responses, workers=workers):
+            words = [c["word"] for c in result["candidates"]]
+            result.update(level=level, expected=expected, hit=expected is not None and expected.upper() in words)
+            yield result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded HackMerlin transcripts offline")
+    parser.add_argument("transcripts", nargs="+", help="JSONL transcript files")
+    parser.add_argument("--realtime", action="store_true", help="Sleep to reproduce recorded timings")
+    parser.add_argument("--verbose", action="store_true", help="Show agent logs")
+    parser.add_argument("--rescore", action="store_true", help="Only re-run rule-based extraction over recorded replies")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for --rescore")
+    args = parser.parse_args()
+
+    # Configure logging before working_agent is imported so its basicConfig is a no-op
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    if args.rescore:
+        total = hits = 0
+        for path in args.transcripts:
+            for result in rescore(load_events(path), workers=args.workers):
+                total += 1
+                hits += result["hit"]
+                status = "✅" if result["hit"] else "❌"
+                print(f"{status} {os.path.basename(path)} level {result['level']} reply {result['index']}: "
+                      f"{result['password']} (recorded answer: {result['expected']})")
+        print(f"\n🎞️ Rescored {total} replies, {hits} contain the recorded answer")
+        return
+
+    total = solved = 0
+    start = time.perf_counter()
+    for path in args.transcripts:
+        for result in TranscriptReplayer.from_file(path, realtime=args.realtime).run():
+            total += 1
+            solved += result["solved"]
+            status = "✅" if result["solved"] else "❌"
+            print(f"{status} {os.path.basename(path)} level {result['level']}: "
+                  f"{result['seconds'] * 1000:.1f} ms (recorded answer: {result['recorded_answer']})")
+    elapsed = time.perf_counter() - start
+    print(f"\n🎞️ Replayed {total} levels, {solved} solved, in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
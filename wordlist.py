@@ -0,0 +1,32 @@
+"""
+Word list shared by the offline word models
+
+Defaults to the bundled data/words.txt; WORDLIST_PATH points at any other
+newline-separated list (e.g. /usr/share/dict/words).
+"""
+
+import os
+import re
+
+BUNDLED_WORDLIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "words.txt")
+
+_NON_LETTERS = re.compile(r"[^A-Z]")
+
+
+def wordlist_path():
+    return os.getenv("WORDLIST_PATH") or BUNDLED_WORDLIST
+
+
+def load_words(path=None, min_len=3, max_len=12):
+    """Distinct upper-case A-Z words from a word list, in file order"""
+    words = []
+    seen = set()
+    with open(path or wordlist_path(), encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            word = _NON_LETTERS.sub("", line.strip().upper())
+            if min_len <= len(word) <= max_len and word not in seen:
+                seen.add(word)
+                words.append(word)
+    return words